@@ -0,0 +1,107 @@
+import numpy as np
+from scoreboard import HANDS, SCORE_TABLE, NUM_CATEGORIES, UPPER_BONUS, UPPER_BONUS_THRESHOLD
+
+# SCORE_ARRAY[hand_index, category_index] -> points, same values as SCORE_TABLE
+SCORE_ARRAY = np.array(SCORE_TABLE, dtype=np.int16)
+FACES = np.arange(1, 7, dtype=np.int8)
+
+# A hand is identified by its face counts; encode them base 6 and map the code to a hand index
+_COUNT_WEIGHTS = 6 ** np.arange(6)
+_CODE_TO_HAND = np.full(6 ** 6, -1, dtype=np.int16)
+for _i, _hand in enumerate(HANDS):
+    _CODE_TO_HAND[sum(_hand.count(face) * 6 ** (face - 1) for face in range(1, 7))] = _i
+
+def face_counts(dice):
+    """(N, 5) dice -> (N, 6) counts of each face."""
+    return (dice[:, :, None] == FACES).sum(axis=1)
+
+def hand_indices(dice):
+    """(N, 5) dice -> (N,) hand indices into SCORE_ARRAY."""
+    return _CODE_TO_HAND[face_counts(dice) @ _COUNT_WEIGHTS]
+
+class BatchSimulator:
+    """
+    Plays N games in lockstep. Game state lives in arrays:
+    dice (N, 5), scorecard (N, 13) with -1 for open categories, and upper_total (N,).
+
+    A batch policy replaces the scalar strategy function and has two methods:
+      keep(sim, roll_num) -> (N, 5) bool array of dice to keep before reroll roll_num
+      choose(sim)         -> (N,) category indices to score the final dice in
+    Rows that keep all five dice stop rerolling for the rest of the turn,
+    matching the `break` in the scalar strategies.
+    """
+    def __init__(self, num_games, seed=None):
+        self.num_games = num_games
+        self.rng = np.random.default_rng(seed)
+        self.reset()
+
+    def reset(self):
+        n = self.num_games
+        self.dice = np.zeros((n, 5), dtype=np.int8)
+        self.scorecard = np.full((n, NUM_CATEGORIES), -1, dtype=np.int16)
+        self.upper_total = np.zeros(n, dtype=np.int16)
+        self.rolling = np.ones(n, dtype=bool)
+        self.turn = 0
+
+    def open_categories(self):
+        """(N, 13) bool array of categories still to be filled."""
+        return self.scorecard < 0
+
+    def roll_all(self):
+        self.dice = self.rng.integers(1, 7, size=(self.num_games, 5), dtype=np.int8)
+        self.rolling[:] = True
+        return self.dice
+
+    def reroll(self, keep):
+        # Rows still rolling redraw every die they are not keeping
+        self.rolling &= ~keep.all(axis=1)
+        fresh = self.rng.integers(1, 7, size=(self.num_games, 5), dtype=np.int8)
+        self.dice = np.where(self.rolling[:, None] & ~keep, fresh, self.dice)
+        return self.dice
+
+    def score(self, categories):
+        rows = np.arange(self.num_games)
+        if (self.scorecard[rows, categories] >= 0).any():
+            raise ValueError("Batch policy chose a category that is already filled")
+        points = SCORE_ARRAY[hand_indices(self.dice), categories]
+        self.scorecard[rows, categories] = points
+        self.upper_total += np.where(categories < 6, points, 0).astype(np.int16)
+        self.turn += 1
+        return points
+
+    def total_scores(self):
+        filled = np.where(self.scorecard < 0, 0, self.scorecard).sum(axis=1, dtype=np.int32)
+        return filled + np.where(self.upper_total >= UPPER_BONUS_THRESHOLD, UPPER_BONUS, 0)
+
+    def play_turn(self, policy):
+        self.roll_all()
+        for roll_num in range(2):
+            if not self.rolling.any():
+                break
+            self.reroll(policy.keep(self, roll_num))
+        return self.score(policy.choose(self))
+
+    def simulate_games(self, policy):
+        self.reset()
+        for _ in range(NUM_CATEGORIES):
+            self.play_turn(policy)
+        return self.total_scores()
+
+def iter_monte_carlo_batched(policy, num_simulations=10000, seed=None, batch_size=100000):
+    """Yield int32 score arrays of up to batch_size games, one BatchSimulator per batch."""
+    rng = np.random.default_rng(seed)
+    done = 0
+    while done < num_simulations:
+        size = min(batch_size, num_simulations - done)
+        sim = BatchSimulator(size, seed=rng.integers(2 ** 63))
+        yield sim.simulate_games(policy).astype(np.int32)
+        done += size
+
+def run_monte_carlo_batched(policy, num_simulations=10000, seed=None, batch_size=100000):
+    """Batched counterpart of YahtzeeSimulator.run_monte_carlo; returns an int32 array of scores."""
+    scores = np.empty(num_simulations, dtype=np.int32)
+    done = 0
+    for chunk in iter_monte_carlo_batched(policy, num_simulations, seed, batch_size):
+        scores[done:done + len(chunk)] = chunk
+        done += len(chunk)
+    return scores
@@ -0,0 +1,88 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import time
+from dice_rolling import YahtzeeHand
+from instrumentation import Instrumentation
+from results_io import ensure_parent_dir
+from yahtzee_simulator import YahtzeeSimulator, RESULTS_DIR, ENGINE_VERSION, default_strategy_names, strategies
+
+# Repeatable speed baseline for every strategy:  python -m bench [--games N] [--seed S]
+# Games/sec comes from a plain run; the roll / decision / scoring split comes
+# from a second run of the same games with the simulator's instrumentation on.
+
+def bench_strategy(strategy_function, num_games, seed):
+    simulator = YahtzeeSimulator()
+
+    # Throughput: untimed games
+    simulator.hand = YahtzeeHand(seed)
+    random.seed(seed)
+    start = time.perf_counter()
+    simulator.run_monte_carlo(strategy_function, num_games)
+    elapsed = time.perf_counter() - start
+
+    # Phase split: same games with timers
+    instrumentation = Instrumentation()
+    simulator.instrumentation = instrumentation
+    simulator.hand = YahtzeeHand(seed)
+    random.seed(seed)
+    simulator.run_monte_carlo(strategy_function, num_games)
+    phases = instrumentation.timers
+    timed_elapsed = sum(phases.values())
+
+    turns = num_games * 13
+    return {
+        'games': num_games,
+        'seconds': elapsed,
+        'games_per_sec': num_games / elapsed,
+        'us_per_turn': elapsed / turns * 1e6,
+        'phase_us_per_turn': {name: seconds / turns * 1e6 for name, seconds in phases.items()},
+        'phase_share': {name: seconds / timed_elapsed for name, seconds in phases.items()},
+        'counters': instrumentation.summary(),
+    }
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def run_benchmarks(names, num_games, seed):
+    report = {
+        'commit': git_commit(),
+        'engine_version': ENGINE_VERSION,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'games': num_games,
+        'seed': seed,
+        'strategies': {},
+    }
+    for name in names:
+        result = bench_strategy(strategies[name], num_games, seed)
+        report['strategies'][name] = result
+        share = result['phase_share']
+        print(f"{name:>14}: {result['games_per_sec']:8.0f} games/s  {result['us_per_turn']:7.1f} us/turn  "
+              f"roll {share['roll']:.0%}  decision {share['decision']:.0%}  scoring {share['scoring']:.0%}")
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every strategy for a fixed seed and game count.")
+    parser.add_argument('--games', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--strategies', nargs='+', default=None, metavar='NAME',
+                        help="default: all, less Optimal until its value table is solved")
+    parser.add_argument('--output', default=os.path.join(RESULTS_DIR, 'bench.json'))
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.strategies or default_strategy_names(), args.games, args.seed)
+    ensure_parent_dir(args.output)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved benchmark to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import argparse
+import os
+import pickle
+import random
+from dice_rolling import YahtzeeHand
+from results_io import ScoreWriter, SCORES_EXTENSION
+from yahtzee_simulator import YahtzeeSimulator, RESULTS_DIR, ENGINE_VERSION, strategies
+
+# Resumable long runs:  python -m checkpoint --strategy Multiples --games 100000000 --seed 1
+#
+# Scores are streamed to results/<strategy>_scores.bin as usual. Every
+# checkpoint_every games the score file is flushed to disk, then the dice
+# generator state, the global random state (used by the strategies' fallback
+# choices) and the game count are written to <output>.ckpt through a temporary
+# file and os.replace. Running the same command again picks up from the last
+# checkpoint, dropping any scores written after it, so the finished file is
+# byte-for-byte the one an uninterrupted run writes.
+
+CHECKPOINT_EVERY = 100000
+CHECKPOINT_EXTENSION = '.ckpt'
+
+def _job_key(strategy_name, num_games, seed):
+    return {'strategy': strategy_name, 'num_games': num_games, 'seed': seed, 'engine_version': ENGINE_VERSION}
+
+def save_checkpoint(path, state):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def load_checkpoint(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+def run_checkpointed(strategy_name, strategy_func, num_games, seed, output=None,
+                     checkpoint_every=CHECKPOINT_EVERY, chunk_size=10000):
+    """
+    Play num_games seeded games of strategy_func into a binary score file,
+    checkpointing every checkpoint_every games and resuming from an existing
+    checkpoint for the same job. Returns the score file path.
+    """
+    if output is None:
+        output = os.path.join(RESULTS_DIR, f"{strategy_name}_scores{SCORES_EXTENSION}")
+    checkpoint_path = output + CHECKPOINT_EXTENSION
+    job = _job_key(strategy_name, num_games, seed)
+
+    simulator = YahtzeeSimulator()
+    simulator.hand = YahtzeeHand(seed)
+    random.seed(seed)
+
+    checkpoint = load_checkpoint(checkpoint_path)
+    if checkpoint is not None:
+        if checkpoint['job'] != job:
+            raise ValueError(f"{checkpoint_path} belongs to a different job: {checkpoint['job']}")
+        simulator.hand.source.setstate(checkpoint['dice'])
+        random.setstate(checkpoint['random'])
+        done = checkpoint['games_done']
+        writer = ScoreWriter(output, append=True)
+        writer.truncate(done)
+        print(f"Resuming {strategy_name} at game {done:,} of {num_games:,}")
+    else:
+        done = 0
+        writer = ScoreWriter(output, strategy=strategy_name, seed=seed, engine_version=ENGINE_VERSION)
+
+    with writer:
+        while done < num_games:
+            target = min(num_games, (done // checkpoint_every + 1) * checkpoint_every)
+            while done < target:
+                size = min(chunk_size, target - done)
+                writer.write(simulator.run_monte_carlo(strategy_func, size))
+                done += size
+            # Scores first, then the checkpoint that vouches for them
+            writer.sync()
+            save_checkpoint(checkpoint_path, {
+                'job': job,
+                'games_done': done,
+                'dice': simulator.hand.source.getstate(),
+                'random': random.getstate(),
+            })
+
+    os.remove(checkpoint_path)
+    return output
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run one strategy as a resumable, checkpointed job.")
+    parser.add_argument('--strategy', required=True, choices=list(strategies))
+    parser.add_argument('--games', type=int, required=True)
+    parser.add_argument('--seed', type=int, required=True)
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--checkpoint-every', type=int, default=CHECKPOINT_EVERY)
+    args = parser.parse_args(argv)
+
+    path = run_checkpointed(args.strategy, strategies[args.strategy], args.games, args.seed,
+                            args.output, args.checkpoint_every)
+    print(f"Saved raw scores to {path}")
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,54 @@
-import random
 import numpy as np
 from collections import Counter
 
+# Dice values drawn from the generator per refill
+DICE_BUFFER_SIZE = 4096
+
+class BufferedDice:
+    # Pre-draws blocks of die faces with NumPy and hands them out from a cursor,
+    # so a roll costs a list slice instead of one RNG call per die.
+    # The sequence is reproducible for a given seed and buffer size.
+    def __init__(self, seed=None, buffer_size=DICE_BUFFER_SIZE):
+        self.rng = np.random.default_rng(seed)
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self.cursor = 0
+
+    def draw(self, n):
+        end = self.cursor + n
+        if end > len(self.buffer):
+            # Keep the unused tail and append a fresh block
+            fresh = self.rng.integers(1, 7, size=self.buffer_size, dtype=np.uint8).tolist()
+            self.buffer = self.buffer[self.cursor:] + fresh
+            self.cursor, end = 0, n
+        values = self.buffer[self.cursor:end]
+        self.cursor = end
+        return values
+
+    def getstate(self):
+        return {'rng': self.rng.bit_generator.state, 'buffer': list(self.buffer), 'cursor': self.cursor}
+
+    def setstate(self, state):
+        self.rng.bit_generator.state = state['rng']
+        self.buffer = list(state['buffer'])
+        self.cursor = state['cursor']
+
 class YahtzeeHand:
     def __init__(self, seed=None):
         self.dice = [0, 0, 0, 0, 0]
-        self.random = random.Random(seed)  # Optional seeding for reproducibility
-        
+        self.source = BufferedDice(seed)  # Optional seeding for reproducibility
+
     def roll_all(self):
-        self.dice = [self.random.randint(1, 6) for _ in range(5)]
+        self.dice = self.source.draw(5)
         return self.dice
-    
+
     def reroll(self, positions):
         # Reroll specific dice positions (0-indexed)
-        for pos in positions:
-            if 0 <= pos < len(self.dice):
-                self.dice[pos] = self.random.randint(1, 6)
+        positions = [pos for pos in positions if 0 <= pos < len(self.dice)]
+        for pos, value in zip(positions, self.source.draw(len(positions))):
+            self.dice[pos] = value
         return self.dice
-        
+
     def get_counts(self):
         # Returns dictionary with counts of each value
-        return Counter(self.dice)
\ No newline at end of file
+        return Counter(self.dice)
@@ -0,0 +1,265 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scoreboard import NUM_CATEGORIES, NUM_HANDS, UPPER_BONUS, UPPER_BONUS_THRESHOLD
+from batch_engine import SCORE_ARRAY
+from keep_transitions import HAND_KEEPS, INITIAL_ROLL, KEEP_TRANSITIONS, NUM_KEEPS
+from optimal_solver import FULL_MASK, OptimalPolicy, best_categories, reachable_upper_totals, turn_values
+from strategies.decision_cache import CachedStrategy, is_sorted_hand_strategy
+from strategies.policy_table import NUM_KEEP_ACTIONS, probe_actions
+from strategies.optimal_strategy import get_optimal_policy, optimal_strategy, optimal_state_strategy
+
+# Exact probability mass function of the final score.
+#
+# Mass is pushed forward turn by turn over (filled mask, upper total capped at
+# 63), each state carrying a distribution over the points banked so far. Within
+# a turn, mass moves over the 252 sorted hands through the keep transitions.
+# That is exact for any player whose decisions depend only on the sorted hand,
+# the state and the roll number. Other players are sampled instead.
+#
+# Players are described by turn_actions(mask, uppers): an int array of shape
+# (3, len(uppers), 252) giving the action for every hand at each roll.
+#   action < NUM_KEEPS   hold keep index action and reroll the rest
+#   action >= NUM_KEEPS  score category action - NUM_KEEPS
+# Roll 2 (no rerolls left) must score.
+
+MAX_SCORE = int(SCORE_ARRAY.max(axis=0).sum()) + UPPER_BONUS
+SCORE_ACTION = NUM_KEEPS
+
+# _POINT_VALUES[c] = distinct points of category c; _POINT_ONEHOT[c][h, j] = 1 if hand h scores _POINT_VALUES[c][j]
+_POINT_VALUES = [np.unique(SCORE_ARRAY[:, c]) for c in range(NUM_CATEGORIES)]
+_POINT_ONEHOT = [(SCORE_ARRAY[:, c][:, None] == _POINT_VALUES[c][None, :]).astype(np.float64)
+                 for c in range(NUM_CATEGORIES)]
+
+class ScoreDistribution:
+    """PMF of the final score (pmf[s] = P(score == s)), exact or estimated from games."""
+    def __init__(self, pmf, exact=True, games=None):
+        self.pmf = np.asarray(pmf, dtype=np.float64)
+        self.exact = exact
+        self.games = games
+
+    @property
+    def scores(self):
+        return np.arange(len(self.pmf))
+
+    def mean(self):
+        return float(self.scores @ self.pmf)
+
+    def std(self):
+        mean = self.mean()
+        return float(np.sqrt(((self.scores - mean) ** 2) @ self.pmf))
+
+    def cdf(self):
+        return np.cumsum(self.pmf)
+
+    def quantile(self, q):
+        """
+        q-quantile under ScoreHistogram's rule (linear interpolation between
+        ranks) in the limit of many games: the smallest score s with
+        P(score <= s) >= q, moved 1 - q of the way to the next score when
+        P(score <= s) is exactly q (so an even split has the midpoint median).
+        """
+        cdf = self.cdf()
+        score = int(np.searchsorted(cdf, q - 1e-12))
+        higher = np.flatnonzero(self.pmf[score + 1:] > 0)
+        if abs(cdf[score] - q) > 1e-12 or not len(higher):
+            return float(score)
+        return score + (score + 1 + int(higher[0]) - score) * (1 - q)
+
+    def median(self):
+        return self.quantile(0.5)
+
+    def min_score(self):
+        return int(np.flatnonzero(self.pmf > 0)[0])
+
+    def max_score(self):
+        return int(np.flatnonzero(self.pmf > 0)[-1])
+
+    def summary(self):
+        # Same keys as yahtzee_simulator.summarize_scores
+        return {
+            'mean_score': round(self.mean(), 1),
+            'median_score': round(self.median(), 1),
+            'min_score': self.min_score(),
+            'max_score': self.max_score(),
+            'std_dev': round(self.std(), 1),
+        }
+
+class OptimalActions:
+    """
+    turn_actions for OptimalPolicy: its keep and category choices for every
+    hand at once, read off the policy's decision table when it has one.
+    Without a table, keeps whose values tie to rounding error may be resolved
+    differently from the one-state solve, which leaves the mean unchanged.
+    """
+    def __init__(self, policy=None):
+        self.policy = policy if policy is not None else OptimalPolicy()
+
+    def turn_actions(self, mask, uppers):
+        policy = self.policy
+        actions = np.empty((3, len(uppers), NUM_HANDS), dtype=np.int64)
+        hands = np.arange(NUM_HANDS)
+        if policy.decisions is not None:
+            decisions = np.asarray(policy.decisions[policy.rows[mask, uppers]], dtype=np.int64)
+            for roll_num in (0, 1):
+                actions[roll_num] = HAND_KEEPS[hands, decisions[:, roll_num]]
+            actions[2] = SCORE_ACTION + decisions[:, 2]
+            return actions
+        _, keep_values = turn_values(policy.values, mask, uppers)
+        for roll_num, rerolls_left in ((0, 2), (1, 1)):
+            best = keep_values[rerolls_left - 1][:, HAND_KEEPS].argmax(axis=2)
+            actions[roll_num] = HAND_KEEPS[hands, best]
+        actions[2] = SCORE_ACTION + best_categories(policy.values, mask, uppers)
+        return actions
+
+def _probe_actions(task):
+    # Worker entry point: action rows for a batch of masks
+    strategy_actions, masks = task
+    return [strategy_actions.probe_actions(mask) for mask in masks]
+
+class StrategyActions:
+    """
+    turn_actions for a (dice, scorecard, simulator) strategy function, read off
+    decision probes on each sorted hand. Exact only for strategies whose play
+    depends on the sorted hand alone (see sorted_hand_strategy); such strategies
+    never look at the upper total, so one probe serves every upper state.
+    Probing every mask takes a few minutes on one core; build(workers)
+    spreads it over a process pool up front.
+    """
+    def __init__(self, strategy_function):
+        self.cache = CachedStrategy(strategy_function, maxsize=0, canonical=True)
+        self.table = {}
+
+    def probe_actions(self, mask):
+        """(3, 252) actions for filled mask."""
+        # Probed as policy-table actions: hold masks over the sorted hand, or NUM_KEEP_ACTIONS + category
+        table = probe_actions(self.cache, mask).astype(np.int64)
+        scoring = table >= NUM_KEEP_ACTIONS
+        keeps = HAND_KEEPS[np.arange(NUM_HANDS), np.where(scoring, 0, table)]
+        return np.where(scoring, SCORE_ACTION + table - NUM_KEEP_ACTIONS, keeps)
+
+    def build(self, workers=None, batch_size=256):
+        """Probe every mask across a process pool."""
+        masks = [mask for mask in range(FULL_MASK) if mask not in self.table]
+        tasks = [(self, masks[i:i + batch_size]) for i in range(0, len(masks), batch_size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for (_, batch), rows in zip(tasks, pool.map(_probe_actions, tasks)):
+                self.table.update(zip(batch, rows))
+        return self
+
+    def __getstate__(self):
+        # Workers only need the strategy, not the table built so far
+        return {'cache': self.cache, 'table': {}}
+
+    def turn_actions(self, mask, uppers):
+        if mask not in self.table:
+            self.table[mask] = self.probe_actions(mask)
+        return np.broadcast_to(self.table[mask][:, None, :], (3, len(uppers), NUM_HANDS))
+
+def turn_outcomes(actions):
+    """(U, 13, 252) probability that the turn ends scoring category c with hand h, from (3, U, 252) actions."""
+    num_states = actions.shape[1]
+    rows = np.arange(num_states)[:, None]
+    hand_probs = np.broadcast_to(INITIAL_ROLL, (num_states, NUM_HANDS))
+    outcomes = np.zeros((num_states, NUM_CATEGORIES, NUM_HANDS))
+    hand_cols = np.broadcast_to(np.arange(NUM_HANDS), (num_states, NUM_HANDS))
+    for roll_num in range(3):
+        action = actions[roll_num]
+        scoring = action >= SCORE_ACTION
+        np.add.at(outcomes, (np.broadcast_to(rows, scoring.shape)[scoring], action[scoring] - SCORE_ACTION, hand_cols[scoring]),
+                  hand_probs[scoring])
+        if roll_num == 2:
+            break
+        # Group the rerolling mass by keep, then roll it forward
+        keep_mass = np.zeros((num_states, NUM_KEEPS))
+        holding = ~scoring
+        np.add.at(keep_mass, (np.broadcast_to(rows, holding.shape)[holding], action[holding]), hand_probs[holding])
+        hand_probs = keep_mass @ KEEP_TRANSITIONS
+    return outcomes
+
+def exact_score_distribution(player, progress=False):
+    """
+    Exact ScoreDistribution for a player exposing turn_actions(mask, uppers)
+    (OptimalActions, StrategyActions or a policy table).
+    """
+    reachable = reachable_upper_totals()
+    # Row of each reachable upper total in a mask's state array
+    upper_rows = [np.full(UPPER_BONUS_THRESHOLD + 1, -1) for _ in range(64)]
+    for upper_mask, totals in enumerate(reachable):
+        upper_rows[upper_mask][totals] = np.arange(len(totals))
+    length = MAX_SCORE + 1
+
+    layer = {0: np.zeros((1, length))}
+    layer[0][0, 0] = 1.0
+    for filled in range(NUM_CATEGORIES):
+        next_layer = {}
+        for n, (mask, pmf) in enumerate(layer.items()):
+            uppers = reachable[mask & 63]
+            outcomes = turn_outcomes(np.asarray(player.turn_actions(mask, uppers)))
+            for c in range(NUM_CATEGORIES):
+                if mask >> c & 1:
+                    continue
+                next_mask = mask | (1 << c)
+                point_probs = outcomes[:, c, :] @ _POINT_ONEHOT[c]
+                if not point_probs.any():
+                    # The player never scores c here; masks no mass reaches are left out
+                    continue
+                if next_mask not in next_layer:
+                    next_layer[next_mask] = np.zeros((len(reachable[next_mask & 63]), length))
+                target = next_layer[next_mask]
+                for j, points in enumerate(_POINT_VALUES[c].tolist()):
+                    weights = point_probs[:, j]
+                    if not weights.any():
+                        continue
+                    mass = pmf * weights[:, None]
+                    if c < 6:
+                        new_upper = np.minimum(UPPER_BONUS_THRESHOLD, uppers + points)
+                        crossed = (uppers < UPPER_BONUS_THRESHOLD) & (new_upper >= UPPER_BONUS_THRESHOLD)
+                        capped = new_upper == UPPER_BONUS_THRESHOLD
+                        rows = upper_rows[next_mask & 63][new_upper]
+                        capped_row = upper_rows[next_mask & 63][UPPER_BONUS_THRESHOLD]
+                        for group, shift in ((~crossed, points), (crossed, points + UPPER_BONUS)):
+                            # Uncapped totals land on distinct rows; capped ones all land on 63
+                            distinct = group & ~capped
+                            if distinct.any():
+                                target[rows[distinct], shift:] += mass[distinct, :length - shift]
+                            merged = group & capped
+                            if merged.any():
+                                target[capped_row, shift:] += mass[merged, :length - shift].sum(axis=0)
+                    else:
+                        rows = upper_rows[next_mask & 63][uppers]
+                        target[rows, points:] += mass[:, :length - points]
+        layer = next_layer
+        if progress:
+            print(f"Turn {filled + 1}: {len(layer)} masks")
+    return ScoreDistribution(layer[FULL_MASK].sum(axis=0))
+
+def sampled_score_distribution(strategy_function, num_games=100000, seed=None, workers=None):
+    """ScoreDistribution estimated from num_games parallel games (see run_monte_carlo_parallel)."""
+    # Imported here so the exact path does not pull in the simulator script
+    from yahtzee_simulator import run_monte_carlo_parallel
+    scores = run_monte_carlo_parallel(strategy_function, num_games, workers=workers, seed=seed)
+    pmf = np.bincount(scores, minlength=MAX_SCORE + 1) / len(scores)
+    return ScoreDistribution(pmf, exact=False, games=len(scores))
+
+def score_distribution(player, num_games=100000, seed=None, workers=None, progress=False):
+    """
+    Full score PMF for a player: exact for the optimal strategy, anything with
+    turn_actions and sorted-hand strategies, sampled for other strategies.
+    workers sizes the process pool for probing or sampling (1 runs in-process).
+    """
+    if player is optimal_strategy or player is optimal_state_strategy:
+        player = OptimalActions(get_optimal_policy())
+    elif isinstance(player, OptimalPolicy):
+        player = OptimalActions(player)
+    elif not hasattr(player, 'turn_actions') and is_sorted_hand_strategy(player):
+        player = StrategyActions(player)
+        if workers != 1:
+            player.build(workers)
+    if hasattr(player, 'turn_actions'):
+        return exact_score_distribution(player, progress)
+    return sampled_score_distribution(player, num_games, seed, workers)
+
+if __name__ == "__main__":
+    distribution = score_distribution(optimal_strategy, progress=True)
+    print("Optimal exact distribution:", distribution.summary())
+    print("Percentiles (5/25/75/95):", [distribution.quantile(q) for q in (0.05, 0.25, 0.75, 0.95)])
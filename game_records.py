@@ -0,0 +1,68 @@
+import numpy as np
+from scoreboard import CATEGORIES, CATEGORY_INDEX, NUM_CATEGORIES
+
+# Per-game scorecard capture. Every column is a preallocated array with one
+# row per game, so a million games take about 30 MB instead of a million dicts.
+#
+#   category_scores (N, 13) int8   points scored in each category (max 50)
+#   fill_turn       (N, 13) int8   turn (0-12) in which each category was filled
+#   upper_bonus     (N,)    bool   whether the 35-point upper bonus was earned
+#   total_score     (N,)    int16  final score including the bonus
+
+class GameRecords:
+    def __init__(self, num_games):
+        self.category_scores = np.zeros((num_games, NUM_CATEGORIES), dtype=np.int8)
+        self.fill_turn = np.full((num_games, NUM_CATEGORIES), -1, dtype=np.int8)
+        self.upper_bonus = np.zeros(num_games, dtype=bool)
+        self.total_score = np.zeros(num_games, dtype=np.int16)
+        self.num_games = 0
+
+    def record(self, scorecard, fill_order, upper_bonus, total_score):
+        """Store one finished game. fill_order lists categories in the order they were filled."""
+        row = self.num_games
+        for turn, category in enumerate(fill_order):
+            i = CATEGORY_INDEX[category]
+            self.category_scores[row, i] = scorecard[category]
+            self.fill_turn[row, i] = turn
+        self.upper_bonus[row] = upper_bonus
+        self.total_score[row] = total_score
+        self.num_games += 1
+
+    def _columns(self):
+        n = self.num_games
+        return {
+            'category_scores': self.category_scores[:n],
+            'fill_turn': self.fill_turn[:n],
+            'upper_bonus': self.upper_bonus[:n],
+            'total_score': self.total_score[:n],
+        }
+
+    def save(self, path):
+        # One array per column; np.load(path) gives them back by name
+        np.savez(path, categories=np.array(CATEGORIES), **self._columns())
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            records = cls(len(data['total_score']))
+            records.category_scores[:] = data['category_scores']
+            records.fill_turn[:] = data['fill_turn']
+            records.upper_bonus[:] = data['upper_bonus']
+            records.total_score[:] = data['total_score']
+        records.num_games = len(records.total_score)
+        return records
+
+    # --- Diagnostics ---
+    def zero_rate(self):
+        """Fraction of games in which each category was scored as 0."""
+        return dict(zip(CATEGORIES, (self._columns()['category_scores'] == 0).mean(axis=0)))
+
+    def mean_category_scores(self):
+        return dict(zip(CATEGORIES, self._columns()['category_scores'].mean(axis=0)))
+
+    def mean_fill_turn(self):
+        """Average turn (0-12) in which each category gets filled."""
+        return dict(zip(CATEGORIES, self._columns()['fill_turn'].mean(axis=0)))
+
+    def bonus_rate(self):
+        return float(self._columns()['upper_bonus'].mean())
@@ -0,0 +1,94 @@
+from array import array
+from collections.abc import Mapping
+from scoreboard import CATEGORIES, CATEGORY_INDEX, NUM_CATEGORIES, UPPER_BONUS, UPPER_BONUS_THRESHOLD
+
+FULL_MASK = (1 << NUM_CATEGORIES) - 1
+
+class GameState:
+    """
+    Compact scorecard: a 13-bit mask of filled categories (bit i = CATEGORIES[i]),
+    an array('h') of category scores and running upper/total subtotals that are
+    updated as categories are filled, so nothing is rescanned each turn.
+    """
+    __slots__ = ('filled', 'scores', 'upper_total', 'total')
+
+    def __init__(self):
+        self.filled = 0
+        self.scores = array('h', bytes(2 * NUM_CATEGORIES))
+        self.upper_total = 0
+        self.total = 0
+
+    def is_open(self, category_idx):
+        return not self.filled >> category_idx & 1
+
+    def open_categories(self):
+        return [c for c in range(NUM_CATEGORIES) if not self.filled >> c & 1]
+
+    def fill(self, category_idx, points):
+        if self.filled >> category_idx & 1:
+            raise ValueError(f"Category {CATEGORIES[category_idx]} is already filled")
+        self.filled |= 1 << category_idx
+        self.scores[category_idx] = points
+        self.total += points
+        if category_idx < 6:
+            self.upper_total += points
+
+    def is_complete(self):
+        return self.filled == FULL_MASK
+
+    def as_scorecard(self):
+        """{category: score or None} dict, the scorecard format of simulate_game."""
+        filled, scores = self.filled, self.scores
+        return {category: scores[c] if filled >> c & 1 else None for c, category in enumerate(CATEGORIES)}
+
+    def final_score(self):
+        return self.total + (UPPER_BONUS if self.upper_total >= UPPER_BONUS_THRESHOLD else 0)
+
+class ScorecardView(Mapping):
+    """Read-only {category: score or None} view of a GameState that always reflects its current contents."""
+    __slots__ = ('state',)
+
+    def __init__(self, state):
+        self.state = state
+
+    def __getitem__(self, category):
+        c = CATEGORY_INDEX[category]
+        return self.state.scores[c] if self.state.filled >> c & 1 else None
+
+    def __iter__(self):
+        return iter(CATEGORIES)
+
+    def __len__(self):
+        return NUM_CATEGORIES
+
+def state_strategy(func):
+    """
+    Mark a function as a game-state strategy:
+        func(dice, state, simulator) -> (category index, final dice)
+    """
+    func.uses_game_state = True
+    return func
+
+def is_state_strategy(func):
+    return getattr(func, 'uses_game_state', False)
+
+class DictStrategyAdapter:
+    """
+    Run a dict-based strategy (dice, scorecard, simulator) -> (category name, dice)
+    on a GameState. The strategy reads a ScorecardView, so no dict is built per turn.
+    """
+    uses_game_state = True
+
+    def __init__(self, strategy_function):
+        self.strategy_function = strategy_function
+        self.__name__ = getattr(strategy_function, '__name__', type(self).__name__)
+
+    def __call__(self, dice, state, simulator):
+        category, final_dice = self.strategy_function(dice, ScorecardView(state), simulator)
+        return CATEGORY_INDEX[category], final_dice
+
+def as_state_strategy(strategy_function):
+    """Game-state strategies are returned as is; dict-based ones are wrapped in the adapter."""
+    if is_state_strategy(strategy_function):
+        return strategy_function
+    return DictStrategyAdapter(strategy_function)
@@ -0,0 +1,220 @@
+import numpy as np
+from scoreboard import CATEGORY_INDEX, NUM_CATEGORIES, UPPER_BONUS, UPPER_BONUS_THRESHOLD
+from batch_engine import BatchSimulator, SCORE_ARRAY, hand_indices
+from strategies.batch_strategies import best_open_category
+from instrumentation import GameObserver
+
+# Compact binary game traces. Every turn of every game packs into one uint64,
+# so a million games take 104 MB and load memory-mapped:
+#
+#   bits  0-14   initial roll, 3 bits per die (die i at bit 3i)
+#   bits 15-19   first reroll: mask of the positions rerolled
+#   bits 20-34   first reroll: new values of those positions (0 elsewhere)
+#   bits 35-39   second reroll: mask
+#   bits 40-54   second reroll: new values
+#   bits 55-58   category index scored
+#   bits 59-60   number of rerolls taken (0-2)
+#
+# The trace holds every die the strategy saw, so replay() can re-score the
+# recorded games under another category-selection rule without rerunning the
+# dice or the keep logic.
+
+DIE_BITS = 3
+ROLL_BITS = 5 * DIE_BITS
+MAX_REROLLS = 2
+REROLL_SHIFTS = [(ROLL_BITS + k * (5 + ROLL_BITS), ROLL_BITS + k * (5 + ROLL_BITS) + 5) for k in range(MAX_REROLLS)]
+CATEGORY_SHIFT = ROLL_BITS + MAX_REROLLS * (5 + ROLL_BITS)
+NUM_REROLLS_SHIFT = CATEGORY_SHIFT + 4
+TRACE_DTYPE = np.dtype('<u8')
+
+def _pack_dice(dice, positions=range(5)):
+    return sum(dice[i] << (DIE_BITS * i) for i in positions)
+
+class GameTrace:
+    """
+    (num_games, 13) uint64 turn words, filled in through a TraceObserver while
+    the simulator plays (see YahtzeeSimulator.run_monte_carlo_trace).
+    """
+    def __init__(self, num_games):
+        self.turns = np.zeros((num_games, NUM_CATEGORIES), dtype=TRACE_DTYPE)
+        self.num_games = 0
+        self._turn = 0
+        self._word = 0
+        self._rerolls = 0
+
+    def record_roll(self, dice):
+        self._word = _pack_dice(dice)
+        self._rerolls = 0
+
+    def record_reroll(self, positions, dice):
+        if self._rerolls == MAX_REROLLS:
+            raise ValueError(f"A trace holds at most {MAX_REROLLS} rerolls per turn")
+        mask_shift, values_shift = REROLL_SHIFTS[self._rerolls]
+        self._word |= sum(1 << i for i in positions) << mask_shift
+        self._word |= _pack_dice(dice, positions) << values_shift
+        self._rerolls += 1
+
+    def record_turn(self, category_idx):
+        word = self._word | category_idx << CATEGORY_SHIFT | self._rerolls << NUM_REROLLS_SHIFT
+        self.turns[self.num_games, self._turn] = word
+        self._turn += 1
+        if self._turn == NUM_CATEGORIES:
+            self.num_games += 1
+            self._turn = 0
+
+    def save(self, path):
+        # Plain .npy so load() can memory-map millions of games
+        np.save(path, self.turns[:self.num_games])
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        trace = cls(0)
+        trace.turns = np.load(path, mmap_mode='r' if mmap else None)
+        trace.num_games = len(trace.turns)
+        return trace
+
+class TracingHand:
+    """Stands in for simulator.hand while a game is traced, recording every roll into a GameTrace."""
+    def __init__(self, hand, trace):
+        self.hand = hand
+        self.trace = trace
+
+    @property
+    def dice(self):
+        return self.hand.dice
+
+    @dice.setter
+    def dice(self, value):
+        self.hand.dice = value
+
+    def roll_all(self):
+        dice = self.hand.roll_all()
+        self.trace.record_roll(dice)
+        return dice
+
+    def reroll(self, positions):
+        # The hand gets the positions as given, so faces land exactly where they would untraced
+        dice = self.hand.reroll(positions)
+        rerolled = sorted({pos for pos in positions if 0 <= pos < 5})
+        # Rerolling nothing draws no dice, so it leaves nothing to record
+        if rerolled:
+            self.trace.record_reroll(rerolled, dice)
+        return dice
+
+    def get_counts(self):
+        return self.hand.get_counts()
+
+class TraceObserver(GameObserver):
+    """GameObserver recording the games it watches into a GameTrace."""
+    def __init__(self, trace):
+        self.trace = trace
+
+    def wrap_hand(self, hand):
+        return TracingHand(hand, self.trace)
+
+    def record_turn(self, category, score, decision_seconds, scoring_seconds):
+        self.trace.record_turn(CATEGORY_INDEX[category])
+
+# --- Vectorized decoding ---
+
+def _unpack_dice(words, shift):
+    """(...) uint64 words -> (..., 5) int8 dice packed from bit shift."""
+    dice_shifts = np.arange(5, dtype=np.uint64) * np.uint64(DIE_BITS) + np.uint64(shift)
+    return ((words[..., None] >> dice_shifts) & np.uint64(7)).astype(np.int8)
+
+def initial_dice(turns):
+    """(N, 13, 5) first roll of every turn."""
+    return _unpack_dice(np.asarray(turns), 0)
+
+def final_dice(turns):
+    """(N, 13, 5) dice each turn was scored with: the first roll with every reroll applied."""
+    turns = np.asarray(turns)
+    dice = _unpack_dice(turns, 0)
+    for mask_shift, values_shift in REROLL_SHIFTS:
+        mask = ((turns[..., None] >> (np.arange(5, dtype=np.uint64) + np.uint64(mask_shift))) & np.uint64(1)).astype(bool)
+        dice = np.where(mask, _unpack_dice(turns, values_shift), dice)
+    return dice
+
+def recorded_categories(turns):
+    """(N, 13) category index chosen in each turn."""
+    return ((np.asarray(turns) >> np.uint64(CATEGORY_SHIFT)) & np.uint64(15)).astype(np.intp)
+
+def num_rerolls(turns):
+    """(N, 13) rerolls taken in each turn."""
+    return ((np.asarray(turns) >> np.uint64(NUM_REROLLS_SHIFT)) & np.uint64(3)).astype(np.int8)
+
+# --- Replay ---
+
+class OptimalCategoryRule:
+    """
+    Category choice of the optimal strategy, vectorized: points now plus the
+    value of the next state from the optimal_solver table, first category on ties.
+    """
+    def __init__(self, values=None):
+        from optimal_solver import load_table
+        self.values = load_table() if values is None else values
+
+    def __call__(self, sim):
+        rows = np.arange(sim.num_games)
+        filled = (~sim.open_categories()) @ (1 << np.arange(NUM_CATEGORIES))
+        upper = np.minimum(sim.upper_total, UPPER_BONUS_THRESHOLD).astype(np.intp)
+        points = SCORE_ARRAY[hand_indices(sim.dice)].astype(np.float64)
+        best_value = np.full(sim.num_games, -np.inf)
+        best = np.zeros(sim.num_games, dtype=np.intp)
+        for c in range(NUM_CATEGORIES):
+            new_upper = upper
+            bonus = 0
+            if c < 6:
+                new_upper = np.minimum(UPPER_BONUS_THRESHOLD, upper + points[:, c].astype(np.intp))
+                bonus = np.where((upper < UPPER_BONUS_THRESHOLD) & (new_upper >= UPPER_BONUS_THRESHOLD), UPPER_BONUS, 0)
+            value = points[:, c] + bonus + self.values[filled | (1 << c), new_upper]
+            better = sim.open_categories()[rows, c] & (value > best_value)
+            best = np.where(better, c, best)
+            best_value = np.where(better, value, best_value)
+        return best
+
+# Category-selection rules by name; None keeps the recorded choice
+REPLAY_RULES = {
+    'recorded': None,
+    'best_open': best_open_category,
+    'optimal': OptimalCategoryRule,
+}
+
+def replay(trace, choose=None, chunk_size=100000):
+    """
+    Re-score recorded games. choose(sim) gets a BatchSimulator whose dice are
+    each turn's final dice and returns (N,) category indices, so any batch
+    policy's choose method works; None reproduces the recorded choices.
+    trace is a GameTrace or its (N, 13) turn array. Returns int32 final
+    scores, working through chunk_size games at a time.
+    """
+    turns = trace.turns[:trace.num_games] if hasattr(trace, 'turns') else trace
+    scores = np.empty(len(turns), dtype=np.int32)
+    for start in range(0, len(turns), chunk_size):
+        chunk = np.asarray(turns[start:start + chunk_size])
+        dice = final_dice(chunk)
+        recorded = recorded_categories(chunk)
+        sim = BatchSimulator(len(chunk))
+        for turn in range(NUM_CATEGORIES):
+            sim.dice = dice[:, turn]
+            sim.score(recorded[:, turn] if choose is None else choose(sim))
+        scores[start:start + len(chunk)] = sim.total_scores()
+    return scores
+
+if __name__ == "__main__":
+    import time
+    from yahtzee_simulator import YahtzeeSimulator, strategies
+    from dice_rolling import YahtzeeHand
+
+    simulator = YahtzeeSimulator()
+    simulator.hand = YahtzeeHand(0)
+    start = time.perf_counter()
+    trace = simulator.run_monte_carlo_trace(strategies['Tunnel Vision'], 20000)
+    print(f"Recorded {trace.num_games} Tunnel Vision games in {time.perf_counter() - start:.1f}s "
+          f"({trace.turns.nbytes // trace.num_games} bytes per game)")
+    for name, rule in REPLAY_RULES.items():
+        if isinstance(rule, type):
+            rule = rule()
+        start = time.perf_counter()
+        scores = replay(trace, rule)
+        print(f"  {name:>9}: mean {scores.mean():.2f} ({time.perf_counter() - start:.2f}s)")
@@ -0,0 +1,204 @@
+import argparse
+import csv
+import math
+import os
+import random
+import numpy as np
+from dice_rolling import YahtzeeHand
+from results_io import ensure_parent_dir, load_scores, SCORES_EXTENSION
+from streaming_stats import ScoreHistogram
+from yahtzee_simulator import YahtzeeSimulator, RESULTS_DIR
+
+# Head-to-head comparison with common random numbers: every strategy plays
+# game g on the same pre-generated dice, so score differences reflect the
+# strategies rather than the luck of the roll.
+
+class ScriptedHand(YahtzeeHand):
+    """
+    Hand that deals pre-generated dice. rolls[turn][roll_num] holds five values;
+    roll_all deals rolls[turn][0] and the k-th reroll of a turn replaces each
+    rerolled position i with rolls[turn][k][i]. Strategies that reroll the
+    same positions therefore see the same dice.
+    """
+    def __init__(self, rolls):
+        super().__init__()
+        self.rolls = rolls
+        self.turn = -1
+        self.roll_num = 0
+
+    def roll_all(self):
+        self.turn += 1
+        self.roll_num = 0
+        self.dice = list(self.rolls[self.turn][0])
+        return self.dice
+
+    def reroll(self, positions):
+        self.roll_num += 1
+        fresh = self.rolls[self.turn][self.roll_num]
+        for pos in positions:
+            if 0 <= pos < len(self.dice):
+                self.dice[pos] = fresh[pos]
+        return self.dice
+
+def generate_game_rolls(rng, num_games):
+    """(num_games, 13, 3, 5) dice: every roll phase of every turn, drawn up front."""
+    return rng.integers(1, 7, size=(num_games, 13, 3, 5), dtype=np.int8)
+
+def play_common_games(strategies, num_games=1000, seed=None):
+    """
+    Play the same num_games dice streams with every strategy.
+    Returns (names, scores) with scores of shape (num_strategies, num_games).
+    """
+    names = list(strategies)
+    rng = np.random.default_rng(seed)
+    rolls = generate_game_rolls(rng, num_games)
+    fallback_seeds = rng.integers(2 ** 63, size=num_games)
+    simulator = YahtzeeSimulator()
+    scores = np.zeros((len(names), num_games), dtype=np.int32)
+    for g in range(num_games):
+        game_rolls = rolls[g].tolist()
+        for i, name in enumerate(names):
+            simulator.hand = ScriptedHand(game_rolls)
+            # The rare random.choice fallback in the strategies gets common numbers too
+            random.seed(int(fallback_seeds[g]))
+            scores[i, g], _ = simulator.simulate_game(strategies[name])
+    return names, scores
+
+def paired_comparison(scores):
+    """
+    Pairwise statistics from paired scores of shape (K, N). Entry [i, j] of each matrix:
+      win_rate   P(strategy i beats strategy j)
+      tie_rate   P(tie)
+      win_se     standard error of win_rate
+      mean_diff  mean of (score_i - score_j) over the paired games
+      diff_se    standard error of mean_diff
+    """
+    scores = np.asarray(scores)
+    k, n = scores.shape
+    diffs = scores[:, None, :].astype(np.int64) - scores[None, :, :]
+    win_rate = (diffs > 0).mean(axis=2)
+    return {
+        'win_rate': win_rate,
+        'tie_rate': (diffs == 0).mean(axis=2),
+        'win_se': np.sqrt(win_rate * (1 - win_rate) / n),
+        'mean_diff': diffs.mean(axis=2),
+        'diff_se': diffs.std(axis=2, ddof=1) / math.sqrt(n),
+    }
+
+def common_random_head_to_head(strategies, num_games=1000, seed=None):
+    names, scores = play_common_games(strategies, num_games, seed)
+    result = paired_comparison(scores)
+    result['names'] = names
+    result['scores'] = scores
+    return result
+
+def save_win_matrix(matrix, names, path=os.path.join(RESULTS_DIR, 'head_to_head_winrates.csv')):
+    # Same layout as the notebook's DataFrame.to_csv: blank corner, names across and down
+    ensure_parent_dir(path)
+    with open(path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow([''] + list(names))
+        for name, row in zip(names, matrix):
+            writer.writerow([name] + [round(float(value), 3) for value in row])
+    return path
+
+# Exact head-to-head from independent runs: with each strategy's score
+# distribution as a count vector, P(A beats B) = sum_s P(A = s) * P(B < s),
+# so the whole K x K matrix costs O(K^2 * scores) with no resampling.
+
+def _pmf_matrix(histograms):
+    """(K, max_score + 1) probabilities, one row per histogram or count vector."""
+    rows = [np.asarray(getattr(h, 'counts', h), dtype=np.float64) for h in histograms]
+    if not rows:
+        raise ValueError("No score distributions to compare")
+    width = max(len(row) for row in rows)
+    pmfs = np.zeros((len(rows), width))
+    for i, row in enumerate(rows):
+        if row.sum() == 0:
+            raise ValueError("Cannot compare an empty score distribution")
+        pmfs[i, :len(row)] = row / row.sum()
+    return pmfs
+
+def win_probabilities(hist_a, hist_b):
+    """Exact (P(A > B), P(A = B)) for independent draws from two score histograms."""
+    pmf_a, pmf_b = _pmf_matrix([hist_a, hist_b])
+    below_b = np.cumsum(pmf_b) - pmf_b  # P(B < s)
+    return float(pmf_a @ below_b), float(pmf_a @ pmf_b)
+
+def histogram_win_matrix(histograms):
+    """
+    Pairwise statistics from {name: ScoreHistogram or count vector}. Entry [i, j]:
+      win_rate   P(strategy i beats strategy j)
+      tie_rate   P(tie)
+    Exact for the given distributions, including the diagonal (a strategy
+    against an independent copy of itself).
+    """
+    names = list(histograms)
+    pmfs = _pmf_matrix([histograms[name] for name in names])
+    below = np.cumsum(pmfs, axis=1) - pmfs
+    return {
+        'names': names,
+        'win_rate': pmfs @ below.T,
+        'tie_rate': pmfs @ pmfs.T,
+    }
+
+def load_score_histogram(path, chunk_size=1000000):
+    """ScoreHistogram of a <strategy>_scores.bin or _scores.csv file, read in chunks."""
+    histogram = ScoreHistogram()
+    if path.endswith('.csv'):
+        with open(path, newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            next(reader)  # header
+            chunk = []
+            for row in reader:
+                chunk.append(int(row[0]))
+                if len(chunk) == chunk_size:
+                    histogram.update(chunk)
+                    chunk = []
+            histogram.update(chunk)
+    else:
+        _, scores = load_scores(path)
+        for start in range(0, len(scores), chunk_size):
+            histogram.update(scores[start:start + chunk_size])
+    return histogram
+
+def load_result_histograms(results_dir=RESULTS_DIR):
+    """{strategy: ScoreHistogram} for every score file in results_dir; binary files win over CSVs."""
+    paths = {}
+    if not os.path.isdir(results_dir):
+        return {}
+    for suffix in ('_scores.csv', f'_scores{SCORES_EXTENSION}'):
+        for filename in os.listdir(results_dir):
+            if filename.endswith(suffix):
+                paths[filename[:-len(suffix)]] = os.path.join(results_dir, filename)
+    return {name: load_score_histogram(paths[name]) for name in sorted(paths)}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Head-to-head win matrix between strategies.")
+    parser.add_argument('--from-results', action='store_true',
+                        help="exact matrix from the score files in results/ instead of simulating")
+    parser.add_argument('--games', type=int, default=2000, help="common-random-number games to simulate")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.from_results:
+        histograms = load_result_histograms()
+        if not histograms:
+            parser.error(f"no score files in {RESULTS_DIR}/; run yahtzee_simulator.py first")
+        result = histogram_win_matrix(histograms)
+    else:
+        from yahtzee_simulator import default_strategy_names, strategies
+        players = {name: strategies[name] for name in default_strategy_names()}
+        result = common_random_head_to_head(players, num_games=args.games, seed=args.seed)
+    names = result['names']
+    for i, a in enumerate(names):
+        for j, b in enumerate(names):
+            if i < j:
+                line = f"{a} vs {b}: win {result['win_rate'][i, j]:.3f} tie {result['tie_rate'][i, j]:.3f}"
+                if 'mean_diff' in result:
+                    line += f" diff {result['mean_diff'][i, j]:+.2f} +/- {result['diff_se'][i, j]:.2f}"
+                print(line)
+    print(f"Saved win matrix to {save_win_matrix(result['win_rate'], names)}")
+
+if __name__ == "__main__":
+    main()
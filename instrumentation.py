@@ -0,0 +1,121 @@
+import time
+from collections import Counter
+
+# Opt-in hot-path instrumentation for YahtzeeSimulator.simulate_game.
+#
+#   simulator.instrumentation = Instrumentation()
+#   simulator.run_monte_carlo(strategy, 1000)
+#   print(simulator.instrumentation.summary())
+#
+# With simulator.instrumentation left as None the simulator takes its normal
+# path and pays nothing. Subclass Instrumentation and override the record_*
+# hooks to plug in other counters or timers.
+
+class GameObserver:
+    """
+    Watches the games of YahtzeeSimulator.simulate_game. The simulator plays
+    with wrap_hand(hand) standing in for its hand, reads clock() around each
+    strategy call and reports every turn and game to the record_* hooks.
+    This base class watches nothing; Instrumentation and game_trace's
+    TraceObserver build on it.
+    """
+    def clock(self):
+        return 0.0
+
+    def wrap_hand(self, hand):
+        return hand
+
+    def record_turn(self, category, score, decision_seconds, scoring_seconds):
+        pass
+
+    def record_game(self, total_score):
+        pass
+
+class Instrumentation(GameObserver):
+    def __init__(self, timing=True):
+        self.clock = time.perf_counter if timing else (lambda: 0.0)
+        self.timers = {'roll': 0.0, 'decision': 0.0, 'scoring': 0.0}
+        self.games = 0
+        self.turns = 0
+        self.rerolls_per_turn = Counter()    # rerolls in a turn -> number of turns
+        self.dice_kept = Counter()           # dice held on a reroll -> number of rerolls
+        self.category_counts = Counter()     # category -> times chosen
+        self.category_zeros = Counter()      # category -> times scored as 0
+        self.category_rerolls = Counter()    # category -> rerolls spent in turns ending there
+        self._turn_rerolls = 0
+        self._turn_reroll_seconds = 0.0
+
+    # --- Hooks called by the simulator ---
+    def wrap_hand(self, hand):
+        return InstrumentedHand(hand, self)
+
+    def record_roll(self, seconds):
+        self.timers['roll'] += seconds
+        self._turn_rerolls = 0
+        self._turn_reroll_seconds = 0.0
+
+    def record_reroll(self, num_rerolled, seconds):
+        self.timers['roll'] += seconds
+        self.dice_kept[5 - num_rerolled] += 1
+        self._turn_rerolls += 1
+        self._turn_reroll_seconds += seconds
+
+    def record_turn(self, category, score, decision_seconds, scoring_seconds):
+        # decision_seconds covers the whole strategy call; rerolls made inside it count as rolling
+        self.timers['decision'] += decision_seconds - self._turn_reroll_seconds
+        self.timers['scoring'] += scoring_seconds
+        self.turns += 1
+        self.rerolls_per_turn[self._turn_rerolls] += 1
+        self.category_counts[category] += 1
+        self.category_rerolls[category] += self._turn_rerolls
+        if score == 0:
+            self.category_zeros[category] += 1
+
+    def record_game(self, total_score):
+        self.games += 1
+
+    # --- Reporting ---
+    def summary(self):
+        turns = max(self.turns, 1)
+        rerolls = sum(self.dice_kept.values())
+        return {
+            'games': self.games,
+            'turns': self.turns,
+            'us_per_turn': {name: seconds / turns * 1e6 for name, seconds in self.timers.items()},
+            'rerolls_per_turn': sum(n * count for n, count in self.rerolls_per_turn.items()) / turns,
+            'dice_kept_per_reroll': sum(k * count for k, count in self.dice_kept.items()) / max(rerolls, 1),
+            'category_frequency': {cat: count / turns for cat, count in self.category_counts.items()},
+            'category_zero_rate': {cat: self.category_zeros[cat] / count for cat, count in self.category_counts.items()},
+            'rerolls_per_category_turn': {cat: self.category_rerolls[cat] / count for cat, count in self.category_counts.items()},
+        }
+
+class InstrumentedHand:
+    """Stands in for simulator.hand during an instrumented game, timing and counting every roll."""
+    def __init__(self, hand, instrumentation):
+        self.hand = hand
+        self.instrumentation = instrumentation
+
+    @property
+    def dice(self):
+        return self.hand.dice
+
+    @dice.setter
+    def dice(self, value):
+        self.hand.dice = value
+
+    def roll_all(self):
+        clock = self.instrumentation.clock
+        start = clock()
+        dice = self.hand.roll_all()
+        self.instrumentation.record_roll(clock() - start)
+        return dice
+
+    def reroll(self, positions):
+        clock = self.instrumentation.clock
+        start = clock()
+        dice = self.hand.reroll(positions)
+        self.instrumentation.record_reroll(len(positions), clock() - start)
+        return dice
+
+    def get_counts(self):
+        return self.hand.get_counts()
@@ -0,0 +1,112 @@
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from math import factorial
+import numpy as np
+from scoreboard import HANDS, HAND_INDEX, NUM_HANDS, SCORE_TABLE, CATEGORY_INDEX
+
+# Exact keep/reroll transition model shared by the solver and the strategies.
+#
+# A keep is the multiset of dice held before a reroll. Each of the 252 hands
+# has 32 position masks, which collapse to at most 32 distinct keeps; over all
+# hands there are 462 keeps (every multiset of 0-5 dice).
+
+KEEPS = [keep for size in range(6) for keep in combinations_with_replacement(range(1, 7), size)]
+KEEP_INDEX = {keep: i for i, keep in enumerate(KEEPS)}
+NUM_KEEPS = len(KEEPS)
+KEEP_ALL = 31
+KEEP_CACHE_SIZE = 8192
+
+def _roll_distribution(num_dice):
+    # Sorted outcomes of rolling num_dice dice with their multinomial probabilities
+    outcomes = []
+    for roll in combinations_with_replacement(range(1, 7), num_dice):
+        ways = factorial(num_dice)
+        for face in set(roll):
+            ways //= factorial(roll.count(face))
+        outcomes.append((roll, ways / 6 ** num_dice))
+    return outcomes
+
+def _build_transitions():
+    rolls = {n: _roll_distribution(n) for n in range(6)}
+    transition = np.zeros((NUM_KEEPS, NUM_HANDS))
+    for k, keep in enumerate(KEEPS):
+        for roll, prob in rolls[5 - len(keep)]:
+            transition[k, HAND_INDEX[tuple(sorted(keep + roll))]] += prob
+    hand_keeps = np.array([
+        [KEEP_INDEX[tuple(hand[i] for i in range(5) if m >> i & 1)] for m in range(32)]
+        for hand in HANDS
+    ])
+    return transition, hand_keeps
+
+# KEEP_TRANSITIONS[k, h] = P(hand h after rerolling every die not in keep k)
+# HAND_KEEPS[h, m]       = keep index of the dice of sorted hand h selected by position bitmask m
+KEEP_TRANSITIONS, HAND_KEEPS = _build_transitions()
+INITIAL_ROLL = KEEP_TRANSITIONS[KEEP_INDEX[()]]
+_TRANSITIONS_T = np.ascontiguousarray(KEEP_TRANSITIONS.T)
+_HAND_KEEPS_FLAT = HAND_KEEPS.ravel()
+
+# Sparse form: KEEP_OUTCOMES[k] = (hand indices, probabilities) with non-zero mass
+KEEP_OUTCOMES = [(np.flatnonzero(row), row[row > 0]) for row in KEEP_TRANSITIONS]
+
+def _unique_keeps(row):
+    # First position mask for every distinct keep of one hand
+    seen = {}
+    for mask, k in enumerate(row.tolist()):
+        seen.setdefault(k, mask)
+    return [(mask, k) for k, mask in seen.items()]
+
+# UNIQUE_HAND_KEEPS[h] = [(mask, keep index), ...], one representative position mask per distinct keep
+UNIQUE_HAND_KEEPS = [_unique_keeps(row) for row in HAND_KEEPS]
+
+def keep_index(hand_idx, mask):
+    """Keep index for the dice of sorted hand hand_idx selected by position mask."""
+    return HAND_KEEPS[hand_idx, mask]
+
+def transition_distribution(hand_idx, mask):
+    """(hand indices, probabilities) after holding mask of sorted hand hand_idx and rerolling the rest."""
+    return KEEP_OUTCOMES[HAND_KEEPS[hand_idx, mask]]
+
+def best_keep_values(keep_values):
+    """(U, 462) keep values -> (U, 252) value of each hand under its best keep."""
+    return keep_values[:, _HAND_KEEPS_FLAT].reshape(len(keep_values), NUM_HANDS, 32).max(axis=2)
+
+def keep_values_for(hand_values, rerolls=1):
+    """
+    Expected value of holding each keep, given the value of every final hand.
+    hand_values is (U, 252); returns a list with one (U, 462) array per reroll,
+    entry r holding keep values when r more rerolls follow (played optimally).
+    """
+    keep_values = []
+    for _ in range(rerolls):
+        expected = hand_values @ _TRANSITIONS_T
+        keep_values.append(expected)
+        hand_values = best_keep_values(expected)
+    return keep_values
+
+@lru_cache(maxsize=16)
+def _category_keep_values(category_idx):
+    points = np.array([[row[category_idx] for row in SCORE_TABLE]], dtype=np.float64)
+    return [values[0] for values in keep_values_for(points, rerolls=2)]
+
+@lru_cache(maxsize=KEEP_CACHE_SIZE)
+def best_keep(hand_idx, category_idx, rerolls_left):
+    """
+    Best keep when aiming for one category with rerolls_left (1 or 2) rerolls to go.
+    Returns (position mask over the sorted hand, expected score in that category).
+    """
+    values = _category_keep_values(category_idx)[rerolls_left - 1]
+    best_mask, best_value = KEEP_ALL, -1.0
+    for mask, k in UNIQUE_HAND_KEEPS[hand_idx]:
+        if values[k] > best_value:
+            best_mask, best_value = mask, values[k]
+    return best_mask, float(best_value)
+
+def best_keep_for_target(dice, category, rerolls_left):
+    """
+    Positions in dice to keep when aiming for category, and the expected score.
+    Returns (list of positions to keep, expected score).
+    """
+    order = sorted(range(len(dice)), key=lambda i: dice[i])
+    hand = HAND_INDEX[tuple(dice[i] for i in order)]
+    mask, expected = best_keep(hand, CATEGORY_INDEX[category], rerolls_left)
+    return sorted(order[i] for i in range(5) if mask >> i & 1), expected
@@ -0,0 +1,229 @@
+import os
+from functools import lru_cache
+import numpy as np
+from scoreboard import HAND_INDEX, NUM_CATEGORIES, NUM_HANDS, UPPER_BONUS, UPPER_BONUS_THRESHOLD
+from batch_engine import SCORE_ARRAY
+from keep_transitions import HAND_KEEPS, INITIAL_ROLL, best_keep_values, keep_values_for
+
+# Retrograde dynamic-programming solver for solitaire Yahtzee under this
+# repo's rules (13 categories, 35-point upper bonus at 63, no Yahtzee bonus
+# or joker rule, so no Yahtzee-bonus flag is needed in the state).
+#
+# State at the start of a turn: (filled category mask, upper total capped at 63).
+# VALUES[mask, upper] is the expected score still to come from that state,
+# upper bonus included. VALUES[0, 0] is the exact expected score of optimal play.
+
+NUM_MASKS = 1 << NUM_CATEGORIES
+FULL_MASK = NUM_MASKS - 1
+UPPER_STATES = UPPER_BONUS_THRESHOLD + 1
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results', 'optimal_values.npy')
+DEFAULT_DECISIONS_PATH = os.path.join(os.path.dirname(DEFAULT_TABLE_PATH), 'optimal_decisions.npy')
+# States whose decisions OptimalPolicy remembers without a decision table (about 1 KB each)
+OPTIMAL_MEMO_SIZE = 1 << 16
+
+_UPPER_POINTS = SCORE_ARRAY[:, :6].T.astype(np.int64)
+_LOWER_POINTS = SCORE_ARRAY[:, 6:].T.astype(np.float64)
+
+def _upper_scores():
+    # Possible points in each upper category: face * (0..5)
+    return [sorted({face * count for count in range(6)}) for face in range(1, 7)]
+
+def reachable_upper_totals():
+    """For each 6-bit mask of filled upper categories, the capped totals that can occur."""
+    reachable = [None] * 64
+    reachable[0] = {0}
+    for upper_mask in range(1, 64):
+        low = (upper_mask & -upper_mask).bit_length() - 1
+        rest = reachable[upper_mask & ~(1 << low)]
+        reachable[upper_mask] = {min(UPPER_BONUS_THRESHOLD, total + s) for total in rest for s in _upper_scores()[low]}
+    return [np.array(sorted(totals)) for totals in reachable]
+
+def final_values(values, mask, uppers):
+    """(U, 252) value of scoring each hand now in its best open category."""
+    uppers = np.asarray(uppers)
+    final = np.full((len(uppers), NUM_HANDS), -np.inf)
+    for c in range(6):
+        if mask >> c & 1:
+            continue
+        points = _UPPER_POINTS[c]
+        new_upper = np.minimum(UPPER_BONUS_THRESHOLD, uppers[:, None] + points[None, :])
+        bonus = np.where((uppers[:, None] < UPPER_BONUS_THRESHOLD) & (new_upper >= UPPER_BONUS_THRESHOLD), UPPER_BONUS, 0)
+        np.maximum(final, points + bonus + values[mask | (1 << c)][new_upper], out=final)
+    # Lower categories leave the upper total alone, so all of them are handled in one step
+    lower = [c for c in range(6, NUM_CATEGORIES) if not mask >> c & 1]
+    if lower:
+        next_values = values[[mask | (1 << c) for c in lower]][:, uppers]
+        candidate = _LOWER_POINTS[[c - 6 for c in lower]][None, :, :] + next_values.T[:, :, None]
+        np.maximum(final, candidate.max(axis=1), out=final)
+    return final
+
+def turn_values(values, mask, uppers):
+    """
+    Solve one turn for the given filled mask and array of upper totals.
+    Returns (final, keep_values) where
+      final[u, h]          value of scoring hand h now (best open category)
+      keep_values[r][u, k] value of holding keep k for a reroll that has r more rerolls after it
+                           (r = 0: the last reroll, r = 1: the first reroll)
+    """
+    final = final_values(values, mask, uppers)
+    return final, keep_values_for(final, rerolls=2)
+
+def solve(progress=False):
+    """Fill the (NUM_MASKS, 64) value table from the last turn back to the first."""
+    values = np.zeros((NUM_MASKS, UPPER_STATES))
+    reachable = reachable_upper_totals()
+    masks = sorted(range(NUM_MASKS - 1), key=lambda m: -bin(m).count('1'))
+    for n, mask in enumerate(masks):
+        uppers = reachable[mask & 63]
+        _, keep_values = turn_values(values, mask, uppers)
+        start = best_keep_values(keep_values[1]) @ INITIAL_ROLL
+        values[mask, uppers] = start
+        if progress and n % 512 == 0:
+            print(f"Solved {n}/{len(masks)} states")
+    return values
+
+def save_table(values, path=DEFAULT_TABLE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.save(path, values.astype(np.float32))
+
+def load_table(path=DEFAULT_TABLE_PATH, solve_if_missing=True):
+    """Memory-map the solved value table, solving and saving it first if needed."""
+    if not os.path.exists(path):
+        if not solve_if_missing:
+            raise FileNotFoundError(path)
+        print(f"Solving the optimal value table (about a minute, once); saving it to {path}")
+        save_table(solve(), path)
+    # Plain ndarray view of the mapping: same pages, without memmap indexing overhead
+    return np.asarray(np.load(path, mmap_mode='r'))
+
+def expected_score(values=None):
+    """Exact expected final score under optimal play."""
+    if values is None:
+        values = load_table()
+    return float(values[0, 0])
+
+# Play-time decisions. For every reachable (mask, upper) state the decision
+# table holds three int8 rows over the 252 sorted hands:
+#   0  hold mask over the sorted hand with two rerolls left
+#   1  hold mask with one reroll left
+#   2  category to score
+# Rows follow state_rows(); the table is about 270 MB and is memory-mapped.
+
+def state_rows():
+    """(NUM_MASKS, 64) row of each reachable state in the decision table (-1 elsewhere), and the row count."""
+    reachable = reachable_upper_totals()
+    rows = np.full((NUM_MASKS, UPPER_STATES), -1, dtype=np.int32)
+    count = 0
+    for mask in range(FULL_MASK):
+        uppers = reachable[mask & 63]
+        rows[mask, uppers] = np.arange(count, count + len(uppers))
+        count += len(uppers)
+    return rows, count
+
+def best_categories(values, mask, uppers):
+    """
+    (U, 252) category maximising points plus bonus plus the value of the next
+    state, first category on ties, computed in the value table's precision.
+    """
+    uppers = np.asarray(uppers)[:, None]
+    best_value = np.full((len(uppers), NUM_HANDS), -np.inf)
+    best = np.zeros((len(uppers), NUM_HANDS), dtype=np.int8)
+    for c in range(NUM_CATEGORIES):
+        if mask >> c & 1:
+            continue
+        points = SCORE_ARRAY[:, c].astype(np.int64)[None, :]
+        if c < 6:
+            new_upper = np.minimum(UPPER_BONUS_THRESHOLD, uppers + points)
+            bonus = np.where((uppers < UPPER_BONUS_THRESHOLD) & (new_upper >= UPPER_BONUS_THRESHOLD), UPPER_BONUS, 0)
+        else:
+            new_upper = np.broadcast_to(uppers, best.shape)
+            bonus = 0
+        value = (points + bonus).astype(values.dtype) + values[mask | (1 << c)][new_upper]
+        better = value > best_value
+        best_value = np.where(better, value, best_value)
+        best[better] = c
+    return best
+
+def turn_decisions(values, mask, uppers):
+    """(U, 3, 252) int8 decision rows for the given filled mask and upper totals."""
+    final = final_values(values, mask, uppers)
+    decisions = np.empty((len(uppers), 3, NUM_HANDS), dtype=np.int8)
+    for u in range(len(uppers)):
+        # One upper total at a time: the matrix products then round exactly as a single-state solve does
+        keep_values = keep_values_for(final[u:u + 1], rerolls=2)
+        decisions[u, 0] = keep_values[1][0][HAND_KEEPS].argmax(axis=1)
+        decisions[u, 1] = keep_values[0][0][HAND_KEEPS].argmax(axis=1)
+    decisions[:, 2] = best_categories(values, mask, uppers)
+    return decisions
+
+def build_decisions(values, progress=False):
+    """Decision rows for every reachable state, in state_rows() order."""
+    reachable = reachable_upper_totals()
+    _, count = state_rows()
+    decisions = np.empty((count, 3, NUM_HANDS), dtype=np.int8)
+    row = 0
+    for mask in range(FULL_MASK):
+        uppers = reachable[mask & 63]
+        decisions[row:row + len(uppers)] = turn_decisions(values, mask, uppers)
+        row += len(uppers)
+        if progress and mask % 512 == 0:
+            print(f"Decided {mask}/{FULL_MASK} masks")
+    return decisions
+
+def load_decisions(path=DEFAULT_DECISIONS_PATH):
+    """Memory-map the decision table saved by python optimal_solver.py --decisions, or None if there is none."""
+    if not os.path.exists(path):
+        return None
+    return np.asarray(np.load(path, mmap_mode='r'))
+
+class OptimalPolicy:
+    """
+    Optimal keep and category decisions. Each state's decisions are worked
+    out from the value table on first use and remembered (the most recent
+    memo_size states); the default policy reads them off the saved decision
+    table instead when one has been built.
+    """
+    def __init__(self, values=None, decisions=None, memo_size=OPTIMAL_MEMO_SIZE):
+        if values is None:
+            values = load_table()
+            if decisions is None:
+                decisions = load_decisions()
+        self.values = values
+        self.decisions = decisions
+        self.rows = state_rows()[0] if decisions is not None else None
+        self._solved = lru_cache(maxsize=memo_size)(self._solve_state)
+
+    def _solve_state(self, mask, upper):
+        return turn_decisions(self.values, mask, [upper])[0]
+
+    def state_decisions(self, mask, upper):
+        """(3, 252) decision rows for one state."""
+        if self.decisions is not None:
+            return self.decisions[self.rows[mask, upper]]
+        return self._solved(mask, upper)
+
+    def keep_mask(self, dice, mask, upper, rerolls_left):
+        """Bitmask over the positions in dice to hold before the next reroll."""
+        order = sorted(range(5), key=lambda i: dice[i])
+        hand = HAND_INDEX[tuple(dice[i] for i in order)]
+        best = int(self.state_decisions(mask, upper)[2 - rerolls_left, hand])
+        # best is a mask over sorted positions; translate back to positions in dice
+        return sum(1 << order[i] for i in range(5) if best >> i & 1)
+
+    def category(self, dice, mask, upper):
+        """Index of the category that maximises points now plus the value of the next state."""
+        return int(self.state_decisions(mask, upper)[2, HAND_INDEX[tuple(sorted(dice))]])
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Solve the optimal value table and save it.")
+    parser.add_argument('--decisions', action='store_true',
+                        help=f"also save every state's decisions to {DEFAULT_DECISIONS_PATH} (about 270 MB, two more minutes)")
+    args = parser.parse_args()
+    table = solve(progress=True)
+    save_table(table)
+    print(f"Optimal expected score: {table[0, 0]:.4f}")
+    print(f"Saved value table to {DEFAULT_TABLE_PATH}")
+    if args.decisions:
+        np.save(DEFAULT_DECISIONS_PATH, build_decisions(table.astype(np.float32), progress=True))
+        print(f"Saved decision table to {DEFAULT_DECISIONS_PATH}")
@@ -0,0 +1,246 @@
+import ast
+import hashlib
+import json
+import os
+import sys
+import types
+import numpy as np
+from results_io import ScoreWriter, load_scores, read_metadata, SCORES_EXTENSION
+
+# Content-addressed cache of simulated scores. An entry is keyed by a hash of
+# everything that decides the scores of a seeded run: the source of the
+# strategy's module and of the repo modules it uses, the shared game code,
+# the engine and its version, the seed and the game count. Editing one
+# strategy therefore only invalidates that strategy's entries.
+#
+#   cache = ResultCache()
+#   key = cache.key(multiples_strategy, engine='scalar', seed=1, num_games=10000)
+#   scores = cache.get(key)           # int16 array, or None on a miss
+#
+# Entries are binary score files (results_io); the least recently used are
+# deleted once the directory grows past max_bytes.
+
+CACHE_DIR = os.path.join('results', 'cache')
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Game code every run depends on, whatever the strategy
+SHARED_SOURCES = ('scoreboard.py', 'dice_rolling.py')
+
+# Extra sources read by an engine besides the strategy itself
+ENGINE_SOURCES = {
+    'scalar': ('yahtzee_simulator.py',),
+    'parallel': ('yahtzee_simulator.py',),
+    'batched': ('batch_engine.py', os.path.join('strategies', 'batch_strategies.py')),
+}
+
+# Data files read by a repo module; runs that use the module hash them too.
+# The first file is required; the others are optional and hashed as missing
+# when absent (the optimal decision table is only built on request).
+DATA_FILES = {
+    'optimal_solver.py': (os.path.join('results', 'optimal_values.npy'),
+                          os.path.join('results', 'optimal_decisions.npy')),
+}
+
+# sha256 of each file hashed so far, by (path, size, mtime), so large data files are read once
+_file_digests = {}
+
+def _file_digest(path):
+    stat = os.stat(path)
+    stamp = (path, stat.st_size, stat.st_mtime_ns)
+    if stamp not in _file_digests:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        _file_digests[stamp] = digest.digest()
+    return _file_digests[stamp]
+
+def _repo_module_file(module):
+    path = getattr(module, '__file__', None)
+    if path and os.path.abspath(path).startswith(REPO_DIR + os.sep):
+        return os.path.abspath(path)
+    return None
+
+def _strategy_modules(strategy_func):
+    """Modules defining the strategy, including strategies wrapped by callable objects."""
+    modules = set()
+    pending = [strategy_func]
+    seen = set()
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        owner = obj if isinstance(obj, (types.FunctionType, type)) else type(obj)
+        if owner.__module__ in sys.modules:
+            modules.add(sys.modules[owner.__module__])
+        if not isinstance(obj, (types.FunctionType, type)):
+            pending.extend(value for value in vars(obj).values() if callable(value))
+    return modules
+
+def _imported_modules(path):
+    """Modules named by the top-level import statements of a source file."""
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), path)
+    names = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.append(node.module)
+    return [sys.modules[name] for name in names if name in sys.modules]
+
+def source_files(strategy_func, engine='scalar'):
+    """Sorted repo source files the scores of strategy_func depend on."""
+    files = {os.path.join(REPO_DIR, name) for name in SHARED_SOURCES + ENGINE_SOURCES.get(engine, ())}
+    pending = list(_strategy_modules(strategy_func))
+    seen = set()
+    while pending:
+        module = pending.pop()
+        path = _repo_module_file(module)
+        if path is None or path in seen:
+            continue
+        seen.add(path)
+        files.add(path)
+        # Follow the repo modules this one imports or takes names from. Imported
+        # statements catch names without a __module__, such as NumPy arrays.
+        pending.extend(_imported_modules(path))
+        for value in vars(module).values():
+            if isinstance(value, types.ModuleType):
+                pending.append(value)
+            elif getattr(value, '__module__', None) in sys.modules:
+                pending.append(sys.modules[value.__module__])
+    return sorted(files)
+
+def _value_identity(value):
+    if callable(value):
+        return strategy_identity(value)
+    if isinstance(value, np.ndarray):
+        # repr elides large arrays, so hash their contents (compiled policy tables)
+        return hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()
+    return repr(value)
+
+def strategy_identity(strategy_func):
+    """Name plus parameters of a strategy function or callable strategy object."""
+    if isinstance(strategy_func, types.FunctionType):
+        return f"{strategy_func.__module__}:{strategy_func.__qualname__}"
+    owner = type(strategy_func)
+    state = {name: _value_identity(value) for name, value in vars(strategy_func).items() if not name.startswith('_')}
+    return f"{owner.__module__}:{owner.__qualname__}:{json.dumps(state, sort_keys=True)}"
+
+class ResultCache:
+    """On-disk cache of score columns, bounded to max_bytes with least-recently-used eviction."""
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, strategy_func, engine='scalar', seed=None, num_games=10000, engine_version=None):
+        """
+        Hex digest identifying a run, or None when the run cannot be cached:
+        unseeded runs are random, strategies without source cannot be hashed,
+        and the data files the strategy needs (DATA_FILES) may not exist yet.
+        """
+        if seed is None:
+            return None
+        if engine_version is None:
+            from yahtzee_simulator import ENGINE_VERSION
+            engine_version = ENGINE_VERSION
+        try:
+            files = source_files(strategy_func, engine)
+        except (AttributeError, TypeError):
+            return None
+        digest = hashlib.sha256()
+        digest.update(json.dumps({
+            'strategy': strategy_identity(strategy_func),
+            'engine': engine,
+            'engine_version': engine_version,
+            'seed': seed,
+            'num_games': num_games,
+        }, sort_keys=True).encode('utf-8'))
+        data_files = []
+        for path in files:
+            names = DATA_FILES.get(os.path.relpath(path, REPO_DIR).replace(os.sep, '/'), ())
+            if names and not os.path.exists(os.path.join(REPO_DIR, names[0])):
+                # Built on first use (the optimal value table), so there is nothing to hash yet
+                return None
+            data_files.extend(os.path.join(REPO_DIR, name) for name in names)
+        for path in files + data_files:
+            digest.update(os.path.relpath(path, REPO_DIR).replace(os.sep, '/').encode('utf-8'))
+            digest.update(_file_digest(path) if os.path.exists(path) else b'missing')
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + SCORES_EXTENSION)
+
+    def get(self, key):
+        """Memory-mapped int16 scores for key, or None on a miss."""
+        path = self.path(key) if key is not None else None
+        if path is None or not os.path.exists(path):
+            self.misses += 1
+            return None
+        try:
+            _, scores = load_scores(path)
+        except ValueError:
+            # Damaged entry: drop it and simulate again
+            os.remove(path)
+            self.misses += 1
+            return None
+        os.utime(path)  # mark as recently used
+        self.hits += 1
+        return scores
+
+    def metadata(self, key):
+        return read_metadata(self.path(key))
+
+    def record(self, key, chunks, **metadata):
+        """
+        Pass score chunks through while writing them to the cache. The entry
+        only appears once every chunk has been consumed, so an interrupted run
+        never leaves a partial entry behind.
+        """
+        tmp_path = self.path(key) + '.tmp'
+        try:
+            with ScoreWriter(tmp_path, **metadata) as writer:
+                for chunk in chunks:
+                    writer.write(chunk)
+                    yield chunk
+            os.replace(tmp_path, self.path(key))
+        finally:
+            # Left behind only when the run was interrupted
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.evict()
+
+    def entries(self):
+        """(last used, size, path) of every entry, least recently used first."""
+        entries = []
+        for filename in os.listdir(self.directory):
+            if filename.endswith(SCORES_EXTENSION):
+                stat = os.stat(os.path.join(self.directory, filename))
+                entries.append((stat.st_mtime, stat.st_size, os.path.join(self.directory, filename)))
+        return sorted(entries)
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            os.remove(path)
+
+    def cache_info(self):
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self.entries()), 'bytes': self.size()}
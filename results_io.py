@@ -0,0 +1,108 @@
+import json
+import os
+import numpy as np
+
+# Binary columnar score files: a fixed-size JSON header followed by one
+# little-endian int16 per game. The header is rewritten after every chunk,
+# so a file is always readable up to the last chunk written.
+#
+#   bytes 0-7     magic b'YSCORES1'
+#   bytes 8-255   JSON metadata (strategy, seed, num_games, engine_version, ...), space padded
+#   bytes 256-    scores as '<i2'
+
+MAGIC = b'YSCORES1'
+HEADER_SIZE = 256
+SCORE_DTYPE = np.dtype('<i2')
+SCORES_EXTENSION = '.bin'
+
+def _encode_header(metadata):
+    payload = json.dumps(metadata, sort_keys=True).encode('utf-8')
+    if len(MAGIC) + len(payload) > HEADER_SIZE:
+        raise ValueError("Score file metadata does not fit in the header")
+    return MAGIC + payload.ljust(HEADER_SIZE - len(MAGIC), b' ')
+
+def ensure_parent_dir(path):
+    """Create the directory a file is about to be written to (results/ is only made on first write)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+def read_metadata(path):
+    with open(path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE or not header.startswith(MAGIC):
+        raise ValueError(f"{path} is not a binary score file")
+    return json.loads(header[len(MAGIC):].decode('utf-8'))
+
+class ScoreWriter:
+    """
+    Append-only sink for score chunks.
+
+        with ScoreWriter(path, strategy="Multiples", seed=1, engine_version=1) as writer:
+            for chunk in simulator.iter_monte_carlo(strategy, n):
+                writer.write(chunk)
+
+    With append=True an existing file is reopened and extended.
+    """
+    def __init__(self, path, strategy=None, seed=None, engine_version=None, append=False, **extra):
+        self.path = path
+        if append and os.path.exists(path):
+            self.metadata = read_metadata(path)
+            self.file = open(path, 'r+b')
+            self.file.seek(HEADER_SIZE + self.metadata['num_games'] * SCORE_DTYPE.itemsize)
+            self.file.truncate()
+        else:
+            self.metadata = dict(extra, strategy=strategy, seed=seed, engine_version=engine_version, num_games=0)
+            ensure_parent_dir(path)
+            self.file = open(path, 'w+b')
+            self.file.write(_encode_header(self.metadata))
+
+    @property
+    def num_games(self):
+        return self.metadata['num_games']
+
+    def write(self, scores):
+        chunk = np.asarray(scores, dtype=SCORE_DTYPE)
+        self.file.write(chunk.tobytes())
+        self.metadata['num_games'] += len(chunk)
+        self._write_header()
+
+    def truncate(self, num_games):
+        """Drop every score after the first num_games (used when resuming from a checkpoint)."""
+        if num_games > self.num_games:
+            raise ValueError(f"{self.path} holds {self.num_games} games, cannot keep {num_games}")
+        self.file.seek(HEADER_SIZE + num_games * SCORE_DTYPE.itemsize)
+        self.file.truncate()
+        self.metadata['num_games'] = num_games
+        self._write_header()
+
+    def sync(self):
+        # Force written scores and header to disk
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def _write_header(self):
+        end = self.file.tell()
+        self.file.seek(0)
+        self.file.write(_encode_header(self.metadata))
+        self.file.seek(end)
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self._write_header()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def load_scores(path):
+    """Memory-map a score file without copying. Returns (metadata, int16 array)."""
+    metadata = read_metadata(path)
+    if metadata['num_games'] == 0:
+        return metadata, np.zeros(0, dtype=SCORE_DTYPE)
+    scores = np.memmap(path, dtype=SCORE_DTYPE, mode='r', offset=HEADER_SIZE, shape=(metadata['num_games'],))
+    return metadata, scores
@@ -1,62 +1,140 @@
 from collections import Counter
+from itertools import combinations_with_replacement
+
+# Category order used by the scorecard and by every index-based table
+CATEGORIES = [
+    'ones', 'twos', 'threes', 'fours', 'fives', 'sixes',
+    'three_of_a_kind', 'four_of_a_kind', 'full_house',
+    'small_straight', 'large_straight', 'yahtzee', 'chance'
+]
+UPPER_CATEGORIES = CATEGORIES[:6]
+CATEGORY_INDEX = {category: i for i, category in enumerate(CATEGORIES)}
+NUM_CATEGORIES = len(CATEGORIES)
+
+# Upper section bonus
+UPPER_BONUS_THRESHOLD = 63
+UPPER_BONUS = 35
+
+# Scoring rules for a single hand, used once to build the score table
+def _rule_upper(face):
+    return lambda dice: sum(d for d in dice if d == face)
+
+def _rule_three_of_a_kind(dice):
+    counts = Counter(dice)
+    if any(count >= 3 for count in counts.values()):
+        return sum(dice)
+    return 0
+
+def _rule_four_of_a_kind(dice):
+    counts = Counter(dice)
+    if any(count >= 4 for count in counts.values()):
+        return sum(dice)
+    return 0
+
+def _rule_full_house(dice):
+    counts = list(Counter(dice).values())
+    if sorted(counts) == [2, 3]:
+        return 25
+    return 0
+
+def _rule_small_straight(dice):
+    unique_sorted = sorted(set(dice))
+    if len(unique_sorted) >= 4 and max(unique_sorted) - min(unique_sorted) == len(unique_sorted) - 1:
+        return 30
+    return 0
+
+def _rule_large_straight(dice):
+    unique_sorted = sorted(set(dice))
+    if len(unique_sorted) == 5 and max(unique_sorted) - min(unique_sorted) == 4:
+        return 40
+    return 0
+
+def _rule_yahtzee(dice):
+    if len(set(dice)) == 1:
+        return 50
+    return 0
+
+def _rule_chance(dice):
+    return sum(dice)
+
+_RULES = [_rule_upper(face) for face in range(1, 7)] + [
+    _rule_three_of_a_kind, _rule_four_of_a_kind, _rule_full_house,
+    _rule_small_straight, _rule_large_straight, _rule_yahtzee, _rule_chance
+]
+
+# All 252 distinct hands as sorted tuples; a hand's position here is its index
+HANDS = list(combinations_with_replacement(range(1, 7), 5))
+HAND_INDEX = {hand: i for i, hand in enumerate(HANDS)}
+NUM_HANDS = len(HANDS)
+
+# SCORE_TABLE[hand_index][category_index] -> points for that hand in that category
+SCORE_TABLE = [tuple(rule(hand) for rule in _RULES) for hand in HANDS]
+
+def hand_index(dice):
+    """Index of the sorted hand for any ordering of five dice."""
+    return HAND_INDEX[tuple(sorted(dice))]
+
+def score_by_index(hand_idx, category_idx):
+    """Table lookup of a category score for a hand index."""
+    return SCORE_TABLE[hand_idx][category_idx]
+
+def score_all(dice):
+    """Tuple of all 13 category scores for a hand, in CATEGORIES order."""
+    return SCORE_TABLE[hand_index(dice)]
+
+def score_category(category, dice):
+    return score_by_index(hand_index(dice), CATEGORY_INDEX[category])
 
 class YahtzeeScorer:
+    # Every method is a lookup into the precomputed SCORE_TABLE (hand_index, score_by_index)
+
     # Upper Section Scores
     @staticmethod
     def score_ones(dice):
-        return sum(d for d in dice if d == 1)
+        return score_by_index(hand_index(dice), 0)
     @staticmethod
     def score_twos(dice):
-        return sum(d for d in dice if d == 2)
+        return score_by_index(hand_index(dice), 1)
     @staticmethod
     def score_threes(dice):
-        return sum(d for d in dice if d == 3)
+        return score_by_index(hand_index(dice), 2)
     @staticmethod
     def score_fours(dice):
-        return sum(d for d in dice if d == 4)
+        return score_by_index(hand_index(dice), 3)
     @staticmethod
     def score_fives(dice):
-        return sum(d for d in dice if d == 5)
+        return score_by_index(hand_index(dice), 4)
     @staticmethod
     def score_sixes(dice):
-        return sum(d for d in dice if d == 6)
+        return score_by_index(hand_index(dice), 5)
 
     # Lower Section Scores
     @staticmethod
     def score_three_of_a_kind(dice):
-        counts = Counter(dice)
-        if any(count >= 3 for count in counts.values()):
-            return sum(dice)
-        return 0
+        return score_by_index(hand_index(dice), 6)
     @staticmethod
     def score_four_of_a_kind(dice):
-        counts = Counter(dice)
-        if any(count >= 4 for count in counts.values()):
-            return sum(dice)
-        return 0
+        return score_by_index(hand_index(dice), 7)
     @staticmethod
     def score_full_house(dice):
-        counts = list(Counter(dice).values())
-        if sorted(counts) == [2, 3]:
-            return 25
-        return 0
+        return score_by_index(hand_index(dice), 8)
     @staticmethod
     def score_small_straight(dice):
-        unique_sorted = sorted(set(dice))
-        if len(unique_sorted) >= 4 and max(unique_sorted) - min(unique_sorted) == len(unique_sorted) - 1:
-            return 30
-        return 0
+        return score_by_index(hand_index(dice), 9)
     @staticmethod
     def score_large_straight(dice):
-        unique_sorted = sorted(set(dice))
-        if len(unique_sorted) == 5 and max(unique_sorted) - min(unique_sorted) == 4:
-            return 40
-        return 0
+        return score_by_index(hand_index(dice), 10)
     @staticmethod
     def score_yahtzee(dice):
-        if len(set(dice)) == 1:
-            return 50
-        return 0
+        return score_by_index(hand_index(dice), 11)
     @staticmethod
     def score_chance(dice):
-        return sum(dice)
+        return score_by_index(hand_index(dice), 12)
+
+    # Index-based API
+    @staticmethod
+    def score(category, dice):
+        return score_category(category, dice)
+    @staticmethod
+    def score_all(dice):
+        return score_all(dice)
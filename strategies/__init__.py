@@ -0,0 +1,100 @@
+import importlib
+import pkgutil
+from collections.abc import Mapping
+
+# Lazy strategy registry. Names map to "module:function" targets that are only
+# imported the first time the strategy is looked up, so importing the
+# simulator (or unpickling a strategy in a worker) does not load every module.
+#
+#   from strategies import registry
+#   registry["Multiples"]            # imports strategies.multiples_strategy now
+#   registry.register("Mine", "my_package.my_module:my_strategy")
+#
+# Besides the built-in strategies below, any strategies/<name>_strategy.py
+# module exposing a function of the same name is picked up, as is anything
+# installed under the ENTRY_POINT_GROUP entry point group.
+
+ENTRY_POINT_GROUP = 'yahtzee_simulator.strategies'
+
+# Display name -> target, in the order results are reported
+BUILTIN_STRATEGIES = {
+    "Multiples": "strategies.multiples_strategy:multiples_strategy",
+    "Multiples+": "strategies.multiples_strategy_plus:multiples_strategy_plus",
+    "Straights": "strategies.straight_strategy:straight_strategy",
+    "Upper Focus": "strategies.upper_focus_strategy:upper_focus_strategy",
+    "Yahtzee Focus": "strategies.yahtzee_focus_strategy:yahtzee_focus_strategy",
+    "Tunnel Vision": "strategies.tunnel_vision_strategy:tunnel_vision_strategy",
+    "Optimal": "strategies.optimal_strategy:optimal_strategy",
+}
+
+def load_target(target):
+    """Import "module:attribute" and return the attribute."""
+    module_name, _, attribute = target.partition(':')
+    return getattr(importlib.import_module(module_name), attribute)
+
+def discover_strategy_modules():
+    """{display name: target} for strategies/*_strategy.py modules not in BUILTIN_STRATEGIES (nothing is imported)."""
+    known = {target.partition(':')[0] for target in BUILTIN_STRATEGIES.values()}
+    found = {}
+    for module in pkgutil.iter_modules(__path__):
+        module_name = f"{__name__}.{module.name}"
+        if module.name.endswith('_strategy') and module_name not in known:
+            display_name = module.name[:-len('_strategy')].replace('_', ' ').title()
+            found[display_name] = f"{module_name}:{module.name}"
+    return found
+
+def discover_entry_points():
+    """{name: entry point} for strategies installed by other packages."""
+    from importlib.metadata import entry_points
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        eps = eps.select(group=ENTRY_POINT_GROUP)
+    else:
+        eps = eps.get(ENTRY_POINT_GROUP, [])
+    return {ep.name: ep for ep in eps}
+
+class StrategyRegistry(Mapping):
+    """Mapping of display name -> strategy function, importing each on first access."""
+    def __init__(self, targets=None, discover=True):
+        self._targets = dict(BUILTIN_STRATEGIES if targets is None else targets)
+        self._loaded = {}
+        # Discovery scans the package and installed distributions, so it waits until the names are needed
+        self._discovered = not discover
+
+    def _discover(self):
+        if not self._discovered:
+            self._discovered = True
+            for name, target in discover_strategy_modules().items():
+                self._targets.setdefault(name, target)
+            for name, entry_point in discover_entry_points().items():
+                self._targets.setdefault(name, entry_point)
+
+    def register(self, name, target):
+        """Add a strategy: a callable, or a "module:function" string imported on first use."""
+        self._targets[name] = target
+        self._loaded.pop(name, None)
+
+    def is_loaded(self, name):
+        return name in self._loaded
+
+    def __getitem__(self, name):
+        if name not in self._loaded:
+            if name not in self._targets:
+                self._discover()
+            target = self._targets[name]
+            if isinstance(target, str):
+                target = load_target(target)
+            elif hasattr(target, 'load') and not callable(target):
+                target = target.load()  # importlib.metadata.EntryPoint
+            self._loaded[name] = target
+        return self._loaded[name]
+
+    def __iter__(self):
+        self._discover()
+        return iter(list(self._targets))
+
+    def __len__(self):
+        self._discover()
+        return len(self._targets)
+
+registry = StrategyRegistry()
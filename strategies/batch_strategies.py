@@ -0,0 +1,86 @@
+import numpy as np
+from batch_engine import SCORE_ARRAY, face_counts, hand_indices
+
+# Vectorized ports of the scalar strategies for the BatchSimulator.
+# Each port makes the same keep and category decisions as its scalar
+# counterpart, so both engines sample the same score distribution.
+
+def best_open_category(sim):
+    """Highest-scoring open category for every row, first category on ties."""
+    scores = SCORE_ARRAY[hand_indices(sim.dice)]
+    return np.where(sim.open_categories(), scores, -1).argmax(axis=1)
+
+class MultiplesBatchPolicy:
+    """
+    Port of multiples_strategy: keep the most common value when it appears
+    at least twice (ties go to the value seen first in dice order, like
+    Counter.most_common), otherwise reroll everything. Score the best category.
+    """
+    def keep(self, sim, roll_num):
+        dice = sim.dice
+        counts = face_counts(dice)
+        max_count = counts.max(axis=1)
+        die_counts = np.take_along_axis(counts, dice.astype(np.intp) - 1, axis=1)
+        first = (die_counts == max_count[:, None]).argmax(axis=1)
+        value = dice[np.arange(len(dice)), first]
+        return (dice == value[:, None]) & (max_count > 1)[:, None]
+
+    def choose(self, sim):
+        return best_open_category(sim)
+
+class UpperFocusBatchPolicy:
+    """
+    Port of upper_focus_strategy: keep dice matching the highest open upper
+    category. Scoring prefers the best open upper category whose face showed
+    up before the last reroll, then falls back to the best category overall.
+    """
+    def keep(self, sim, roll_num):
+        open_upper = sim.open_categories()[:, :6]
+        has_upper = open_upper.any(axis=1)
+        # Highest open face: last True column in open_upper
+        target = 6 - open_upper[:, ::-1].argmax(axis=1)
+        # The scalar strategy scores with the counts taken at the start of its last reroll pass
+        if roll_num == 0:
+            self.prev_counts = face_counts(sim.dice)
+        else:
+            self.prev_counts = np.where(sim.rolling[:, None], face_counts(sim.dice), self.prev_counts)
+        return (sim.dice == target[:, None]) & has_upper[:, None]
+
+    def choose(self, sim):
+        open_cats = sim.open_categories()
+        scores = SCORE_ARRAY[hand_indices(sim.dice)]
+        eligible = open_cats[:, :6] & (self.prev_counts > 0)
+        upper_pick = np.where(eligible, scores[:, :6], -1).argmax(axis=1)
+        return np.where(eligible.any(axis=1), upper_pick, best_open_category(sim))
+
+class YahtzeeFocusBatchPolicy:
+    """
+    Port of yahtzee_focus_strategy. Its keep list is built by comparing the
+    whole hand to a single value, so it never keeps a die and always rerolls
+    all five; a Yahtzee (50) is always the best open score, so scoring reduces
+    to picking the best category.
+    """
+    def keep(self, sim, roll_num):
+        return np.zeros(sim.dice.shape, dtype=bool)
+
+    def choose(self, sim):
+        return best_open_category(sim)
+
+# Scalar strategy function name -> batch port.
+# straight_strategy's straight branch tests category names against integers
+# and never fires, so it keeps the same dice as multiples_strategy.
+BATCH_POLICIES = {
+    'multiples_strategy': MultiplesBatchPolicy,
+    'multiples_strategy_plus': MultiplesBatchPolicy,
+    'straight_strategy': MultiplesBatchPolicy,
+    'upper_focus_strategy': UpperFocusBatchPolicy,
+    'yahtzee_focus_strategy': YahtzeeFocusBatchPolicy,
+}
+
+def batch_policy_for(strategy_function):
+    """Batch port for a scalar strategy function, or None if it has not been ported."""
+    if hasattr(strategy_function, 'batch_policy'):
+        # Players that bring their own port, such as compiled policy tables
+        return strategy_function.batch_policy()
+    policy_class = BATCH_POLICIES.get(getattr(strategy_function, '__name__', None))
+    return policy_class() if policy_class else None
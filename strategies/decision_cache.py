@@ -0,0 +1,159 @@
+from functools import lru_cache
+from scoreboard import CATEGORIES, YahtzeeScorer
+
+DECISION_CACHE_SIZE = 1 << 18
+
+class _RerollRequest(Exception):
+    # Raised by the probe hand to stop the wrapped strategy at the reroll being queried
+    def __init__(self, positions):
+        self.positions = positions
+
+class _ProbeHand:
+    """
+    Scripted hand for asking a strategy a single question. The strategy is
+    started on hands[0]; its earlier rerolls deal the next hands in turn, and
+    the reroll being asked about is intercepted instead of rolled.
+    """
+    def __init__(self, hands, stop_at):
+        self.hands = hands
+        self.stop_at = stop_at
+        self.rerolls = 0
+        self.dice = list(hands[0])
+
+    def roll_all(self):
+        return self.dice
+
+    def reroll(self, positions):
+        if self.rerolls == self.stop_at:
+            raise _RerollRequest(list(positions))
+        self.rerolls += 1
+        self.dice = list(self.hands[min(self.rerolls, len(self.hands) - 1)])
+        return self.dice
+
+class _ProbeSimulator:
+    def __init__(self, hand):
+        self.hand = hand
+        self.scorer = YahtzeeScorer()
+        self.all_categories = list(CATEGORIES)
+
+def score_independent(strategy_function):
+    """
+    Mark a strategy that reads only which categories are open, never the
+    scores already entered. Only such strategies can be cached or compiled:
+    the probes fill closed categories with 0.
+    """
+    strategy_function.score_independent = True
+    return strategy_function
+
+def is_score_independent(strategy_function):
+    return getattr(strategy_function, 'score_independent', False)
+
+def sorted_hand_strategy(strategy_function):
+    """
+    Mark a score-independent strategy whose decisions depend only on the sorted
+    dice, the open categories and the roll number (no tie-breaks on dice order,
+    nothing remembered from earlier rolls). Such strategies can be cached on the
+    sorted hand without changing play, and have an exact score distribution.
+    """
+    strategy_function.sorted_hand_only = True
+    return score_independent(strategy_function)
+
+def is_sorted_hand_strategy(strategy_function):
+    return getattr(strategy_function, 'sorted_hand_only', False)
+
+class CachedStrategy:
+    """
+    Memoizing wrapper for a deterministic strategy function. It has the same
+    (dice, scorecard, simulator) signature and drives the turn itself, looking up
+    each decision by (hand, open-category mask, roll number):
+      rolls 0 and 1 -> the dice to reroll, or the category if the strategy stops rolling
+      roll 2        -> the category to score
+    On a miss the wrapped strategy is probed with a scripted hand. Rerolls must
+    come in order, with the turn ending when the strategy stops rerolling, as
+    in every heuristic under strategies/.
+
+    By default the hand is the dice in the order rolled, which reproduces the
+    wrapped strategy exactly; strategies marked with sorted_hand_strategy are
+    keyed on the sorted hand. canonical=True keys on the sorted hand regardless
+    (252 hands rather than 7776 orderings) and hands the strategy sorted dice,
+    so order-dependent tie-breaks such as Counter.most_common on two pairs
+    always resolve the same way; that changes the strategy (multiples_strategy
+    then always keeps the lower pair).
+
+    Strategies that remember earlier rolls of the turn (tunnel_vision_strategy's
+    target, upper_focus_strategy's counts) need history=True, which adds the
+    turn's earlier hands to the key.
+
+    The key holds only which categories are open, and probes see 0 in every
+    filled category, so the wrapped strategy must not read scored values (the
+    optimal strategy reads the upper subtotal). Strategies have to be marked
+    with score_independent (or sorted_hand_strategy); anything else is refused
+    with ValueError.
+    """
+    score_independent = True
+
+    def __init__(self, strategy_function, maxsize=DECISION_CACHE_SIZE, history=False, canonical=None):
+        if not is_score_independent(strategy_function):
+            name = getattr(strategy_function, '__name__', type(strategy_function).__name__)
+            raise ValueError(f"{name} is not marked @score_independent; its cached decisions could depend on "
+                             "scores the cache key does not hold")
+        self.strategy_function = strategy_function
+        self.maxsize = maxsize
+        self.history = history
+        self.canonical = is_sorted_hand_strategy(strategy_function) if canonical is None else canonical
+        self.__name__ = getattr(strategy_function, '__name__', type(self).__name__)
+        self._decide = lru_cache(maxsize=maxsize)(self.probe)
+
+    def __getstate__(self):
+        # The cache itself is not picklable; workers start with an empty one
+        state = dict(self.__dict__)
+        del state['_decide']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._decide = lru_cache(maxsize=self.maxsize)(self.probe)
+
+    def cache_info(self):
+        return self._decide.cache_info()
+
+    def cache_clear(self):
+        self._decide.cache_clear()
+
+    def probe(self, open_mask, roll_num, hands):
+        """Uncached decision: ('reroll', positions) or ('score', category) for the last hand in hands."""
+        scorecard = {cat: None if open_mask >> i & 1 else 0 for i, cat in enumerate(CATEGORIES)}
+        hand = _ProbeHand(hands, stop_at=roll_num)
+        try:
+            category, _ = self.strategy_function(list(hands[0]), scorecard, _ProbeSimulator(hand))
+        except _RerollRequest as request:
+            return ('reroll', tuple(sorted({pos for pos in request.positions if 0 <= pos < 5})))
+        return ('score', category)
+
+    def __call__(self, dice, scorecard, simulator):
+        open_mask = 0
+        for i, cat in enumerate(CATEGORIES):
+            if scorecard[cat] is None:
+                open_mask |= 1 << i
+        canonical = self.canonical
+        hands = (tuple(sorted(dice)) if canonical else tuple(dice),)
+        for roll_num in range(3):
+            action, value = self._decide(open_mask, roll_num, hands if self.history else hands[-1:])
+            if action == 'score':
+                return value, dice
+            reroll_positions = list(value)
+            if canonical:
+                # Positions refer to the sorted hand: keep the same dice, first matches in dice order
+                kept = [d for i, d in enumerate(hands[-1]) if i not in value]
+                reroll_positions = []
+                for i, die in enumerate(dice):
+                    if die in kept:
+                        kept.remove(die)
+                    else:
+                        reroll_positions.append(i)
+            dice = list(simulator.hand.reroll(reroll_positions))
+            hands += (tuple(sorted(dice)) if canonical else tuple(dice),)
+        raise RuntimeError(f"{self.__name__} asked for a third reroll")
+
+def cached_strategy(strategy_function, maxsize=DECISION_CACHE_SIZE, history=False, canonical=None):
+    return CachedStrategy(strategy_function, maxsize, history, canonical)
@@ -0,0 +1,41 @@
+from scoreboard import CATEGORIES, UPPER_CATEGORIES, UPPER_BONUS_THRESHOLD
+from optimal_solver import OptimalPolicy
+from game_state import state_strategy
+
+_policy = None
+
+def get_optimal_policy():
+    # Load (or solve once and save) the value table on first use
+    global _policy
+    if _policy is None:
+        _policy = OptimalPolicy()
+    return _policy
+
+def optimal_strategy(dice, scorecard, simulator):
+    """
+    Exact expected-value maximizing strategy. Keeps and categories are read
+    off the solved value table from optimal_solver.py.
+    """
+    mask = sum(1 << i for i, cat in enumerate(CATEGORIES) if scorecard[cat] is not None)
+    upper = min(UPPER_BONUS_THRESHOLD, sum(scorecard[cat] for cat in UPPER_CATEGORIES if scorecard[cat] is not None))
+    category_idx, dice = _play_turn(dice, mask, upper, simulator)
+    return CATEGORIES[category_idx], dice
+
+@state_strategy
+def optimal_state_strategy(dice, state, simulator):
+    """optimal_strategy for the GameState protocol: the mask and upper total come straight from the state."""
+    return _play_turn(dice, state.filled, min(UPPER_BONUS_THRESHOLD, state.upper_total), simulator)
+
+def _play_turn(dice, mask, upper, simulator):
+    policy = get_optimal_policy()
+
+    # --- Rerolling Logic ---
+    for rerolls_left in (2, 1):
+        keep = policy.keep_mask(dice, mask, upper, rerolls_left)
+        reroll_positions = [i for i in range(5) if not keep >> i & 1]
+        if reroll_positions:
+            simulator.hand.reroll(reroll_positions)
+            dice = list(simulator.hand.dice)
+
+    # --- Scoring Logic ---
+    return policy.category(dice, mask, upper), dice
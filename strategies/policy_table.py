@@ -0,0 +1,260 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from scoreboard import CATEGORIES, CATEGORY_INDEX, HANDS, HAND_INDEX, NUM_CATEGORIES, NUM_HANDS
+from batch_engine import hand_indices
+from keep_transitions import HAND_KEEPS, NUM_KEEPS
+from optimal_solver import FULL_MASK, NUM_MASKS
+from vector_env import NUM_KEEP_ACTIONS
+from strategies.decision_cache import CachedStrategy, is_score_independent
+
+# Strategies compiled into dense decision tables.
+#
+# The table has no upper-subtotal axis, so only strategies that decide from
+# the dice, the open categories and the roll number can be compiled: those
+# marked @score_independent, which covers the heuristics under strategies/.
+# The optimal strategy reads the upper subtotal and is refused (its value
+# table already is its policy). Probing a strategy on each sorted hand for
+# every filled mask and roll gives
+#
+#   actions[mask, roll_num, hand]   int8, shape (8192, 3, 252)
+#     0-31   hold the dice of the sorted hand selected by this bitmask, reroll the rest
+#     32-44  score category action - 32
+#
+# (the same action numbering as vector_env). A PolicyTable plays as a scalar
+# strategy function, as a BatchSimulator policy, and through turn_actions as
+# an exact_distribution player.
+#
+#   table = compile_policy(yahtzee_focus_strategy)
+#   table.save('results/yahtzee_focus_policy.npy')
+#   simulator.run_monte_carlo(PolicyTable.load('results/yahtzee_focus_policy.npy'), 10000)
+#
+# Tables are built on the sorted hand, so they play like
+# CachedStrategy(strategy, canonical=True): exact for strategies marked
+# sorted_hand_strategy, while order-dependent tie-breaks and anything
+# remembered from earlier rolls of the turn are lost.
+
+HOLD_ALL = NUM_KEEP_ACTIONS - 1
+POLICY_DTYPE = np.int8
+_DIE_BITS = 1 << np.arange(5)
+
+def _hold_mask(hand, reroll_positions):
+    # Bitmask of the held dice, holding the first copies of each kept value
+    kept = [d for i, d in enumerate(hand) if i not in reroll_positions]
+    mask = 0
+    for i, die in enumerate(hand):
+        if die in kept:
+            kept.remove(die)
+            mask |= 1 << i
+    return mask
+
+def probe_actions(cache, mask):
+    """
+    (3, 252) table actions of a CachedStrategy for filled mask, probed on
+    every sorted hand at each roll. Shared by compile_policy and
+    exact_distribution.StrategyActions.
+    """
+    open_mask = FULL_MASK & ~mask
+    rows = np.zeros((3, NUM_HANDS), dtype=POLICY_DTYPE)
+    for roll_num in range(3):
+        for h, hand in enumerate(HANDS):
+            action, value = cache.probe(open_mask, roll_num, (hand,))
+            if action == 'score':
+                rows[roll_num, h] = NUM_KEEP_ACTIONS + CATEGORY_INDEX[value]
+            elif roll_num == 2:
+                raise ValueError(f"{cache.__name__} asked for a third reroll")
+            else:
+                rows[roll_num, h] = _hold_mask(hand, value)
+    return rows
+
+def _probe_rows(task):
+    # Worker entry point: (3, 252) action rows for a batch of filled masks
+    cache, masks = task
+    return np.stack([probe_actions(cache, mask) for mask in masks])
+
+def compile_policy(strategy_function, workers=None, batch_size=256, progress=False):
+    """
+    PolicyTable of a deterministic (dice, scorecard, simulator) strategy,
+    probed on every sorted hand, filled mask and roll. About six million
+    probes, spread over a process pool of workers (workers=1 runs in-process).
+    Raises ValueError unless the strategy is marked @score_independent.
+    """
+    cache = CachedStrategy(strategy_function, maxsize=0, canonical=True)
+    masks = list(range(FULL_MASK))
+    tasks = [(cache, masks[i:i + batch_size]) for i in range(0, len(masks), batch_size)]
+    actions = np.full((NUM_MASKS, 3, NUM_HANDS), -1, dtype=POLICY_DTYPE)
+    if workers == 1:
+        results = map(_probe_rows, tasks)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(_probe_rows, tasks)
+    try:
+        for n, ((_, batch), rows) in enumerate(zip(tasks, results)):
+            actions[batch] = rows
+            if progress:
+                print(f"Probed {min((n + 1) * batch_size, len(masks))}/{len(masks)} masks")
+    finally:
+        if workers != 1:
+            pool.shutdown()
+    return PolicyTable(actions, name=getattr(strategy_function, '__name__', None))
+
+class PolicyTable:
+    """
+    Table-driven player for a compiled policy. Callable as a strategy
+    function; batch_policy() gives the BatchSimulator counterpart. Holding
+    all five dice ends the turn's rerolls in both engines, and the hand is
+    then scored with the roll 2 decision.
+    """
+    sorted_hand_only = True
+    score_independent = True
+
+    def __init__(self, actions, name=None, path=None):
+        self.actions = actions
+        self.path = path
+        self.__name__ = f"policy_table({name})" if name else 'policy_table'
+
+    def save(self, path):
+        np.save(path, np.asarray(self.actions))
+        self.path = path
+        return path
+
+    @classmethod
+    def load(cls, path, mmap=True, name=None):
+        actions = np.load(path, mmap_mode='r' if mmap else None)
+        if actions.shape != (NUM_MASKS, 3, NUM_HANDS):
+            raise ValueError(f"{path} is not a policy table")
+        return cls(actions, name or os.path.splitext(os.path.basename(path))[0], path)
+
+    def __getstate__(self):
+        # A saved table travels to workers as its path and is memory-mapped there
+        state = dict(self.__dict__)
+        if self.path is not None:
+            state['actions'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.actions is None:
+            self.actions = np.load(self.path, mmap_mode='r')
+
+    def action(self, mask, roll_num, hand_idx):
+        return int(self.actions[mask, roll_num, hand_idx])
+
+    def __call__(self, dice, scorecard, simulator):
+        mask = 0
+        for i, cat in enumerate(CATEGORIES):
+            if scorecard[cat] is not None:
+                mask |= 1 << i
+        table = self.actions[mask]
+        for roll_num in range(3):
+            order = sorted(range(5), key=dice.__getitem__)
+            action = int(table[roll_num, HAND_INDEX[tuple(dice[i] for i in order)]])
+            if action >= NUM_KEEP_ACTIONS:
+                return CATEGORIES[action - NUM_KEEP_ACTIONS], dice
+            if action == HOLD_ALL:
+                break
+            dice = list(simulator.hand.reroll(sorted(order[i] for i in range(5) if not action >> i & 1)))
+        action = int(table[2, HAND_INDEX[tuple(sorted(dice))]])
+        return CATEGORIES[action - NUM_KEEP_ACTIONS], dice
+
+    def batch_policy(self):
+        return PolicyTableBatchPolicy(self.actions)
+
+    def turn_actions(self, mask, uppers):
+        """(3, len(uppers), 252) actions in exact_distribution's numbering (keep index or NUM_KEEPS + category)."""
+        table = np.asarray(self.actions[mask], dtype=np.int64)
+        scoring = table >= NUM_KEEP_ACTIONS
+        hands = np.broadcast_to(np.arange(NUM_HANDS), table.shape)
+        keeps = HAND_KEEPS[hands, np.where(scoring, 0, table)]
+        actions = np.where(scoring, NUM_KEEPS + table - NUM_KEEP_ACTIONS, keeps)
+        # Holding everything ends the rerolls; the hand is scored by the roll 2 decision
+        for roll_num in (0, 1):
+            actions[roll_num] = np.where(table[roll_num] == HOLD_ALL, actions[2], actions[roll_num])
+        return np.broadcast_to(actions[:, None, :], (3, len(uppers), NUM_HANDS))
+
+class PolicyTableBatchPolicy:
+    """BatchSimulator policy reading keeps and categories off a compiled table."""
+    def __init__(self, actions):
+        self.actions = actions
+
+    def _lookup(self, sim, roll_num):
+        filled = (~sim.open_categories()) @ (1 << np.arange(NUM_CATEGORIES))
+        return self.actions[filled, roll_num, hand_indices(sim.dice)].astype(np.intp)
+
+    def keep(self, sim, roll_num):
+        if roll_num == 0:
+            self.stop_roll = np.full(sim.num_games, 2)
+        action = self._lookup(sim, roll_num)
+        scoring = action >= NUM_KEEP_ACTIONS
+        # Rows that score now hold everything, which stops their rerolls; choose() then asks this roll
+        self.stop_roll = np.where(sim.rolling & scoring, roll_num, self.stop_roll)
+        held = np.where(scoring, HOLD_ALL, action)
+        # Bits refer to the sorted dice; map them back to positions (stable, so ties keep the first copies)
+        order = np.argsort(sim.dice, axis=1, kind='stable')
+        keep = np.zeros(sim.dice.shape, dtype=bool)
+        np.put_along_axis(keep, order, (held[:, None] & _DIE_BITS) > 0, axis=1)
+        return keep
+
+    def choose(self, sim):
+        stop_roll = getattr(self, 'stop_roll', np.full(sim.num_games, 2))
+        filled = (~sim.open_categories()) @ (1 << np.arange(NUM_CATEGORIES))
+        action = self.actions[filled, stop_roll, hand_indices(sim.dice)].astype(np.intp)
+        self.stop_roll = np.full(sim.num_games, 2)
+        return action - NUM_KEEP_ACTIONS
+
+def diff_policies(table_a, table_b):
+    """
+    States where two compiled policies decide differently, as arrays
+    (masks, roll_nums, hands, actions_a, actions_b), ordered by mask.
+    """
+    a = np.asarray(getattr(table_a, 'actions', table_a))
+    b = np.asarray(getattr(table_b, 'actions', table_b))
+    # The full mask is never played
+    differ = a[:FULL_MASK] != b[:FULL_MASK]
+    masks, roll_nums, hands = np.nonzero(differ)
+    return masks, roll_nums, hands, a[masks, roll_nums, hands], b[masks, roll_nums, hands]
+
+def describe_action(action, hand_idx):
+    """Readable form of one table action on a sorted hand."""
+    if action >= NUM_KEEP_ACTIONS:
+        return f"score {CATEGORIES[action - NUM_KEEP_ACTIONS]}"
+    held = [d for i, d in enumerate(HANDS[hand_idx]) if action >> i & 1]
+    return f"hold {held}" if held else "reroll all"
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Compile strategies into policy tables and compare them.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    compile_parser = commands.add_parser('compile', help="compile a registered strategy")
+    compile_parser.add_argument('strategy')
+    compile_parser.add_argument('--output', default=None, help="table path (default results/<name>_policy.npy)")
+    compile_parser.add_argument('--workers', type=int, default=None)
+    diff_parser = commands.add_parser('diff', help="decisions on which two tables disagree")
+    diff_parser.add_argument('table_a')
+    diff_parser.add_argument('table_b')
+    diff_parser.add_argument('--show', type=int, default=20, help="disagreements to print")
+    args = parser.parse_args(argv)
+
+    if args.command == 'compile':
+        from strategies import registry
+        if args.strategy not in registry:
+            parser.error(f"unknown strategy: {args.strategy}")
+        output = args.output or os.path.join('results', f"{args.strategy.lower().replace(' ', '_')}_policy.npy")
+        strategy = registry[args.strategy]
+        if not is_score_independent(strategy):
+            parser.error(f"{args.strategy} reads the scores already entered, which a policy table cannot hold")
+        table = compile_policy(strategy, workers=args.workers, progress=True)
+        print(f"Saved policy table to {table.save(output)}")
+    else:
+        masks, roll_nums, hands, actions_a, actions_b = diff_policies(PolicyTable.load(args.table_a), PolicyTable.load(args.table_b))
+        total = FULL_MASK * 3 * NUM_HANDS
+        print(f"{len(masks)} of {total} decisions differ ({len(masks) / total:.1%})")
+        for roll_num in range(3):
+            print(f"  roll {roll_num}: {int((roll_nums == roll_num).sum())}")
+        for mask, roll_num, hand, a, b in list(zip(masks, roll_nums, hands, actions_a, actions_b))[:args.show]:
+            open_categories = [cat for i, cat in enumerate(CATEGORIES) if not mask >> i & 1]
+            print(f"{HANDS[hand]} roll {roll_num}, open {open_categories}: "
+                  f"{describe_action(a, hand)} vs {describe_action(b, hand)}")
+
+if __name__ == "__main__":
+    main()
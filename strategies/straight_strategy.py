@@ -1,6 +1,8 @@
 from collections import Counter
 import random
+from strategies.decision_cache import score_independent
 
+@score_independent
 def straight_strategy(dice, scorecard, simulator):
     """
     A Yahtzee strategy that prios looking for straights
@@ -2,6 +2,7 @@ import random
 from collections import Counter
 from scoreboard import YahtzeeScorer # Assuming YahtzeeScorer is accessible
 from dice_rolling import YahtzeeHand # May need hand methods
+from strategies.decision_cache import score_independent
 
 def get_straight_length(dice):
     """Helper to find the length of the longest straight in a set of dice."""
@@ -21,69 +22,77 @@ def get_straight_length(dice):
         max_len = max(max_len, current_len)
     return max_len
 
-def find_best_initial_target(dice, available_categories):
-    """Analyzes the initial dice roll to pick a target category."""
-    counts = Counter(dice)
-    sorted_dice = sorted(dice)
-    straight_len = get_straight_length(dice)
-    
-    # Priority: Check for best potential based on initial roll
-    
-    # 1. Yahtzee?
+# Targets checked against the initial roll, first match wins
+TARGET_PRIORITY = ('yahtzee', 'large_straight', 'four_of_a_kind', 'full_house',
+                   'small_straight', 'three_of_a_kind', 'upper')
+
+# Chance target: keep dice showing at least this value
+CHANCE_KEEP_MIN = 4
+
+def _target_yahtzee(counts, straight_len, available_categories):
     if 5 in counts.values() and 'yahtzee' in available_categories:
         return 'yahtzee'
-        
-    # 2. Large Straight?
+
+def _target_large_straight(counts, straight_len, available_categories):
     if straight_len >= 5 and 'large_straight' in available_categories:
         return 'large_straight'
-        
-    # 3. Four of a Kind?
+
+def _target_four_of_a_kind(counts, straight_len, available_categories):
     if 4 in counts.values() and 'four_of_a_kind' in available_categories:
         return 'four_of_a_kind'
-        
-    # 4. Full House?
-    has_triple = False
-    has_pair = False
-    triple_val = -1
-    for num, count in counts.items():
-        if count == 3:
-            has_triple = True
-            triple_val = num
-        if count == 2:
-            has_pair = True
+
+def _target_full_house(counts, straight_len, available_categories):
+    has_triple = 3 in counts.values()
+    has_pair = 2 in counts.values()
     if has_triple and has_pair and 'full_house' in available_categories:
         return 'full_house'
 
-    # 5. Small Straight?
+def _target_small_straight(counts, straight_len, available_categories):
     if straight_len >= 4 and 'small_straight' in available_categories:
         return 'small_straight'
 
-    # 6. Three of a Kind?
+def _target_three_of_a_kind(counts, straight_len, available_categories):
     if 3 in counts.values() and 'three_of_a_kind' in available_categories:
-        # Also consider if this triple could lead to a better FH or 4oak
-        if 'full_house' in available_categories or 'four_of_a_kind' in available_categories:
-             # Maybe prioritize keeping the triple for those? Let's stick to 3oak for now if it's the best direct match.
-             pass 
         return 'three_of_a_kind'
 
-    # 7. Upper Section - Prioritize higher numbers or most numerous
+def _target_upper(counts, straight_len, available_categories):
+    # Upper Section - Prioritize higher numbers or most numerous
+    upper_categories = ['ones', 'twos', 'threes', 'fours', 'fives', 'sixes']
+    best_upper_target = None
+    best_upper_count = 0
+    # Find the available upper category with the most dice already present
+    for i in range(6, 0, -1): # Check 6s down to 1s
+        cat_name = upper_categories[i-1]
+        if cat_name in available_categories:
+            current_count = counts.get(i, 0)
+            if current_count > best_upper_count:
+                best_upper_count = current_count
+                best_upper_target = cat_name
+    return best_upper_target
+
+TARGET_RULES = {
+    'yahtzee': _target_yahtzee,
+    'large_straight': _target_large_straight,
+    'four_of_a_kind': _target_four_of_a_kind,
+    'full_house': _target_full_house,
+    'small_straight': _target_small_straight,
+    'three_of_a_kind': _target_three_of_a_kind,
+    'upper': _target_upper,
+}
+
+def find_best_initial_target(dice, available_categories, priority=TARGET_PRIORITY):
+    """Analyzes the initial dice roll to pick a target category, trying the rules in priority order."""
+    counts = Counter(dice)
+    straight_len = get_straight_length(dice)
+
+    for rule in priority:
+        target = TARGET_RULES[rule](counts, straight_len, available_categories)
+        if target:
+            return target
+
+    # Fallback: Chance or just pick one if nothing else fits
     upper_categories = ['ones', 'twos', 'threes', 'fours', 'fives', 'sixes']
     available_upper = [cat for cat in available_categories if cat in upper_categories]
-    if available_upper:
-        best_upper_target = None
-        best_upper_count = 0
-        # Find the available upper category with the most dice already present
-        for i in range(6, 0, -1): # Check 6s down to 1s
-            cat_name = upper_categories[i-1]
-            if cat_name in available_upper:
-                current_count = counts.get(i, 0)
-                if current_count > best_upper_count:
-                    best_upper_count = current_count
-                    best_upper_target = cat_name
-        if best_upper_target and best_upper_count > 0: # Found a reasonable upper target
-             return best_upper_target
-
-    # 8. Fallback: Chance or just pick one if nothing else fits
     if 'chance' in available_categories:
         return 'chance'
     elif available_categories:
@@ -93,11 +102,32 @@ def find_best_initial_target(dice, available_categories):
     else:
         return 'chance' # Should not happen
 
+@score_independent
 def tunnel_vision_strategy(dice, scorecard, simulator):
     """
     A Yahtzee strategy that picks a target based on the initial roll,
     then rerolls specifically for that target.
     """
+    return play_tunnel_vision(dice, scorecard, simulator)
+
+class TunnelVisionStrategy:
+    """
+    Tunable tunnel vision: target_priority orders the TARGET_RULES tried on the
+    initial roll (rules left out are never targeted) and chance_keep_min is the
+    lowest die kept when going for chance. The defaults reproduce
+    tunnel_vision_strategy exactly. Instances pickle, so they run in process pools.
+    """
+    score_independent = True
+
+    def __init__(self, target_priority=TARGET_PRIORITY, chance_keep_min=CHANCE_KEEP_MIN):
+        self.target_priority = tuple(target_priority)
+        self.chance_keep_min = chance_keep_min
+        self.__name__ = f"tunnel_vision(target_priority={self.target_priority}, chance_keep_min={chance_keep_min})"
+
+    def __call__(self, dice, scorecard, simulator):
+        return play_tunnel_vision(dice, scorecard, simulator, self.target_priority, self.chance_keep_min)
+
+def play_tunnel_vision(dice, scorecard, simulator, target_priority=TARGET_PRIORITY, chance_keep_min=CHANCE_KEEP_MIN):
     available_categories = [cat for cat, score in scorecard.items() if score is None]
     straight_categories = ['small_straight', 'large_straight']
     available_straight = [cat for cat in available_categories if cat in straight_categories]
@@ -108,7 +138,7 @@ def tunnel_vision_strategy(dice, scorecard, simulator):
     
     # --- Determine Target Category based on Initial Roll ---
     initial_dice = list(dice) # The dice state *before* any rerolls in this turn
-    target_category = find_best_initial_target(initial_dice, available_categories)
+    target_category = find_best_initial_target(initial_dice, available_categories, target_priority)
 
     # --- Rerolling Logic - Focused on the Target Category ---
     for roll_num in range(2): # Perform up to two rerolls
@@ -198,7 +228,7 @@ def tunnel_vision_strategy(dice, scorecard, simulator):
 
         elif target_category == 'chance':
             # Keep high dice (e.g., 4, 5, 6)
-            keep_indices = [i for i, die in enumerate(initial_dice) if die >= 4]
+            keep_indices = [i for i, die in enumerate(initial_dice) if die >= chance_keep_min]
 
 
         # --- Perform Reroll ---
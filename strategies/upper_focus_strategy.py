@@ -1,7 +1,9 @@
 import random
 from collections import Counter
 from scoreboard import YahtzeeScorer
+from strategies.decision_cache import score_independent
 
+@score_independent
 def upper_focus_strategy(dice, scorecard, simulator):
     """
     A Yahtzee strategy that prioritizes scoring in the upper section categories
@@ -1,7 +1,10 @@
 import random
 from collections import Counter
 from scoreboard import YahtzeeScorer # Assuming YahtzeeScorer is accessible
+from strategies.decision_cache import sorted_hand_strategy
 
+# Never holds any dice (see batch_strategies), so the order of the dice cannot matter
+@sorted_hand_strategy
 def yahtzee_focus_strategy(dice, scorecard, simulator):
     """
     A Yahtzee strategy that aggressively tries to roll a Yahtzee.
@@ -0,0 +1,165 @@
+import math
+import numpy as np
+from statistics import NormalDist
+
+def half_width(stdev, count, confidence=0.95):
+    """Half-width of the normal confidence interval for the mean of count scores with standard deviation stdev."""
+    if count < 2:
+        return float('inf')
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    return z * stdev / math.sqrt(count)
+
+class RunningStats:
+    """
+    Welford running mean/variance over a stream of scores, in O(1) memory.
+    Two accumulators can be merged (Chan et al.), e.g. across workers.
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def update(self, values):
+        # Batch statistics in NumPy, folded in with merge
+        values = np.asarray(values)
+        if values.size == 0:
+            return
+        batch = RunningStats()
+        batch.count = int(values.size)
+        batch.mean = float(values.mean())
+        batch.m2 = float(np.square(values - batch.mean).sum())
+        batch.min, batch.max = values.min().item(), values.max().item()
+        self.merge(batch)
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.min, self.max = other.count, other.mean, other.m2, other.min, other.max
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else float('nan')
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+    def half_width(self, confidence=0.95):
+        """Half-width of the normal confidence interval for the mean."""
+        return half_width(self.stdev, self.count, confidence)
+
+# Upper bound for ScoreHistogram. This repo's rules top out at 375 (no
+# Yahtzee bonus); 1575 also covers standard rules with Yahtzee bonuses.
+MAX_SCORE = 1575
+
+class ScoreHistogram:
+    """
+    Exact summary of a stream of integer scores: an int64 count per score in
+    0..max_score. Mean, variance, quantiles, min and max are exact, memory is
+    fixed, and histograms from different workers add together with merge().
+    """
+    def __init__(self, max_score=MAX_SCORE):
+        self.counts = np.zeros(max_score + 1, dtype=np.int64)
+
+    @property
+    def max_score(self):
+        return len(self.counts) - 1
+
+    def add(self, value):
+        self.counts[value] += 1
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.int64)
+        if values.size == 0:
+            return
+        if values.min() < 0 or values.max() > self.max_score:
+            raise ValueError(f"Scores must lie in 0..{self.max_score}")
+        self.counts += np.bincount(values, minlength=len(self.counts))
+
+    def merge(self, other):
+        if len(other.counts) > len(self.counts):
+            self.counts = np.concatenate([self.counts, np.zeros(len(other.counts) - len(self.counts), dtype=np.int64)])
+        self.counts[:len(other.counts)] += other.counts
+        return self
+
+    @property
+    def count(self):
+        return int(self.counts.sum())
+
+    def _sums(self):
+        # Exact integer sums of scores and squared scores
+        scores = np.arange(len(self.counts), dtype=np.int64)
+        return int(self.counts @ scores), int(self.counts @ (scores * scores))
+
+    @property
+    def mean(self):
+        count = self.count
+        return self._sums()[0] / count if count else float('nan')
+
+    @property
+    def variance(self):
+        count = self.count
+        if count < 2:
+            return float('nan')
+        total, total_sq = self._sums()
+        return (count * total_sq - total * total) / (count * (count - 1))
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self):
+        nonzero = np.flatnonzero(self.counts)
+        return int(nonzero[0]) if len(nonzero) else None
+
+    @property
+    def max(self):
+        nonzero = np.flatnonzero(self.counts)
+        return int(nonzero[-1]) if len(nonzero) else None
+
+    def _score_at_rank(self, rank, cumulative):
+        # Score of the rank-th smallest game (0-based)
+        return int(np.searchsorted(cumulative, rank, side='right'))
+
+    def quantile(self, q):
+        """q-quantile with linear interpolation between ranks, as numpy.quantile's default."""
+        count = self.count
+        if count == 0:
+            return float('nan')
+        cumulative = np.cumsum(self.counts)
+        position = q * (count - 1)
+        low = math.floor(position)
+        low_score = self._score_at_rank(low, cumulative)
+        high_score = self._score_at_rank(min(low + 1, count - 1), cumulative)
+        return low_score + (high_score - low_score) * (position - low)
+
+    @property
+    def median(self):
+        return self.quantile(0.5)
+
+    def half_width(self, confidence=0.95):
+        """Half-width of the normal confidence interval for the mean."""
+        return half_width(self.stdev, self.count, confidence)
@@ -0,0 +1,148 @@
+import argparse
+import itertools
+import math
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from head_to_head import play_common_games
+from strategies.multiples_strategy import MultiplesStrategy
+from strategies.tunnel_vision_strategy import TunnelVisionStrategy, TARGET_PRIORITY
+
+# Parameter sweeps over the tunable strategies with successive halving:
+#
+#   settings = param_grid({'min_keep': [2, 3], 'prefer_high': [False, True]})
+#   results = successive_halving(MultiplesStrategy, settings, seed=0)
+#
+# Every setting plays the same dice (common random numbers, via head_to_head's
+# ScriptedHand), so each round compares settings on identical games. After a
+# round the best 1/eta of the settings by mean score survive and play the next,
+# larger block of games on top of the ones they already played.
+
+def param_grid(space):
+    """Every combination of a {name: [values]} space, as a list of keyword dicts."""
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+def param_sample(space, num_settings, seed=None):
+    """num_settings distinct random draws from a {name: [values]} space."""
+    grid = param_grid(space)
+    rng = np.random.default_rng(seed)
+    picks = rng.choice(len(grid), size=min(num_settings, len(grid)), replace=False)
+    return [grid[i] for i in sorted(picks)]
+
+def _block_seed(root, block):
+    # Independent dice stream for each block of games, reproducible from the root's entropy
+    return np.random.SeedSequence(root.entropy, spawn_key=(block,))
+
+def _play_block(task):
+    factory, params, num_games, seed_sequence = task
+    _, scores = play_common_games({'setting': factory(**params)}, num_games, seed_sequence)
+    return scores[0]
+
+def _play_blocks(tasks, workers):
+    if workers == 1:
+        return list(map(_play_block, tasks))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_play_block, tasks))
+
+def successive_halving(factory, settings, initial_games=2000, eta=2, max_games=32000,
+                       seed=None, workers=None, verbose=True):
+    """
+    Successive-halving sweep of factory(**params) over a list of parameter dicts.
+    Round r plays initial_games * eta**r games in total for every surviving
+    setting (capped at max_games) and keeps the best ceil(n / eta) by mean score.
+    Stops when one setting is left or max_games is reached.
+    Returns one dict per setting (params, games, mean_score, std_err, rounds), best first.
+    """
+    if not settings:
+        raise ValueError("successive_halving needs at least one setting")
+    if eta < 2:
+        raise ValueError(f"eta must be at least 2, got {eta}")
+    if initial_games < 1:
+        raise ValueError(f"initial_games must be at least 1, got {initial_games}")
+    if max_games < initial_games:
+        raise ValueError(f"max_games ({max_games}) must be at least initial_games ({initial_games})")
+    # Drawn once, so an unseeded sweep still gives every setting the same dice
+    root = np.random.SeedSequence(seed)
+    scores = [np.zeros(0, dtype=np.int32) for _ in settings]
+    rounds = [0] * len(settings)
+    alive = list(range(len(settings)))
+    played = 0
+    block = 0
+    target = initial_games
+    while True:
+        target = min(target, max_games)
+        size = target - played
+        # One task per surviving setting; all of them replay the same block of dice
+        block_seed = _block_seed(root, block)
+        tasks = [(factory, settings[i], size, block_seed) for i in alive]
+        for i, block_scores in zip(alive, _play_blocks(tasks, workers)):
+            scores[i] = np.concatenate([scores[i], block_scores])
+            rounds[i] += 1
+        played, block = target, block + 1
+
+        means = {i: scores[i].mean() for i in alive}
+        alive.sort(key=lambda i: -means[i])
+        if verbose:
+            print(f"Round {block}: {len(alive)} settings on {played} games, best {means[alive[0]]:.2f} "
+                  f"{settings[alive[0]]}")
+        if len(alive) == 1 or played >= max_games:
+            break
+        alive = alive[:math.ceil(len(alive) / eta)]
+        target = played * eta
+
+    results = [{
+        'params': settings[i],
+        'games': len(scores[i]),
+        'mean_score': float(scores[i].mean()),
+        'std_err': float(scores[i].std(ddof=1) / math.sqrt(len(scores[i]))),
+        'rounds': rounds[i],
+    } for i in range(len(settings))]
+    # Survivors of more rounds rank first, then by mean
+    results.sort(key=lambda r: (-r['rounds'], -r['mean_score']))
+    return results
+
+# Default search spaces for the tunable strategies
+SWEEPS = {
+    'multiples': (MultiplesStrategy, {
+        'min_keep': [1, 2, 3],
+        'prefer_high': [False, True],
+    }),
+    'tunnel_vision': (TunnelVisionStrategy, {
+        'chance_keep_min': [3, 4, 5, 6],
+        'target_priority': [
+            TARGET_PRIORITY,
+            ('yahtzee', 'large_straight', 'small_straight', 'four_of_a_kind', 'full_house', 'three_of_a_kind', 'upper'),
+            ('yahtzee', 'four_of_a_kind', 'full_house', 'large_straight', 'small_straight', 'three_of_a_kind', 'upper'),
+            ('yahtzee', 'large_straight', 'four_of_a_kind', 'full_house', 'small_straight', 'upper', 'three_of_a_kind'),
+        ],
+    }),
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Successive-halving parameter sweep over a tunable strategy.")
+    parser.add_argument('sweep', choices=list(SWEEPS))
+    parser.add_argument('--samples', type=int, default=None, help="random sample of the grid instead of all of it")
+    parser.add_argument('--initial-games', type=int, default=2000)
+    parser.add_argument('--max-games', type=int, default=32000)
+    parser.add_argument('--eta', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+    if args.eta < 2:
+        parser.error("--eta must be at least 2")
+    if args.initial_games < 1:
+        parser.error("--initial-games must be at least 1")
+    if args.max_games < args.initial_games:
+        parser.error("--max-games must be at least --initial-games")
+    if args.samples is not None and args.samples < 1:
+        parser.error("--samples must be at least 1")
+
+    factory, space = SWEEPS[args.sweep]
+    settings = param_grid(space) if args.samples is None else param_sample(space, args.samples, args.seed)
+    results = successive_halving(factory, settings, args.initial_games, args.eta, args.max_games,
+                                 args.seed, args.workers)
+    for result in results:
+        print(f"{result['mean_score']:7.2f} +/- {result['std_err']:.2f}  {result['games']:6d} games  {result['params']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import itertools
+import random
+import numpy as np
+import pytest
+from scoreboard import HAND_INDEX, SCORE_TABLE
+from dice_rolling import YahtzeeHand
+from batch_engine import SCORE_ARRAY, BatchSimulator, hand_indices, run_monte_carlo_batched
+from strategies.batch_strategies import batch_policy_for
+from yahtzee_simulator import YahtzeeSimulator, strategies
+
+PORTED = ['Multiples', 'Multiples+', 'Straights', 'Upper Focus', 'Yahtzee Focus']
+
+def test_hand_indices_match_scalar_lookup():
+    dice = np.array(list(itertools.product(range(1, 7), repeat=5)), dtype=np.int8)
+    expected = [HAND_INDEX[tuple(sorted(d))] for d in dice.tolist()]
+    assert hand_indices(dice).tolist() == expected
+    assert SCORE_ARRAY.tolist() == [list(row) for row in SCORE_TABLE]
+
+def test_total_scores_add_upper_bonus():
+    sim = BatchSimulator(2, seed=0)
+    sim.scorecard[:, :6] = [[3, 6, 9, 12, 15, 18], [0, 0, 0, 0, 0, 0]]
+    sim.upper_total[:] = [63, 0]
+    assert sim.total_scores().tolist() == [63 + 35, 0]
+
+def test_unported_strategies_have_no_policy():
+    assert batch_policy_for(strategies['Tunnel Vision']) is None
+    assert batch_policy_for(strategies['Optimal']) is None
+
+@pytest.mark.parametrize('name', PORTED)
+def test_batched_distribution_matches_scalar(name):
+    batched = run_monte_carlo_batched(batch_policy_for(strategies[name]), 20000, seed=1)
+    simulator = YahtzeeSimulator()
+    simulator.hand = YahtzeeHand(1)
+    random.seed(1)
+    scalar = np.array(simulator.run_monte_carlo(strategies[name], 3000))
+    standard_error = np.sqrt(batched.var() / len(batched) + scalar.var() / len(scalar))
+    assert abs(batched.mean() - scalar.mean()) < 4 * standard_error
+    assert abs(batched.std() / scalar.std() - 1) < 0.1
+
+def test_seeded_batched_runs_repeat():
+    policy = batch_policy_for(strategies['Multiples'])
+    first = run_monte_carlo_batched(policy, 1000, seed=5, batch_size=300)
+    assert np.array_equal(first, run_monte_carlo_batched(policy, 1000, seed=5, batch_size=300))
@@ -0,0 +1,45 @@
+import os
+import random
+import pytest
+import checkpoint
+from checkpoint import CHECKPOINT_EXTENSION, run_checkpointed
+from results_io import load_scores
+from yahtzee_simulator import strategies
+
+STRATEGY = 'Tunnel Vision'
+
+def _run(path, **kwargs):
+    return run_checkpointed(STRATEGY, strategies[STRATEGY], 500, seed=9, output=str(path),
+                            checkpoint_every=200, chunk_size=70, **kwargs)
+
+def test_resume_writes_the_same_file(tmp_path, monkeypatch):
+    uninterrupted = _run(tmp_path / 'whole.bin')
+
+    # Die after the second checkpoint's scores are on disk but before the checkpoint itself is
+    saves = []
+    save_checkpoint = checkpoint.save_checkpoint
+    def crash_on_second(path, state):
+        saves.append(state['games_done'])
+        if len(saves) == 2:
+            raise KeyboardInterrupt
+        save_checkpoint(path, state)
+    monkeypatch.setattr(checkpoint, 'save_checkpoint', crash_on_second)
+    resumed = tmp_path / 'resumed.bin'
+    with pytest.raises(KeyboardInterrupt):
+        _run(resumed)
+    assert os.path.exists(str(resumed) + CHECKPOINT_EXTENSION)
+    monkeypatch.setattr(checkpoint, 'save_checkpoint', save_checkpoint)
+
+    random.seed(12345)  # the resumed run must restore the global random state itself
+    _run(resumed)
+    with open(uninterrupted, 'rb') as a, open(resumed, 'rb') as b:
+        assert a.read() == b.read()
+    assert not os.path.exists(str(resumed) + CHECKPOINT_EXTENSION)
+    _, scores = load_scores(str(resumed))
+    assert len(scores) == 500
+
+def test_checkpoint_of_another_job_is_refused(tmp_path):
+    path = tmp_path / 'scores.bin'
+    checkpoint.save_checkpoint(str(path) + CHECKPOINT_EXTENSION, {'job': {'strategy': 'other'}})
+    with pytest.raises(ValueError):
+        _run(path)
@@ -0,0 +1,49 @@
+import csv
+import random
+import pytest
+from dice_rolling import YahtzeeHand
+from results_io import load_scores
+from yahtzee_simulator import YahtzeeSimulator, main, run_monte_carlo_parallel, strategies
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def _seeded_scores(name, games, seed):
+    simulator = YahtzeeSimulator()
+    simulator.hand = YahtzeeHand(seed)
+    random.seed(seed)
+    return simulator.run_monte_carlo(strategies[name], games)
+
+def test_binary_scores_with_metadata(workdir):
+    main(['--strategies', 'Multiples', 'Straights', '--games', '40', '--seed', '2', '--no-cache'])
+    metadata, scores = load_scores(str(workdir / 'results' / 'Multiples_scores.bin'))
+    assert scores.tolist() == _seeded_scores('Multiples', 40, 2)
+    assert (metadata['strategy'], metadata['seed'], metadata['engine']) == ('Multiples', 2, 'scalar')
+    assert (workdir / 'results' / 'Straights_scores.bin').exists()
+
+def test_csv_format(workdir):
+    main(['--strategies', 'Upper Focus', '--games', '25', '--seed', '1', '--format', 'csv', '--no-cache'])
+    with open(workdir / 'results' / 'Upper Focus_scores.csv', newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['score'] and [int(row[0]) for row in rows[1:]] == _seeded_scores('Upper Focus', 25, 1)
+
+def test_parallel_engine(workdir):
+    main(['--strategies', 'Multiples', '--games', '30', '--seed', '4', '--engine', 'parallel', '--workers', '1',
+          '--no-cache'])
+    _, scores = load_scores(str(workdir / 'results' / 'Multiples_scores.bin'))
+    assert scores.tolist() == run_monte_carlo_parallel(strategies['Multiples'], 30, workers=1, seed=4)
+
+def test_batched_summary_only(workdir, capsys):
+    main(['--strategies', 'Yahtzee Focus', '--games', '500', '--engine', 'batched', '--summary-only'])
+    assert 'Yahtzee Focus Results:' in capsys.readouterr().out
+    assert not (workdir / 'results').exists()
+
+def test_rejects_bad_options():
+    with pytest.raises(SystemExit):
+        main(['--strategies', 'No Such Strategy'])
+    with pytest.raises(SystemExit):
+        main(['--strategies', 'Tunnel Vision', '--engine', 'batched'])
+    with pytest.raises(SystemExit):
+        main(['--format', 'parquet'])
@@ -0,0 +1,49 @@
+import pickle
+import random
+import pytest
+from dice_rolling import YahtzeeHand
+from yahtzee_simulator import YahtzeeSimulator, strategies
+from strategies.decision_cache import CachedStrategy, is_score_independent, is_sorted_hand_strategy
+
+def _scores(strategy_function, games=300, seed=6):
+    simulator = YahtzeeSimulator()
+    simulator.hand = YahtzeeHand(seed)
+    random.seed(seed)
+    return simulator.run_monte_carlo(strategy_function, games)
+
+def test_cached_strategy_reproduces_the_strategy():
+    cached = CachedStrategy(strategies['Multiples'])
+    assert _scores(cached) == _scores(strategies['Multiples'])
+    info = cached.cache_info()
+    assert info.hits > 0 and info.misses > 0
+
+def test_sorted_hand_strategy_keys_on_sorted_dice():
+    strategy = strategies['Yahtzee Focus']
+    assert is_sorted_hand_strategy(strategy)
+    cached = CachedStrategy(strategy)
+    assert cached.canonical
+    assert _scores(cached) == _scores(strategy)
+
+def test_history_reproduces_turn_memory():
+    strategy = strategies['Upper Focus']
+    assert _scores(CachedStrategy(strategy, history=True)) == _scores(strategy)
+
+def test_probe_answers_one_question():
+    cached = CachedStrategy(strategies['Yahtzee Focus'], canonical=True)
+    open_mask = (1 << 13) - 1
+    assert cached.probe(open_mask, 2, ((6, 6, 6, 6, 6),)) == ('score', 'yahtzee')
+    action, _ = cached.probe(open_mask, 0, ((1, 2, 3, 4, 6),))
+    assert action in ('reroll', 'score')
+
+def test_pickles_without_its_cache():
+    cached = CachedStrategy(strategies['Multiples'])
+    _scores(cached, games=20)
+    copy = pickle.loads(pickle.dumps(cached))
+    assert copy.cache_info().currsize == 0
+    assert _scores(copy, games=50) == _scores(strategies['Multiples'], games=50)
+
+def test_refuses_strategies_that_read_scores():
+    assert all(is_score_independent(strategies[name]) for name in strategies if name != 'Optimal')
+    assert not is_score_independent(strategies['Optimal'])
+    with pytest.raises(ValueError):
+        CachedStrategy(strategies['Optimal'])
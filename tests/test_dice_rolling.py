@@ -0,0 +1,26 @@
+import pickle
+from dice_rolling import BufferedDice, YahtzeeHand
+
+def test_state_round_trip_across_refills():
+    dice = BufferedDice(seed=7, buffer_size=16)
+    dice.draw(13)
+    state = pickle.loads(pickle.dumps(dice.getstate()))
+    expected = [dice.draw(5) for _ in range(20)]
+    resumed = BufferedDice(seed=99, buffer_size=16)
+    resumed.setstate(state)
+    assert [resumed.draw(5) for _ in range(20)] == expected
+
+def test_seeded_stream_is_reproducible():
+    first, second = BufferedDice(seed=3), BufferedDice(seed=3)
+    assert [first.draw(5) for _ in range(1000)] == [second.draw(5) for _ in range(1000)]
+    assert all(1 <= face <= 6 for face in BufferedDice(seed=4).draw(5000))
+
+def test_reroll_only_draws_for_valid_positions():
+    hand = YahtzeeHand(seed=1)
+    dice = list(hand.roll_all())
+    state = hand.source.getstate()
+    hand.reroll([1, 7, -1, 3])
+    assert [hand.dice[i] for i in (0, 2, 4)] == [dice[i] for i in (0, 2, 4)]
+    source = BufferedDice()
+    source.setstate(state)
+    assert [hand.dice[1], hand.dice[3]] == source.draw(2)
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from scoreboard import NUM_CATEGORIES, NUM_HANDS, UPPER_BONUS, UPPER_BONUS_THRESHOLD
+from batch_engine import SCORE_ARRAY
+from keep_transitions import HAND_KEEPS, INITIAL_ROLL
+from exact_distribution import (SCORE_ACTION, ScoreDistribution, StrategyActions, exact_score_distribution,
+                                turn_outcomes)
+from yahtzee_simulator import strategies, summarize_scores
+
+class ScoreFirstOpen:
+    """Scores the first open category on the initial roll."""
+    def turn_actions(self, mask, uppers):
+        category = next(c for c in range(NUM_CATEGORIES) if not mask >> c & 1)
+        return np.full((3, len(uppers), NUM_HANDS), SCORE_ACTION + category)
+
+def test_turn_outcomes_are_distributions():
+    rng = np.random.default_rng(0)
+    keeps = HAND_KEEPS[np.arange(NUM_HANDS), rng.integers(0, 32, size=(2, 4, NUM_HANDS))]
+    actions = np.concatenate([keeps, rng.integers(0, NUM_CATEGORIES, size=(1, 4, NUM_HANDS)) + SCORE_ACTION])
+    outcomes = turn_outcomes(actions)
+    assert outcomes.shape == (4, NUM_CATEGORIES, NUM_HANDS)
+    assert outcomes.sum(axis=(1, 2)) == pytest.approx(np.ones(4))
+
+def test_rerolling_everything_keeps_the_roll_distribution():
+    # Keep index of the empty keep, then score chance
+    empty = HAND_KEEPS[:, 0]
+    actions = np.stack([np.broadcast_to(empty, (1, NUM_HANDS))] * 2 + [np.full((1, NUM_HANDS), SCORE_ACTION + 12)])
+    assert turn_outcomes(actions)[0, 12] == pytest.approx(INITIAL_ROLL)
+
+def test_exact_mean_of_a_fixed_order_player():
+    distribution = exact_score_distribution(ScoreFirstOpen())
+    assert distribution.pmf.sum() == pytest.approx(1)
+    # Each category is scored on one roll; the upper bonus needs the six upper scores to reach 63
+    expected = sum(INITIAL_ROLL @ SCORE_ARRAY[:, c] for c in range(NUM_CATEGORIES))
+    upper = np.array([1.0])
+    for c in range(6):
+        points = np.bincount(SCORE_ARRAY[:, c], weights=INITIAL_ROLL)
+        upper = np.convolve(upper, points)
+    expected += UPPER_BONUS * upper[UPPER_BONUS_THRESHOLD:].sum()
+    assert distribution.mean() == pytest.approx(expected)
+
+def test_probed_actions_are_valid():
+    actions = StrategyActions(strategies['Yahtzee Focus'])
+    mask = 0b0000011110000
+    rows = actions.probe_actions(mask)
+    assert rows.shape == (3, NUM_HANDS)
+    scoring = rows >= SCORE_ACTION
+    assert scoring[2].all()
+    assert not any(mask >> c & 1 for c in (rows[scoring] - SCORE_ACTION).tolist())
+    for roll_num in (0, 1):
+        for h in np.flatnonzero(~scoring[roll_num]).tolist():
+            assert rows[roll_num, h] in HAND_KEEPS[h]
+
+def test_score_distribution_summary():
+    pmf = np.zeros(11)
+    pmf[[2, 4, 10]] = [0.25, 0.5, 0.25]
+    distribution = ScoreDistribution(pmf)
+    assert distribution.mean() == pytest.approx(5)
+    assert (distribution.median(), distribution.min_score(), distribution.max_score()) == (4, 2, 10)
+    assert distribution.quantile(0.8) == 10
+
+def test_summary_median_interpolates_like_the_histogram():
+    # An even split has the midpoint median, as summarize_scores gives for the matching sample
+    pmf = np.zeros(11)
+    pmf[[3, 6, 10]] = [0.25, 0.25, 0.5]
+    sample = [3] * 250 + [6] * 250 + [10] * 500
+    assert ScoreDistribution(pmf).summary()['median_score'] == summarize_scores(sample)['median_score'] == 8
+    assert ScoreDistribution(pmf).quantile(0.25) == pytest.approx(np.quantile(sample * 100, 0.25), abs=0.01)
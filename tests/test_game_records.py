@@ -0,0 +1,39 @@
+import random
+import numpy as np
+import pytest
+from scoreboard import CATEGORIES
+from dice_rolling import YahtzeeHand
+from game_records import GameRecords
+from yahtzee_simulator import YahtzeeSimulator, strategies
+
+def _simulator(seed):
+    simulator = YahtzeeSimulator()
+    simulator.hand = YahtzeeHand(seed)
+    random.seed(seed)
+    return simulator
+
+@pytest.fixture(scope='module')
+def records():
+    return _simulator(9).run_monte_carlo_capture(strategies['Multiples'], 200)
+
+def test_capture_matches_monte_carlo(records):
+    assert records.total_score.tolist() == _simulator(9).run_monte_carlo(strategies['Multiples'], 200)
+    bonus = np.where(records.upper_bonus, 35, 0)
+    assert (records.category_scores.sum(axis=1) + bonus == records.total_score).all()
+    assert (np.sort(records.fill_turn, axis=1) == np.arange(13)).all()
+
+def test_save_load_round_trip(records, tmp_path):
+    path = str(tmp_path / 'records.npz')
+    records.save(path)
+    loaded = GameRecords.load(path)
+    assert loaded.num_games == records.num_games
+    for column in ('category_scores', 'fill_turn', 'upper_bonus', 'total_score'):
+        assert np.array_equal(getattr(loaded, column), getattr(records, column))
+
+def test_diagnostics_match_the_scores(records):
+    games = records.category_scores.tolist()
+    for i, category in enumerate(CATEGORIES):
+        assert records.zero_rate()[category] == pytest.approx(sum(game[i] == 0 for game in games) / len(games))
+        assert records.mean_category_scores()[category] == pytest.approx(sum(game[i] for game in games) / len(games))
+    assert sum(records.mean_fill_turn().values()) == pytest.approx(sum(range(13)))
+    assert records.bonus_rate() == pytest.approx(np.mean([sum(game[:6]) >= 63 for game in games]))
@@ -0,0 +1,38 @@
+import random
+import numpy as np
+import pytest
+from dice_rolling import YahtzeeHand
+from game_state import GameState, ScorecardView, as_state_strategy
+from optimal_solver import NUM_MASKS, UPPER_STATES, OptimalPolicy
+from strategies import optimal_strategy as optimal_module
+from yahtzee_simulator import YahtzeeSimulator, strategies
+
+def _simulator(seed):
+    simulator = YahtzeeSimulator()
+    simulator.hand = YahtzeeHand(seed)
+    random.seed(seed)
+    return simulator
+
+@pytest.mark.parametrize('name', ['Multiples', 'Straights', 'Upper Focus', 'Yahtzee Focus', 'Tunnel Vision'])
+def test_state_engine_matches_monte_carlo(name):
+    assert _simulator(12).run_monte_carlo_state(strategies[name], 200) == \
+        _simulator(12).run_monte_carlo(strategies[name], 200)
+
+def test_state_strategy_matches_dict_strategy(monkeypatch):
+    # Any value table will do; both optimal variants read the same policy
+    values = np.random.default_rng(1).random((NUM_MASKS, UPPER_STATES)).astype(np.float32) * 50
+    monkeypatch.setattr(optimal_module, '_policy', OptimalPolicy(values))
+    assert _simulator(3).run_monte_carlo_state(optimal_module.optimal_state_strategy, 15) == \
+        _simulator(3).run_monte_carlo(optimal_module.optimal_strategy, 15)
+
+def test_scorecards_agree():
+    score, scorecard = _simulator(5).simulate_game(strategies['Multiples'])
+    state_score, state = _simulator(5).simulate_game_state(as_state_strategy(strategies['Multiples']))
+    assert state_score == score and state.is_complete()
+    assert state.as_scorecard() == scorecard == dict(ScorecardView(state))
+
+def test_fill_rejects_a_filled_category():
+    state = GameState()
+    state.fill(0, 3)
+    with pytest.raises(ValueError):
+        state.fill(0, 4)
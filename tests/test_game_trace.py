@@ -0,0 +1,65 @@
+import random
+import numpy as np
+import pytest
+from dice_rolling import YahtzeeHand
+from game_trace import GameTrace, final_dice, initial_dice, num_rerolls, recorded_categories, replay
+from strategies.batch_strategies import best_open_category
+from yahtzee_simulator import YahtzeeSimulator, strategies
+
+def _simulator(seed):
+    simulator = YahtzeeSimulator()
+    simulator.hand = YahtzeeHand(seed)
+    random.seed(seed)
+    return simulator
+
+@pytest.mark.parametrize('name', ['Multiples', 'Tunnel Vision', 'Upper Focus', 'Yahtzee Focus'])
+def test_replay_reproduces_monte_carlo(name):
+    scores = _simulator(8).run_monte_carlo(strategies[name], 200)
+    trace = _simulator(8).run_monte_carlo_trace(strategies[name], 200)
+    assert trace.num_games == 200
+    assert replay(trace).tolist() == scores
+    assert replay(trace, chunk_size=64).tolist() == scores
+
+def _reversed_rerolls(dice, scorecard, simulator):
+    # Faces land in the order the positions are given, so which die is kept second depends on it
+    simulator.hand.reroll([4, 3])
+    dice = list(simulator.hand.reroll([4]))
+    return next(cat for cat in simulator.all_categories if scorecard[cat] is None), dice
+
+def test_tracing_keeps_the_rerolled_positions_in_order():
+    scores = _simulator(4).run_monte_carlo(_reversed_rerolls, 100)
+    trace = _simulator(4).run_monte_carlo_trace(_reversed_rerolls, 100)
+    assert replay(trace).tolist() == scores
+
+def test_trace_records_the_game():
+    trace = GameTrace(1)
+    _, scorecard = _simulator(2).simulate_game_traced(strategies['Multiples'], trace)
+    assert sorted(recorded_categories(trace.turns)[0].tolist()) == list(range(13))
+    assert ((initial_dice(trace.turns) >= 1) & (initial_dice(trace.turns) <= 6)).all()
+    assert ((final_dice(trace.turns) >= 1) & (final_dice(trace.turns) <= 6)).all()
+    assert set(num_rerolls(trace.turns)[0].tolist()) <= {0, 1, 2}
+
+def test_packing_round_trip():
+    trace = GameTrace(1)
+    for turn in range(13):
+        trace.record_roll([1, 2, 3, 4, 5])
+        if turn % 2:
+            trace.record_reroll([0, 4], [6, 2, 3, 4, 6])
+        trace.record_turn(turn)
+    assert initial_dice(trace.turns)[0, 0].tolist() == [1, 2, 3, 4, 5]
+    assert final_dice(trace.turns)[0, 1].tolist() == [6, 2, 3, 4, 6]
+    assert final_dice(trace.turns)[0, 0].tolist() == [1, 2, 3, 4, 5]
+    assert num_rerolls(trace.turns)[0].tolist() == [turn % 2 for turn in range(13)]
+    with pytest.raises(ValueError):
+        trace.record_roll([1, 1, 1, 1, 1])
+        for _ in range(3):
+            trace.record_reroll([0], [2, 1, 1, 1, 1])
+
+def test_save_and_replay_under_another_rule(tmp_path):
+    trace = _simulator(4).run_monte_carlo_trace(strategies['Multiples'], 100)
+    path = str(tmp_path / 'trace.npy')
+    trace.save(path)
+    loaded = GameTrace.load(path)
+    assert np.array_equal(replay(loaded), replay(trace))
+    # Multiples already scores the best open category, so that rule changes nothing
+    assert np.array_equal(replay(loaded, best_open_category), replay(trace))
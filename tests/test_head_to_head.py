@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+import numpy as np
+import pytest
+from streaming_stats import ScoreHistogram
+from results_io import ScoreWriter
+from head_to_head import (histogram_win_matrix, load_result_histograms, main, paired_comparison,
+                          play_common_games, win_probabilities)
+from yahtzee_simulator import strategies
+
+def _brute_force(a, b):
+    # P(A > B) and P(A = B) over every pair of draws
+    a_scores, b_scores = np.repeat(np.arange(len(a)), a), np.repeat(np.arange(len(b)), b)
+    diffs = a_scores[:, None] - b_scores[None, :]
+    return (diffs > 0).mean(), (diffs == 0).mean()
+
+def test_win_probabilities_match_brute_force():
+    rng = np.random.default_rng(0)
+    a, b = rng.integers(0, 5, size=30), rng.integers(0, 5, size=40)
+    assert win_probabilities(a, b) == pytest.approx(_brute_force(a, b))
+
+def test_win_matrix_rows_add_up():
+    rng = np.random.default_rng(1)
+    histograms = {}
+    for name in ('a', 'b', 'c'):
+        histogram = ScoreHistogram()
+        histogram.update(rng.integers(50, 300, size=500))
+        histograms[name] = histogram
+    result = histogram_win_matrix(histograms)
+    win, tie = result['win_rate'], result['tie_rate']
+    assert result['names'] == ['a', 'b', 'c']
+    assert win + win.T + tie == pytest.approx(np.ones((3, 3)))
+    assert tie == pytest.approx(tie.T)
+
+def test_empty_input_is_reported():
+    with pytest.raises(ValueError):
+        histogram_win_matrix({})
+    with pytest.raises(ValueError):
+        win_probabilities(np.zeros(5), np.ones(5))
+
+def test_from_results_without_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert load_result_histograms(str(tmp_path / 'missing')) == {}
+    with pytest.raises(SystemExit):
+        main(['--from-results'])
+
+def test_import_creates_no_results_dir(tmp_path):
+    # As from analysis/: the notebooks import the simulator from another working directory
+    repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, '-c', 'import head_to_head, yahtzee_simulator'], cwd=tmp_path, check=True,
+                   env=dict(os.environ, PYTHONPATH=repo))
+    assert not (tmp_path / 'results').exists()
+
+def test_loads_binary_score_files(tmp_path):
+    with ScoreWriter(str(tmp_path / 'Multiples_scores.bin'), strategy='Multiples') as writer:
+        writer.write([100, 150, 150])
+    histograms = load_result_histograms(str(tmp_path))
+    assert list(histograms) == ['Multiples']
+    assert histograms['Multiples'].counts[150] == 2
+
+def test_common_games_give_identical_strategies_identical_scores():
+    names, scores = play_common_games({'one': strategies['Multiples'], 'two': strategies['Multiples']}, 30, seed=2)
+    assert np.array_equal(scores[0], scores[1])
+    result = paired_comparison(scores)
+    assert result['tie_rate'][0, 1] == 1 and result['mean_diff'][0, 1] == 0
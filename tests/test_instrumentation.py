@@ -0,0 +1,50 @@
+import random
+import pytest
+from dice_rolling import YahtzeeHand
+from instrumentation import GameObserver, Instrumentation
+from yahtzee_simulator import YahtzeeSimulator, strategies
+
+def _simulator(seed):
+    simulator = YahtzeeSimulator()
+    simulator.hand = YahtzeeHand(seed)
+    random.seed(seed)
+    return simulator
+
+def test_instrumented_games_score_the_same():
+    plain = _simulator(3).run_monte_carlo(strategies['Tunnel Vision'], 200)
+    simulator = _simulator(3)
+    simulator.instrumentation = Instrumentation()
+    assert simulator.run_monte_carlo(strategies['Tunnel Vision'], 200) == plain
+    assert isinstance(simulator.hand, YahtzeeHand)
+
+def test_counters_add_up():
+    simulator = _simulator(4)
+    simulator.instrumentation = instrumentation = Instrumentation(timing=False)
+    simulator.run_monte_carlo(strategies['Multiples'], 100)
+    summary = instrumentation.summary()
+    assert summary['games'] == 100 and summary['turns'] == 1300
+    assert sum(instrumentation.rerolls_per_turn.values()) == 1300
+    assert set(instrumentation.rerolls_per_turn) <= {0, 1, 2}
+    # Every game fills every category once
+    assert set(instrumentation.category_counts.values()) == {100}
+    assert sum(summary['category_frequency'].values()) == pytest.approx(1)
+    assert all(timer == 0 for timer in instrumentation.timers.values())
+
+class TurnLog(GameObserver):
+    def __init__(self):
+        self.turns = []
+        self.games = []
+
+    def record_turn(self, category, score, decision_seconds, scoring_seconds):
+        self.turns.append((category, score))
+
+    def record_game(self, total_score):
+        self.games.append(total_score)
+
+def test_observer_sees_every_turn():
+    simulator = _simulator(5)
+    log = TurnLog()
+    total, scorecard = simulator.simulate_game(strategies['Upper Focus'], observer=log)
+    assert log.games == [total]
+    assert sorted(category for category, _ in log.turns) == sorted(scorecard)
+    assert all(scorecard[category] == score for category, score in log.turns)
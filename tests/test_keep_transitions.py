@@ -0,0 +1,30 @@
+from itertools import product
+import numpy as np
+import pytest
+from scoreboard import HAND_INDEX, NUM_HANDS
+from keep_transitions import (HAND_KEEPS, INITIAL_ROLL, KEEP_ALL, KEEP_INDEX, KEEP_TRANSITIONS, KEEPS, NUM_KEEPS,
+                              best_keep_for_target, transition_distribution)
+
+def test_every_keep_row_sums_to_one():
+    assert KEEP_TRANSITIONS.shape == (NUM_KEEPS, NUM_HANDS) == (462, 252)
+    assert KEEP_TRANSITIONS.sum(axis=1) == pytest.approx(np.ones(NUM_KEEPS))
+    assert (KEEP_TRANSITIONS >= 0).all()
+
+def test_initial_roll_matches_enumeration():
+    counts = np.zeros(NUM_HANDS)
+    for dice in product(range(1, 7), repeat=5):
+        counts[HAND_INDEX[tuple(sorted(dice))]] += 1
+    assert INITIAL_ROLL == pytest.approx(counts / 6 ** 5)
+
+def test_holding_everything_keeps_the_hand():
+    for h in (0, 100, 251):
+        hands, probs = transition_distribution(h, KEEP_ALL)
+        assert hands.tolist() == [h] and probs.tolist() == pytest.approx([1.0])
+        assert HAND_KEEPS[h, 0] == KEEP_INDEX[()]
+    assert len(KEEPS) == NUM_KEEPS
+
+def test_best_keep_for_target():
+    positions, expected = best_keep_for_target([6, 2, 6, 1, 6], 'sixes', 2)
+    assert positions == [0, 2, 4]
+    # Three sixes kept, two dice with two rerolls each: 18 + 2 * 6 * (11/36)
+    assert expected == pytest.approx(18 + 2 * 6 * 11 / 36)
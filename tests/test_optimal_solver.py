@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from scoreboard import CATEGORY_INDEX, HANDS, NUM_HANDS
+from keep_transitions import HAND_KEEPS, INITIAL_ROLL, best_keep_values
+import optimal_solver
+from optimal_solver import (FULL_MASK, NUM_MASKS, UPPER_STATES, OptimalPolicy, load_decisions, reachable_upper_totals,
+                            state_rows, turn_decisions, turn_values)
+
+CHANCE = CATEGORY_INDEX['chance']
+
+@pytest.fixture(scope='module')
+def values():
+    # Any table will do for checking that the decision paths agree
+    return np.random.default_rng(0).random((NUM_MASKS, UPPER_STATES)).astype(np.float32) * 50
+
+def test_reachable_upper_totals():
+    reachable = reachable_upper_totals()
+    assert reachable[0].tolist() == [0]
+    assert reachable[1].tolist() == [0, 1, 2, 3, 4, 5]
+    assert all(totals.max() <= 63 for totals in reachable)
+    assert 63 in reachable[63] and 62 not in reachable[1 | 2]
+
+def test_last_turn_chance_value():
+    # Only chance left: hold dice of 5 or 6 with two rerolls, 4 or more with one, 5 * 14/3 in all
+    mask = FULL_MASK & ~(1 << CHANCE)
+    final, keep_values = turn_values(np.zeros((NUM_MASKS, UPPER_STATES)), mask, [0])
+    assert final[0].tolist() == [float(sum(hand)) for hand in HANDS]
+    start = best_keep_values(keep_values[1]) @ INITIAL_ROLL
+    assert start[0] == pytest.approx(70 / 3)
+
+def test_state_rows_cover_reachable_states():
+    rows, count = state_rows()
+    reachable = reachable_upper_totals()
+    assert count == sum(len(reachable[mask & 63]) for mask in range(FULL_MASK))
+    assert sorted(rows[rows >= 0].tolist()) == list(range(count))
+
+def test_decisions_match_single_state_solve(values):
+    policy = OptimalPolicy(values)
+    rng = np.random.default_rng(1)
+    for mask in rng.integers(0, FULL_MASK, size=5).tolist():
+        uppers = reachable_upper_totals()[mask & 63][:3]
+        decisions = turn_decisions(values, mask, uppers)
+        for u, upper in enumerate(uppers.tolist()):
+            _, keep_values = turn_values(values, mask, [upper])
+            assert np.array_equal(decisions[u], policy.state_decisions(mask, upper))
+            best = keep_values[1][0][HAND_KEEPS].argmax(axis=1)
+            assert np.array_equal(decisions[u, 0], best)
+            for h in range(0, NUM_HANDS, 25):
+                dice = list(HANDS[h])
+                assert decisions[u, 2, h] == policy.category(dice, mask, upper)
+                assert not mask >> policy.category(dice, mask, upper) & 1
+
+def test_table_lookup_matches_memo(values):
+    memo = OptimalPolicy(values)
+    mask, upper = 0b1010101010, 0
+    rows, count = state_rows()
+    decisions = np.zeros((count, 3, NUM_HANDS), dtype=np.int8)
+    decisions[rows[mask, upper]] = turn_decisions(values, mask, [upper])[0]
+    table = OptimalPolicy(values, decisions)
+    rng = np.random.default_rng(2)
+    for dice in rng.integers(1, 7, size=(50, 5)).tolist():
+        for rerolls_left in (2, 1):
+            assert table.keep_mask(dice, mask, upper, rerolls_left) == memo.keep_mask(dice, mask, upper, rerolls_left)
+        assert table.category(dice, mask, upper) == memo.category(dice, mask, upper)
+
+def test_keep_mask_refers_to_positions_in_dice(values):
+    policy = OptimalPolicy(values)
+    mask, upper = 0, 0
+    for dice in ([6, 1, 6, 2, 6], [1, 2, 3, 4, 5], [5, 5, 1, 1, 3]):
+        held = policy.keep_mask(dice, mask, upper, 2)
+        sorted_held = policy.keep_mask(sorted(dice), mask, upper, 2)
+        assert sorted(dice[i] for i in range(5) if held >> i & 1) == \
+            sorted(sorted(dice)[i] for i in range(5) if sorted_held >> i & 1)
+
+def test_decision_table_is_opt_in(tmp_path, monkeypatch):
+    # A missing decision table is not built; default runs also leave Optimal out until its values are solved
+    path = tmp_path / 'optimal_decisions.npy'
+    assert load_decisions(str(path)) is None
+    assert not path.exists()
+    from yahtzee_simulator import default_strategy_names
+    monkeypatch.setattr(optimal_solver, 'DEFAULT_TABLE_PATH', str(tmp_path / 'optimal_values.npy'))
+    names = default_strategy_names()
+    assert 'Optimal' not in names and 'Multiples' in names
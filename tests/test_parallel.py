@@ -0,0 +1,19 @@
+import numpy as np
+from yahtzee_simulator import PARALLEL_CHUNK_SIZE, _run_chunk_in_process, run_monte_carlo_parallel, strategies
+
+GAMES = 2 * PARALLEL_CHUNK_SIZE + 300
+
+def test_scores_do_not_depend_on_the_worker_count():
+    strategy = strategies['Tunnel Vision']
+    scores = run_monte_carlo_parallel(strategy, GAMES, workers=1, seed=3)
+    assert len(scores) == GAMES
+    assert run_monte_carlo_parallel(strategy, GAMES, workers=2, seed=3) == scores
+    assert run_monte_carlo_parallel(strategy, GAMES, workers=3, seed=3) == scores
+    assert run_monte_carlo_parallel(strategy, GAMES, workers=1, seed=4) != scores
+
+def test_chunks_have_their_own_streams():
+    # The last chunk is short but still played on its own spawned stream
+    strategy = strategies['Multiples']
+    scores = run_monte_carlo_parallel(strategy, GAMES, workers=1, seed=5)
+    streams = np.random.SeedSequence(5).spawn(3)
+    assert scores[-300:] == _run_chunk_in_process((strategy, 300, streams[2]))
@@ -0,0 +1,89 @@
+import pickle
+import random
+import numpy as np
+import pytest
+from scoreboard import NUM_CATEGORIES, NUM_HANDS
+from dice_rolling import YahtzeeHand
+from batch_engine import run_monte_carlo_batched
+from optimal_solver import NUM_MASKS
+from strategies.decision_cache import CachedStrategy
+from strategies.policy_table import (HOLD_ALL, NUM_KEEP_ACTIONS, PolicyTable, _probe_rows, compile_policy,
+                                     describe_action, diff_policies, probe_actions)
+from yahtzee_simulator import YahtzeeSimulator, strategies
+
+class ProbedActions:
+    """actions[mask] probed on first use, standing in for a fully compiled table."""
+    def __init__(self, cache):
+        self.cache = cache
+        self.rows = {}
+
+    def __getitem__(self, mask):
+        if mask not in self.rows:
+            self.rows[mask] = probe_actions(self.cache, mask)
+        return self.rows[mask]
+
+def _scores(strategy_function, games=150, seed=11):
+    simulator = YahtzeeSimulator()
+    simulator.hand = YahtzeeHand(seed)
+    random.seed(seed)
+    return simulator.run_monte_carlo(strategy_function, games)
+
+def _first_open_table(seed=0):
+    # Random holds at rolls 0 and 1, first open category at roll 2
+    rng = np.random.default_rng(seed)
+    actions = rng.integers(0, NUM_KEEP_ACTIONS, size=(NUM_MASKS, 3, NUM_HANDS)).astype(np.int8)
+    masks = np.arange(NUM_MASKS)
+    first_open = np.array([(~mask & -~mask).bit_length() - 1 for mask in masks.tolist()]) % NUM_CATEGORIES
+    actions[:, 2] = (NUM_KEEP_ACTIONS + first_open)[:, None]
+    return PolicyTable(actions, name='first_open')
+
+@pytest.mark.parametrize('name', ['Yahtzee Focus', 'Multiples'])
+def test_table_plays_like_its_strategy(name):
+    cache = CachedStrategy(strategies[name], maxsize=0, canonical=True)
+    table = PolicyTable(ProbedActions(cache), name=name)
+    assert _scores(table, games=30) == _scores(CachedStrategy(strategies[name], canonical=True), games=30)
+
+def test_compile_refuses_score_dependent_strategies():
+    # Optimal reads the upper subtotal, which the table has no axis for
+    with pytest.raises(ValueError):
+        compile_policy(strategies['Optimal'], workers=1)
+
+def test_probe_rows_batch_masks():
+    cache = CachedStrategy(strategies['Yahtzee Focus'], maxsize=0, canonical=True)
+    rows = _probe_rows((cache, [0, 5, 4000]))
+    assert rows.shape == (3, 3, NUM_HANDS)
+    assert np.array_equal(rows[1], probe_actions(cache, 5))
+    assert (rows[:, 2] >= NUM_KEEP_ACTIONS).all()
+
+def test_batch_policy_matches_scalar_play():
+    table = _first_open_table()
+    batched = run_monte_carlo_batched(table.batch_policy(), 20000, seed=3)
+    scalar = np.array(_scores(table, games=2000))
+    standard_error = np.sqrt(batched.var() / len(batched) + scalar.var() / len(scalar))
+    assert abs(batched.mean() - scalar.mean()) < 4 * standard_error
+
+def test_turn_actions_end_rerolls_on_hold_all():
+    table = _first_open_table()
+    table.actions[7, 0, :] = HOLD_ALL
+    actions = table.turn_actions(7, np.array([0, 5]))
+    assert actions.shape == (3, 2, NUM_HANDS)
+    assert np.array_equal(actions[0], actions[2])
+
+def test_save_load_and_pickle(tmp_path):
+    table = _first_open_table()
+    path = table.save(str(tmp_path / 'first_open_policy.npy'))
+    loaded = PolicyTable.load(path)
+    assert np.array_equal(np.asarray(loaded.actions), table.actions)
+    copy = pickle.loads(pickle.dumps(loaded))
+    assert copy.action(3, 1, 17) == table.action(3, 1, 17)
+    with pytest.raises(ValueError):
+        np.save(str(tmp_path / 'bad.npy'), np.zeros((2, 3)))
+        PolicyTable.load(str(tmp_path / 'bad.npy'))
+
+def test_diff_policies():
+    a, b = _first_open_table(0), _first_open_table(0)
+    b.actions[5, 1, 9] = (int(a.actions[5, 1, 9]) + 1) % NUM_KEEP_ACTIONS
+    masks, roll_nums, hands, actions_a, actions_b = diff_policies(a, b)
+    assert (masks.tolist(), roll_nums.tolist(), hands.tolist()) == ([5], [1], [9])
+    assert describe_action(NUM_KEEP_ACTIONS + 12, 0) == 'score chance'
+    assert describe_action(0, 0) == 'reroll all'
@@ -0,0 +1,88 @@
+import os
+import numpy as np
+import pytest
+import result_cache
+from result_cache import REPO_DIR, ResultCache, source_files, strategy_identity
+from strategies.multiples_strategy import MultiplesStrategy
+from yahtzee_simulator import strategies
+
+def _relative(files):
+    return {os.path.relpath(path, REPO_DIR).replace(os.sep, '/') for path in files}
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(str(tmp_path / 'cache'))
+
+def test_key_depends_on_every_run_parameter(cache):
+    strategy = strategies['Multiples']
+    key = cache.key(strategy, 'scalar', seed=1, num_games=100)
+    assert key == cache.key(strategy, 'scalar', seed=1, num_games=100)
+    others = {
+        cache.key(strategy, 'scalar', seed=2, num_games=100),
+        cache.key(strategy, 'scalar', seed=1, num_games=101),
+        cache.key(strategy, 'batched', seed=1, num_games=100),
+        cache.key(strategy, 'scalar', seed=1, num_games=100, engine_version=-1),
+        cache.key(strategies['Yahtzee Focus'], 'scalar', seed=1, num_games=100),
+    }
+    assert key not in others and len(others) == 5
+    assert cache.key(strategy, 'scalar', seed=None) is None
+
+def test_key_depends_on_strategy_parameters(cache):
+    low = cache.key(MultiplesStrategy(prefer_high=False), seed=1)
+    assert low != cache.key(MultiplesStrategy(prefer_high=True), seed=1)
+    assert strategy_identity(MultiplesStrategy()) == strategy_identity(MultiplesStrategy())
+
+def test_source_files_follow_engines_and_imports():
+    scalar = _relative(source_files(strategies['Multiples'], 'scalar'))
+    assert {'scoreboard.py', 'dice_rolling.py', 'yahtzee_simulator.py', 'strategies/multiples_strategy.py'} <= scalar
+    assert 'yahtzee_simulator.py' in _relative(source_files(strategies['Multiples'], 'parallel'))
+    batched = _relative(source_files(strategies['Multiples'], 'batched'))
+    assert {'batch_engine.py', 'strategies/batch_strategies.py'} <= batched
+    # Only reachable through the SCORE_ARRAY import, which has no __module__
+    assert {'optimal_solver.py', 'batch_engine.py'} <= _relative(source_files(strategies['Optimal']))
+
+def test_optimal_key_follows_the_value_table(cache, tmp_path, monkeypatch):
+    table, decisions = tmp_path / 'values.npy', tmp_path / 'decisions.npy'
+    monkeypatch.setitem(result_cache.DATA_FILES, 'optimal_solver.py', (str(table), str(decisions)))
+    assert cache.key(strategies['Optimal'], seed=1) is None
+    np.save(table, np.zeros(3))
+    key = cache.key(strategies['Optimal'], seed=1)
+    np.save(table, np.ones(3))
+    assert key is not None and cache.key(strategies['Optimal'], seed=1) != key
+    # The optional decision table is hashed once it exists
+    key = cache.key(strategies['Optimal'], seed=1)
+    np.save(decisions, np.zeros(3))
+    assert cache.key(strategies['Optimal'], seed=1) != key
+    assert cache.key(strategies['Multiples'], seed=1) is not None
+
+def test_record_then_get(cache):
+    key = cache.key(strategies['Multiples'], seed=1, num_games=5)
+    assert cache.get(key) is None
+    chunks = [np.array([100, 120]), np.array([140, 160, 180])]
+    assert [list(chunk) for chunk in cache.record(key, chunks)] == [[100, 120], [140, 160, 180]]
+    assert cache.get(key).tolist() == [100, 120, 140, 160, 180]
+    assert cache.cache_info()['hits'] == 1 and cache.cache_info()['entries'] == 1
+
+def test_interrupted_record_leaves_no_entry(cache):
+    key = cache.key(strategies['Multiples'], seed=1, num_games=4)
+    recording = cache.record(key, [np.array([1, 2]), np.array([3, 4])])
+    next(recording)
+    recording.close()
+    assert cache.get(key) is None
+    assert os.listdir(cache.directory) == []
+
+def test_unseeded_runs_create_no_cache(tmp_path, monkeypatch):
+    from yahtzee_simulator import main
+    monkeypatch.chdir(tmp_path)
+    main(['--strategies', 'Multiples', '--games', '20', '--summary-only'])
+    assert not (tmp_path / 'results' / 'cache').exists()
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache'))
+    keys = [cache.key(strategies['Multiples'], seed=seed, num_games=3) for seed in (1, 2)]
+    list(cache.record(keys[0], [np.array([1, 2, 3])]))
+    cache.max_bytes = cache.size()
+    os.utime(cache.path(keys[0]), (0, 0))
+    list(cache.record(keys[1], [np.array([4, 5, 6])]))
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]).tolist() == [4, 5, 6]
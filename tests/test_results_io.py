@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+from results_io import HEADER_SIZE, ScoreWriter, load_scores, read_metadata
+
+def test_writer_round_trip(tmp_path):
+    path = str(tmp_path / 'Multiples_scores.bin')
+    chunks = [np.array([150, 230, 99]), np.array([375, 0])]
+    with ScoreWriter(path, strategy='Multiples', seed=4, engine_version=2, engine='scalar') as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    metadata, scores = load_scores(path)
+    assert scores.tolist() == [150, 230, 99, 375, 0]
+    assert metadata == {'strategy': 'Multiples', 'seed': 4, 'engine_version': 2, 'engine': 'scalar', 'num_games': 5}
+
+def test_append_and_truncate(tmp_path):
+    path = str(tmp_path / 'scores.bin')
+    with ScoreWriter(path, strategy='A') as writer:
+        writer.write([1, 2, 3])
+    with ScoreWriter(path, append=True) as writer:
+        writer.write([4, 5])
+        writer.truncate(4)
+    assert load_scores(path)[1].tolist() == [1, 2, 3, 4]
+    assert read_metadata(path)['strategy'] == 'A'
+
+def test_empty_and_foreign_files(tmp_path):
+    path = str(tmp_path / 'empty.bin')
+    ScoreWriter(path).close()
+    assert load_scores(path)[1].size == 0
+    other = tmp_path / 'scores.csv'
+    other.write_bytes(b'score\n1\n' * HEADER_SIZE)
+    with pytest.raises(ValueError):
+        load_scores(str(other))
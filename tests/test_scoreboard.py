@@ -0,0 +1,27 @@
+from itertools import product
+import pytest
+from scoreboard import (CATEGORIES, HANDS, NUM_HANDS, SCORE_TABLE, YahtzeeScorer, _RULES, hand_index, score_all,
+                        score_category)
+
+def test_score_table_matches_the_rules():
+    assert NUM_HANDS == 252 and len(SCORE_TABLE) == NUM_HANDS
+    for hand, scores in zip(HANDS, SCORE_TABLE):
+        assert scores == tuple(rule(hand) for rule in _RULES)
+
+def test_lookups_ignore_dice_order():
+    for dice in product(range(1, 7), repeat=5):
+        assert HANDS[hand_index(dice)] == tuple(sorted(dice))
+    assert score_all([5, 2, 3, 4, 1]) == score_all([1, 2, 3, 4, 5])
+
+@pytest.mark.parametrize('dice', [[3, 3, 3, 2, 2], [1, 2, 3, 4, 6], [6, 6, 6, 6, 6], [2, 3, 4, 5, 5]])
+def test_scorer_methods_match_the_rules(dice):
+    for category, rule in zip(CATEGORIES, _RULES):
+        assert getattr(YahtzeeScorer, f'score_{category}')(dice) == rule(dice)
+        assert score_category(category, dice) == YahtzeeScorer.score(category, dice) == rule(dice)
+
+def test_known_scores():
+    assert score_category('full_house', [2, 3, 2, 3, 3]) == 25
+    assert score_category('small_straight', [4, 1, 3, 2, 2]) == 30
+    assert score_category('large_straight', [4, 1, 3, 2, 2]) == 0
+    assert score_category('yahtzee', [4] * 5) == 50
+    assert score_category('fours', [4, 4, 1, 4, 2]) == 12
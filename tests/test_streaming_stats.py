@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from streaming_stats import RunningStats, ScoreHistogram
+
+def test_running_stats_match_numpy():
+    scores = np.random.default_rng(3).integers(0, 376, size=5000)
+    stats = RunningStats()
+    for chunk in np.array_split(scores, 7):
+        stats.update(chunk)
+    stats.update([])
+    assert stats.count == len(scores)
+    assert stats.mean == pytest.approx(scores.mean())
+    assert stats.variance == pytest.approx(scores.var(ddof=1))
+    assert (stats.min, stats.max) == (scores.min(), scores.max())
+
+def test_update_agrees_with_add():
+    scores = [120, 250, 199, 301, 87]
+    batch, single = RunningStats(), RunningStats()
+    batch.update(scores)
+    for score in scores:
+        single.add(score)
+    assert (batch.count, batch.min, batch.max) == (single.count, single.min, single.max)
+    assert batch.mean == pytest.approx(single.mean)
+    assert batch.m2 == pytest.approx(single.m2)
+
+@pytest.mark.parametrize('q', [0, 0.05, 0.25, 0.5, 0.75, 0.95, 1])
+def test_histogram_quantiles_match_numpy(q):
+    scores = np.random.default_rng(5).integers(50, 320, size=999)
+    histogram = ScoreHistogram()
+    histogram.update(scores)
+    assert histogram.quantile(q) == pytest.approx(np.quantile(scores, q))
+
+def test_histogram_and_running_stats_agree():
+    scores = np.random.default_rng(6).integers(0, 376, size=2000)
+    histogram, stats = ScoreHistogram(), RunningStats()
+    histogram.update(scores)
+    stats.update(scores)
+    assert histogram.mean == pytest.approx(stats.mean)
+    assert histogram.half_width() == pytest.approx(stats.half_width())
+    assert RunningStats().half_width() == float('inf')
@@ -0,0 +1,39 @@
+import pytest
+from strategies.multiples_strategy import MultiplesStrategy
+from sweep import main, param_grid, param_sample, successive_halving
+
+SPACE = {'min_keep': [1, 2, 3], 'prefer_high': [False, True]}
+
+def test_param_grid_and_sample():
+    grid = param_grid(SPACE)
+    assert len(grid) == 6 and {'min_keep': 3, 'prefer_high': True} in grid
+    sample = param_sample(SPACE, 4, seed=0)
+    assert len(sample) == 4 and all(setting in grid for setting in sample)
+    assert param_sample(SPACE, 4, seed=0) == sample
+    assert len(param_sample(SPACE, 10, seed=0)) == 6
+
+def test_successive_halving_rounds():
+    results = successive_halving(MultiplesStrategy, param_grid(SPACE), initial_games=40, eta=2,
+                                 max_games=160, seed=0, workers=1, verbose=False)
+    assert len(results) == 6
+    # 6 settings play 40 games, the best 3 reach 80, the best 2 reach 160
+    assert sorted(result['games'] for result in results) == [40, 40, 40, 80, 160, 160]
+    assert results[0]['games'] == 160 and results[0]['mean_score'] >= results[1]['mean_score']
+    again = successive_halving(MultiplesStrategy, param_grid(SPACE), initial_games=40, eta=2,
+                               max_games=160, seed=0, workers=1, verbose=False)
+    assert again == results
+
+def test_unseeded_settings_share_dice():
+    same = [{'min_keep': 2, 'prefer_high': False}] * 2
+    results = successive_halving(MultiplesStrategy, same, initial_games=60, max_games=60,
+                                 seed=None, workers=1, verbose=False)
+    assert results[0]['mean_score'] == results[1]['mean_score']
+
+@pytest.mark.parametrize('kwargs', [{'eta': 1}, {'initial_games': 0}, {'initial_games': 100, 'max_games': 50}])
+def test_invalid_budgets_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        successive_halving(MultiplesStrategy, param_grid(SPACE), workers=1, verbose=False, **kwargs)
+
+def test_cli_rejects_eta_one():
+    with pytest.raises(SystemExit):
+        main(['multiples', '--eta', '1'])
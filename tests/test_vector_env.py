@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from vector_env import NUM_ACTIONS, NUM_KEEP_ACTIONS, VectorYahtzeeEnv, keep_action, sample_actions, score_action
+
+def test_rewards_add_up_to_final_scores():
+    env = VectorYahtzeeEnv(seed=0)
+    obs = env.reset(64)
+    rng = np.random.default_rng(1)
+    running = np.zeros(64, dtype=np.int64)
+    finished = 0
+    while finished < 200:
+        obs, rewards, dones, info = env.step(sample_actions(obs['action_mask'], rng))
+        running += rewards
+        assert np.array_equal(info['final_scores'][dones], running[dones])
+        finished += int(dones.sum())
+        running[dones] = 0
+    # Finished games restart with a fresh card
+    assert (obs['turn'] < 13).all() and obs['open'][dones].all()
+
+def test_action_mask():
+    env = VectorYahtzeeEnv(seed=2)
+    obs = env.reset(3)
+    assert obs['action_mask'].shape == (3, NUM_ACTIONS) and obs['action_mask'].all()
+    # Two rerolls use up the keeps; then only open categories remain
+    for _ in range(2):
+        obs, _, _, _ = env.step(np.full(3, keep_action(0b10101)))
+    assert not obs['action_mask'][:, :NUM_KEEP_ACTIONS].any()
+    dice = obs['dice']
+    obs, rewards, _, _ = env.step(np.full(3, score_action(12)))
+    assert rewards.tolist() == dice.sum(axis=1).tolist()
+    assert not obs['action_mask'][:, score_action(12)].any()
+    assert obs['rolls_left'].tolist() == [2, 2, 2]
+
+def test_keeps_hold_their_dice():
+    env = VectorYahtzeeEnv(seed=3)
+    obs = env.reset(100)
+    held = obs['dice'][:, [0, 2]]
+    obs, rewards, _, _ = env.step(np.full(100, keep_action(0b00101)))
+    assert np.array_equal(obs['dice'][:, [0, 2]], held) and not rewards.any()
+
+def test_invalid_actions_are_rejected():
+    env = VectorYahtzeeEnv(seed=4)
+    env.reset(2)
+    with pytest.raises(ValueError):
+        env.step([0, NUM_ACTIONS])
+    env.step([score_action(0), score_action(0)])
+    with pytest.raises(ValueError):
+        env.step([score_action(0), 0])
@@ -0,0 +1,138 @@
+import numpy as np
+from scoreboard import NUM_CATEGORIES, UPPER_BONUS, UPPER_BONUS_THRESHOLD
+from batch_engine import BatchSimulator, SCORE_ARRAY, face_counts, hand_indices
+
+# Vectorized environment for learned and search policies. Where a strategy
+# function plays a whole turn and rerolls through simulator.hand itself, the
+# environment exposes every decision as a step over a batch of games:
+#
+#   env = VectorYahtzeeEnv(seed=0)
+#   obs = env.reset(4096)
+#   while True:
+#       actions = policy(obs)                      # (n,) ints, valid under obs['action_mask']
+#       obs, rewards, dones, info = env.step(actions)
+#
+# Actions 0-31 are keeps: bit i set holds die i and the other dice are
+# rerolled. Actions 32-44 score the current dice in category action - 32 and
+# start the next turn. Rewards are the points scored plus the upper bonus on
+# the step that earns it, so a game's rewards add up to its final score.
+# Finished games restart on their own; info['final_scores'] holds their scores.
+
+NUM_KEEP_ACTIONS = 32
+NUM_ACTIONS = NUM_KEEP_ACTIONS + NUM_CATEGORIES
+ROLLS_PER_TURN = 2
+_DIE_BITS = 1 << np.arange(5)
+
+def keep_action(mask):
+    """Action holding the dice in position bitmask mask and rerolling the rest."""
+    return mask
+
+def score_action(category_idx):
+    """Action scoring the current dice in category category_idx."""
+    return NUM_KEEP_ACTIONS + category_idx
+
+def sample_actions(action_mask, rng):
+    """One uniformly random valid action per row of an (n, NUM_ACTIONS) action mask."""
+    weights = rng.random(action_mask.shape) * action_mask
+    return weights.argmax(axis=1)
+
+class VectorYahtzeeEnv:
+    """
+    n independent games stepped in lockstep on a BatchSimulator's arrays.
+    Each game moves at its own pace: one row can be rerolling while another
+    scores. Observations are a dict of NumPy arrays with one row per game:
+      dice         (n, 5)  int8   current dice
+      counts       (n, 6)  int64  how many of each face
+      hand         (n,)    int16  sorted-hand index into SCORE_ARRAY
+      rolls_left   (n,)    int8   rerolls left this turn (2, 1 or 0)
+      open         (n, 13) bool   categories still to fill
+      upper_total  (n,)    int16  points in the upper section so far
+      turn         (n,)    int8   turns already scored (0-12)
+      action_mask  (n, 45) bool   valid actions
+    """
+    def __init__(self, num_envs=1, seed=None):
+        self.num_envs = num_envs
+        self.rng = np.random.default_rng(seed)
+
+    def reset(self, num_envs=None):
+        if num_envs is not None:
+            self.num_envs = num_envs
+        n = self.num_envs
+        self.sim = BatchSimulator(n, seed=self.rng.integers(2 ** 63))
+        self.rolls_left = np.full(n, ROLLS_PER_TURN, dtype=np.int8)
+        self.turn = np.zeros(n, dtype=np.int8)
+        self.sim.roll_all()
+        return self.observe()
+
+    def action_mask(self):
+        mask = np.zeros((self.num_envs, NUM_ACTIONS), dtype=bool)
+        mask[:, :NUM_KEEP_ACTIONS] = (self.rolls_left > 0)[:, None]
+        mask[:, NUM_KEEP_ACTIONS:] = self.sim.open_categories()
+        return mask
+
+    def observe(self):
+        sim = self.sim
+        return {
+            'dice': sim.dice.copy(),
+            'counts': face_counts(sim.dice),
+            'hand': hand_indices(sim.dice),
+            'rolls_left': self.rolls_left.copy(),
+            'open': sim.open_categories(),
+            'upper_total': sim.upper_total.copy(),
+            'turn': self.turn.copy(),
+            'action_mask': self.action_mask(),
+        }
+
+    def step(self, actions):
+        """Apply one action per game. Returns (observations, rewards, dones, info)."""
+        sim = self.sim
+        n = self.num_envs
+        rows = np.arange(n)
+        actions = np.asarray(actions, dtype=np.intp)
+        if actions.shape != (n,) or actions.min() < 0 or actions.max() >= NUM_ACTIONS:
+            raise ValueError(f"Expected {n} actions in 0..{NUM_ACTIONS - 1}")
+        if not self.action_mask()[rows, actions].all():
+            raise ValueError("Action not allowed by the action mask")
+        scoring = actions >= NUM_KEEP_ACTIONS
+        fresh = sim.rng.integers(1, 7, size=(n, 5), dtype=np.int8)
+
+        # Keep actions reroll every die they do not hold
+        held = (actions[:, None] & _DIE_BITS) > 0
+        sim.dice = np.where(~scoring[:, None] & ~held, fresh, sim.dice)
+        self.rolls_left -= ~scoring
+
+        # Score actions fill a category, adding the upper bonus when it is earned
+        categories = np.where(scoring, actions - NUM_KEEP_ACTIONS, 0)
+        points = np.where(scoring, SCORE_ARRAY[hand_indices(sim.dice), categories], 0).astype(np.int16)
+        sim.scorecard[rows[scoring], categories[scoring]] = points[scoring]
+        upper_before = sim.upper_total.copy()
+        sim.upper_total += np.where(scoring & (categories < 6), points, 0).astype(np.int16)
+        earned = (upper_before < UPPER_BONUS_THRESHOLD) & (sim.upper_total >= UPPER_BONUS_THRESHOLD)
+        rewards = points.astype(np.int32) + np.where(earned, UPPER_BONUS, 0)
+        self.turn += scoring
+
+        # Finished games report their score and start over
+        dones = self.turn == NUM_CATEGORIES
+        final_scores = np.where(dones, sim.total_scores(), 0)
+        sim.scorecard[dones] = -1
+        sim.upper_total[dones] = 0
+        self.turn[dones] = 0
+
+        # Every row that scored starts its next turn with a fresh roll
+        sim.dice = np.where(scoring[:, None], sim.rng.integers(1, 7, size=(n, 5), dtype=np.int8), sim.dice)
+        self.rolls_left[scoring] = ROLLS_PER_TURN
+        return self.observe(), rewards, dones, {'final_scores': final_scores}
+
+if __name__ == "__main__":
+    import time
+    env = VectorYahtzeeEnv(seed=0)
+    obs = env.reset(10000)
+    rng = np.random.default_rng(1)
+    steps, finished, start = 0, [], time.perf_counter()
+    while len(finished) < 20000:
+        obs, rewards, dones, info = env.step(sample_actions(obs['action_mask'], rng))
+        steps += env.num_envs
+        finished.extend(info['final_scores'][dones].tolist())
+    seconds = time.perf_counter() - start
+    print(f"Random policy: {len(finished)} games, mean {np.mean(finished):.1f}, "
+          f"{steps / seconds * 60 / 1e6:.1f}M steps per minute")
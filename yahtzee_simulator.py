@@ -1,55 +1,92 @@
 import numpy as np
-import statistics
+import argparse
 import csv
 import os
+import time
 from scoreboard import *
 from dice_rolling import *
-from strategies.multiples_strategy import multiples_strategy
-from strategies.multiples_strategy_plus import multiples_strategy_plus
-from strategies.upper_focus_strategy import upper_focus_strategy
-from strategies.straight_strategy import straight_strategy
-from strategies.yahtzee_focus_strategy import yahtzee_focus_strategy
-from strategies.tunnel_vision_strategy import tunnel_vision_strategy
+from results_io import ScoreWriter, SCORES_EXTENSION, ensure_parent_dir
+from result_cache import ResultCache
+from game_records import GameRecords
+from game_trace import GameTrace, TraceObserver
+from streaming_stats import RunningStats, ScoreHistogram
+from game_state import GameState, as_state_strategy
+from strategies import registry
 
 import random
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# Bumped whenever a change alters the scores produced for a given seed
+ENGINE_VERSION = 2
+
+# Games per parallel task. Fixed so that results do not depend on the worker count.
+PARALLEL_CHUNK_SIZE = 1000
+
+# Game budget of run_sequential when the caller sets none, so a tolerance
+# the spread of scores never reaches still ends the run
+SEQUENTIAL_MAX_GAMES = 1000000
 
 class YahtzeeSimulator:
     def __init__(self):
         self.hand = YahtzeeHand()
         self.scorer = YahtzeeScorer()
-        self.all_categories = [
-            'ones', 'twos', 'threes', 'fours', 'fives', 'sixes',
-            'three_of_a_kind', 'four_of_a_kind', 'full_house',
-            'small_straight', 'large_straight', 'yahtzee', 'chance'
-        ]
+        self.all_categories = list(CATEGORIES)
+        # Set to an Instrumentation (or any GameObserver) to watch every game; None costs nothing
+        self.instrumentation = None
         
-    def simulate_game(self, strategy_function):
+    def simulate_game(self, strategy_function, records=None, observer=None):
+        # observer defaults to self.instrumentation; it wraps the hand and hears about every turn
+        if observer is None:
+            observer = self.instrumentation
+        hand = self.hand
+        if observer is not None:
+            clock = observer.clock
+            self.hand = observer.wrap_hand(hand)
+
         # Initialize empty scorecard
         scorecard = {category: None for category in self.all_categories}
         total_score = 0
+        # Fill order is only kept for GameRecords
+        fill_order = [] if records is not None else None
         
-        # Play 13 rounds (one for each category)
-        for _ in range(13):
-            # First roll
-            self.hand.roll_all()
-            
-            # Strategy decides which dice to keep/reroll and which category to use
-            category, final_dice = strategy_function(self.hand.dice, scorecard, self)
-            
-            # Score the final dice in the chosen category
-            score_method = getattr(self.scorer, f"score_{category}")
-            score = score_method(final_dice)
-            
-            # Update scorecard
-            scorecard[category] = score
-            total_score += score
+        try:
+            # Play 13 rounds (one for each category)
+            for _ in range(13):
+                # First roll
+                self.hand.roll_all()
+                if observer is not None:
+                    start = clock()
+
+                # Strategy decides which dice to keep/reroll and which category to use
+                category, final_dice = strategy_function(self.hand.dice, scorecard, self)
+                if observer is not None:
+                    decided = clock()
+
+                # Score the final dice in the chosen category (precomputed table lookup)
+                score = SCORE_TABLE[hand_index(final_dice)][CATEGORY_INDEX[category]]
+
+                # Update scorecard
+                scorecard[category] = score
+                total_score += score
+                if fill_order is not None:
+                    fill_order.append(category)
+                if observer is not None:
+                    observer.record_turn(category, score, decided - start, clock() - decided)
+        finally:
+            self.hand = hand
             
         # Calculate upper section bonus 35 points
         upper_section = ['ones', 'twos', 'threes', 'fours', 'fives', 'sixes']
         upper_total = sum(scorecard[cat] for cat in upper_section if scorecard[cat] is not None)
         if upper_total >= 63:
             total_score += 35  # Upper section bonus
+
+        # Optional capture of the full scorecard into preallocated arrays
+        if records is not None:
+            records.record(scorecard, fill_order, upper_total >= 63, total_score)
+        if observer is not None:
+            observer.record_game(total_score)
             
         return total_score, scorecard
     
@@ -61,52 +98,269 @@ class YahtzeeSimulator:
             
         return scores
 
+    def simulate_game_state(self, strategy_function):
+        # Same game as simulate_game, tracked in a compact GameState.
+        # strategy_function(dice, state, simulator) -> (category index, final dice)
+        state = GameState()
+        for _ in range(13):
+            self.hand.roll_all()
+            category_idx, final_dice = strategy_function(self.hand.dice, state, self)
+            state.fill(category_idx, SCORE_TABLE[hand_index(final_dice)][category_idx])
+        return state.final_score(), state
+
+    def run_monte_carlo_state(self, strategy_function, num_simulations=10000):
+        # Dict-based strategies are wrapped so they see a scorecard view of the state
+        strategy_function = as_state_strategy(strategy_function)
+        return [self.simulate_game_state(strategy_function)[0] for _ in range(num_simulations)]
+
+    def run_monte_carlo_capture(self, strategy_function, num_simulations=10000):
+        # Same games as run_monte_carlo, keeping every scorecard in a GameRecords
+        records = GameRecords(num_simulations)
+        for _ in range(num_simulations):
+            self.simulate_game(strategy_function, records)
+        return records
+
+    def simulate_game_traced(self, strategy_function, trace):
+        # simulate_game with every roll, reroll and category packed into a GameTrace
+        return self.simulate_game(strategy_function, observer=TraceObserver(trace))
+
+    def run_monte_carlo_trace(self, strategy_function, num_simulations=10000):
+        # Same games as run_monte_carlo, recorded for game_trace.replay
+        trace = GameTrace(num_simulations)
+        for _ in range(num_simulations):
+            self.simulate_game_traced(strategy_function, trace)
+        return trace
+
+    def run_sequential(self, strategy_function, tolerance, confidence=0.95, batch_size=1000,
+                       min_games=2000, max_games=SEQUENTIAL_MAX_GAMES, max_seconds=None):
+        """
+        Play batches of games until the confidence-interval half-width of the mean
+        drops below tolerance, or the game or wall-clock budget runs out.
+        max_games=None lifts the game budget, which then needs max_seconds.
+        Returns a summary dict including the number of games used and why it stopped.
+        """
+        if max_games is None and max_seconds is None:
+            raise ValueError("run_sequential needs a budget: max_games or max_seconds")
+        stats = RunningStats()
+        start = time.perf_counter()
+        stop_reason = None
+        while stop_reason is None:
+            size = batch_size if max_games is None else min(batch_size, max_games - stats.count)
+            stats.update(self.run_monte_carlo(strategy_function, size))
+            if stats.count >= min_games and stats.half_width(confidence) < tolerance:
+                stop_reason = 'tolerance'
+            elif max_games is not None and stats.count >= max_games:
+                stop_reason = 'max_games'
+            elif max_seconds is not None and time.perf_counter() - start >= max_seconds:
+                stop_reason = 'max_seconds'
+        return {
+            'mean_score': stats.mean,
+            'std_dev': stats.stdev,
+            'half_width': stats.half_width(confidence),
+            'confidence': confidence,
+            'games': stats.count,
+            'seconds': time.perf_counter() - start,
+            'stop_reason': stop_reason
+        }
+
+    def iter_monte_carlo(self, strategy_function, num_simulations=10000, chunk_size=10000):
+        # Yield scores in chunks so callers can stream them to disk
+        done = 0
+        while done < num_simulations:
+            size = min(chunk_size, num_simulations - done)
+            yield self.run_monte_carlo(strategy_function, size)
+            done += size
+
+def _run_chunk(task):
+    # Worker entry point: play one chunk of games on its own seeded stream
+    strategy_function, num_games, seed_sequence = task
+    hand_seed, fallback_seed = seed_sequence.generate_state(2, np.uint64)
+    # Strategies fall back to the module-level random.choice, so seed it per chunk as well
+    random.seed(int(fallback_seed))
+    simulator = YahtzeeSimulator()
+    simulator.hand = YahtzeeHand(seed=int(hand_seed))
+    return simulator.run_monte_carlo(strategy_function, num_games)
+
+def _run_chunk_in_process(task):
+    # _run_chunk in the caller's process, leaving the caller's random state as it was
+    state = random.getstate()
+    try:
+        return _run_chunk(task)
+    finally:
+        random.setstate(state)
+
+def iter_monte_carlo_parallel(strategy_function, num_simulations=10000, workers=None, seed=None):
+    """
+    Play num_simulations games split across a process pool, yielding each
+    chunk's scores in order. Games are cut into fixed-size chunks and every
+    chunk gets its own stream spawned from numpy.random.SeedSequence(seed),
+    so the scores are identical for a given seed whatever the number of workers.
+    """
+    root = np.random.SeedSequence(seed)
+    num_chunks = -(-num_simulations // PARALLEL_CHUNK_SIZE)
+    streams = root.spawn(num_chunks)
+    tasks = [
+        (strategy_function, min(PARALLEL_CHUNK_SIZE, num_simulations - i * PARALLEL_CHUNK_SIZE), streams[i])
+        for i in range(num_chunks)
+    ]
+    if workers == 1:
+        yield from map(_run_chunk_in_process, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_run_chunk, tasks)
+
+def run_monte_carlo_parallel(strategy_function, num_simulations=10000, workers=None, seed=None):
+    """Every score from iter_monte_carlo_parallel as one list."""
+    return [score for chunk in iter_monte_carlo_parallel(strategy_function, num_simulations, workers, seed)
+            for score in chunk]
+
 # Ensure results directory exists
+# Created by the writers on first use, so importing this module leaves the working directory alone
 RESULTS_DIR = 'results'
-if not os.path.exists(RESULTS_DIR):
-    os.makedirs(RESULTS_DIR)
+
+def summarize_histogram(histogram):
+    return {
+        'mean_score': round(histogram.mean, 1),
+        'median_score': round(float(histogram.median), 1),
+        'min_score': histogram.min,
+        'max_score': histogram.max,
+        'std_dev': round(histogram.stdev, 1)
+    }
+
+def summarize_scores(scores):
+    histogram = ScoreHistogram()
+    histogram.update(scores)
+    return summarize_histogram(histogram)
+
+ENGINES = ('scalar', 'batched', 'parallel')
+OUTPUT_FORMATS = ('binary', 'csv')
+
+def iter_scores(strategy_func, num_simulations, engine='scalar', seed=None, workers=None, simulator=None):
+    """
+    Score chunks for num_simulations games on the chosen engine:
+      scalar    YahtzeeSimulator in this process (reseeded when a seed is given)
+      batched   BatchSimulator with the strategy's vectorized port (strategies/batch_strategies.py)
+      parallel  YahtzeeSimulator across a process pool of workers
+    """
+    if engine == 'scalar':
+        if simulator is None:
+            simulator = YahtzeeSimulator()
+        if seed is not None:
+            simulator.hand = YahtzeeHand(seed)
+            random.seed(seed)
+        return simulator.iter_monte_carlo(strategy_func, num_simulations)
+    if engine == 'batched':
+        from batch_engine import iter_monte_carlo_batched
+        from strategies.batch_strategies import batch_policy_for
+        policy = batch_policy_for(strategy_func)
+        if policy is None:
+            raise ValueError(f"{getattr(strategy_func, '__name__', strategy_func)} has no batched port")
+        return iter_monte_carlo_batched(policy, num_simulations, seed)
+    if engine == 'parallel':
+        return iter_monte_carlo_parallel(strategy_func, num_simulations, workers, seed)
+    raise ValueError(f"Unknown engine: {engine}")
 
 # Function to save scores and print summary
-def process_strategy_results(strategy_name, strategy_func, simulator, num_simulations=10000):
+def process_strategy_results(strategy_name, strategy_func, simulator, num_simulations=10000, output_format='binary', seed=None,
+                             engine='scalar', workers=None, summary_only=False, cache=None):
     print(f"Running {strategy_name}...")
-    scores = simulator.run_monte_carlo(strategy_func, num_simulations)
-    
-    # Calculate summary stats
-    summary = {
-        'mean_score': round(statistics.mean(scores), 1),
-        'median_score': round(statistics.median(scores), 1),
-        'min_score': min(scores),
-        'max_score': max(scores),
-        'std_dev': round(statistics.stdev(scores), 1)
-    }
-    print(f"{strategy_name} Results:", summary)
-    
-    # Save raw scores to CSV
-    filename = os.path.join(RESULTS_DIR, f"{strategy_name}_scores.csv")
-    with open(filename, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['score']) # Header
-        for score in scores:
-            writer.writerow([score])
+    # Seeded runs are looked up in the result cache (result_cache.py) before simulating
+    key = cache.key(strategy_func, engine, seed, num_simulations) if cache is not None else None
+    cached = cache.get(key) if key is not None else None
+    if cached is not None:
+        print(f"Using cached scores ({key[:12]})")
+        chunks = [cached]
+    else:
+        chunks = iter_scores(strategy_func, num_simulations, engine, seed, workers, simulator)
+        if key is not None:
+            chunks = cache.record(key, chunks, strategy=strategy_name, seed=seed, engine_version=ENGINE_VERSION, engine=engine)
+    # Every chunk is folded into a fixed-size score histogram, so no run keeps its scores in memory
+    histogram = ScoreHistogram()
+
+    if summary_only:
+        for chunk in chunks:
+            histogram.update(chunk)
+        print(f"{strategy_name} Results:", summarize_histogram(histogram))
+        print("-" * 30)
+        return histogram
+
+    if output_format == 'binary':
+        # Stream score chunks into an int16 column file
+        filename = os.path.join(RESULTS_DIR, f"{strategy_name}_scores{SCORES_EXTENSION}")
+        with ScoreWriter(filename, strategy=strategy_name, seed=seed, engine_version=ENGINE_VERSION, engine=engine) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+                histogram.update(chunk)
+    elif output_format == 'csv':
+        # Save raw scores to CSV
+        filename = os.path.join(RESULTS_DIR, f"{strategy_name}_scores.csv")
+        ensure_parent_dir(filename)
+        with open(filename, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['score']) # Header
+            for chunk in chunks:
+                writer.writerows([int(score)] for score in chunk)
+                histogram.update(chunk)
+    else:
+        raise ValueError(f"Unknown output format: {output_format}")
+
+    print(f"{strategy_name} Results:", summarize_histogram(histogram))
     print(f"Saved raw scores to {filename}")
     print("-" * 30)
+    return histogram
+
+# Strategies by display name, imported on first use (see strategies/__init__.py)
+strategies = registry
+
+def default_strategy_names():
+    """Every strategy, less Optimal until its value table has been solved (which takes a minute), with a note."""
+    from optimal_solver import DEFAULT_TABLE_PATH
+    names = list(strategies)
+    if 'Optimal' in names and not os.path.exists(DEFAULT_TABLE_PATH):
+        print("Skipping Optimal until its value table is solved: run python optimal_solver.py, "
+              "or name it with --strategies")
+        names.remove('Optimal')
+    return names
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate Yahtzee strategies and save their scores.")
+    parser.add_argument('--strategies', nargs='+', default=None, metavar='NAME',
+                        help="strategies to run (default: all, less Optimal until its table is solved, and only those "
+                             "with a batched port for --engine batched); one of " + ", ".join(strategies))
+    parser.add_argument('--games', type=int, default=10000, help="games per strategy")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--engine', choices=ENGINES, default='scalar')
+    parser.add_argument('--workers', type=int, default=None, help="process pool size for the parallel engine")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='binary', dest='output_format')
+    parser.add_argument('--summary-only', action='store_true', help="print summaries without writing raw scores")
+    parser.add_argument('--no-cache', action='store_true', help="simulate even when a seeded run is in the result cache")
+    args = parser.parse_args(argv)
+
+    names = args.strategies or default_strategy_names()
+    unknown = [name for name in names if name not in strategies]
+    if unknown:
+        parser.error(f"unknown strategies: {', '.join(unknown)}")
+    if args.engine == 'batched':
+        from strategies.batch_strategies import batch_policy_for
+        unported = [name for name in names if batch_policy_for(strategies[name]) is None]
+        if unported and args.strategies:
+            parser.error(f"no batched port for: {', '.join(unported)}")
+        if unported:
+            # The default of all strategies runs the ported ones only
+            print(f"Skipping strategies with no batched port: {', '.join(unported)}")
+            names = [name for name in names if name not in unported]
+
+    simulator = YahtzeeSimulator()
+    # Only seeded runs can be cached, so unseeded ones never create results/cache/
+    cache = None if args.no_cache or args.seed is None else ResultCache()
+    for name in names:
+        process_strategy_results(name, strategies[name], simulator, args.games, args.output_format, args.seed,
+                                 args.engine, args.workers, args.summary_only, cache)
+
+    if args.summary_only:
+        print("Simulations complete.")
+    else:
+        print("Simulations complete. Raw scores saved in 'results/' directory.")
 
-# Define strategies and their names
-strategies = {
-    "Multiples": multiples_strategy,
-    "Multiples+": multiples_strategy_plus,
-    "Straights": straight_strategy, 
-    "Upper Focus": upper_focus_strategy,
-    "Yahtzee Focus": yahtzee_focus_strategy,
-    "Tunnel Vision": tunnel_vision_strategy
-}
-
-# Running the simluations
-simulator = YahtzeeSimulator()
-num_sims = 10000 # Set number of simulations
-
-# Run simulations for each strategy
-for name, func in strategies.items():
-    process_strategy_results(name, func, simulator, num_sims)
-
-print("Simulations complete. Raw scores saved in 'results/' directory.")
+if __name__ == "__main__":
+    main()